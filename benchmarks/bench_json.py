@@ -0,0 +1,101 @@
+# coding=utf-8
+"""
+Benchmark of the JSON codecs over realistic pages.
+
+Decodes and encodes a 1000 member page of ListMembers.all and a 1000 email
+page of ReportEmailActivity.all with each installed codec, and decodes them
+with requests' Response.json(), which the client used before the codecs.
+
+Run with: python benchmarks/bench_json.py
+"""
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mailchimp3.codec import CODECS, StdlibCodec
+from mailchimp3.transport import build_response
+
+PAGE_SIZE = 1000
+
+
+def member(i):
+    return {
+        'id': '{:032x}'.format(i),
+        'email_address': 'member{}@example.com'.format(i),
+        'unique_email_id': '{:010x}'.format(i),
+        'email_type': 'html',
+        'status': 'subscribed',
+        'merge_fields': {'FNAME': 'Jöhn', 'LNAME': 'Doe {}'.format(i), 'ADDRESS': '', 'PHONE': '555-0100',
+                         'BIRTHDAY': '01/01'},
+        'interests': dict(('{:010x}'.format(j), j % 2 == 0) for j in range(8)),
+        'stats': {'avg_open_rate': 0.42, 'avg_click_rate': 0.07},
+        'ip_signup': '', 'timestamp_signup': '', 'ip_opt': '198.51.100.{}'.format(i % 256),
+        'timestamp_opt': '2017-05-04T12:31:09+00:00', 'member_rating': 3,
+        'last_changed': '2018-03-05T10:41:03+00:00', 'language': 'en', 'vip': False,
+        'email_client': 'Gmail', 'location': {'latitude': 48.85, 'longitude': 2.35, 'gmtoff': 1, 'dstoff': 2,
+                                              'country_code': 'FR', 'timezone': 'Europe/Paris'},
+        'tags_count': 2, 'tags': [{'id': 1, 'name': 'customer'}, {'id': 2, 'name': 'newsletter'}],
+        'list_id': '57afe96172',
+        '_links': [{'rel': rel, 'href': 'https://us1.api.mailchimp.com/3.0/lists/57afe96172/members/{:032x}'.format(i),
+                    'method': 'GET', 'targetSchema': 'https://us1.api.mailchimp.com/schema/3.0/Lists/Members/Instance.json'}
+                   for rel in ('self', 'parent', 'update', 'upsert', 'delete', 'activity', 'goals', 'notes')],
+    }
+
+
+def email_activity(i):
+    return {
+        'campaign_id': '42694e9e57',
+        'list_id': '57afe96172',
+        'list_is_active': True,
+        'email_id': '{:032x}'.format(i),
+        'email_address': 'member{}@example.com'.format(i),
+        'activity': [{'action': action, 'timestamp': '2018-03-05T10:41:0{}+00:00'.format(n),
+                      'url': 'https://example.com/product/{}'.format(n), 'ip': '198.51.100.7'}
+                     for n, action in enumerate(('open', 'click', 'open', 'click'))],
+        '_links': [{'rel': 'parent', 'href': 'https://us1.api.mailchimp.com/3.0/reports/42694e9e57/email-activity',
+                    'method': 'GET'}],
+    }
+
+
+FIXTURES = {
+    'members': {'members': [member(i) for i in range(PAGE_SIZE)], 'list_id': '57afe96172',
+                'total_items': 100000, '_links': []},
+    'email-activity': {'emails': [email_activity(i) for i in range(PAGE_SIZE)], 'campaign_id': '42694e9e57',
+                       'total_items': 100000, '_links': []},
+}
+
+
+def available_codecs():
+    for codec in CODECS:
+        try:
+            yield codec()
+        except ImportError:
+            pass
+
+
+def best(function, number=20):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main():
+    print('{:<16} {:>10} {:<28} {:>12} {:>12}'.format('page', 'size (kB)', 'codec', 'decode ms', 'encode ms'))
+    for name, page in sorted(FIXTURES.items()):
+        content = StdlibCodec().dumps(page)
+        size = len(content) / 1024.0
+        response = build_response('GET', 'https://us1.api.mailchimp.com/3.0/', 200,
+                                  {'Content-Type': 'application/json; charset=utf-8'}, content)
+        print('{:<16} {:>10.0f} {:<28} {:>12.2f} {:>12}'.format(
+            name, size, 'requests Response.json()', best(response.json) * 1e3, '-'))
+        for codec in available_codecs():
+            decode = best(lambda: codec.loads(content))
+            encode = best(lambda: codec.dumps(page))
+            print('{:<16} {:>10.0f} {:<28} {:>12.2f} {:>12.2f}'.format(name, size, codec.name, decode * 1e3,
+                                                                      encode * 1e3))
+
+
+if __name__ == '__main__':
+    main()
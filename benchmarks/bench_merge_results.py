@@ -0,0 +1,64 @@
+# coding=utf-8
+"""
+Micro-benchmark of the assembly of get_all pages into a single result.
+
+Compares folding the pages together with merge_results, as _iterate used
+to do, with the single pass merge_pages for 1k, 10k and 100k pages of
+synthetic data. The time per page should stay flat as the number of pages
+grows for a linear algorithm.
+
+Run with: python benchmarks/bench_merge_results.py
+"""
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mailchimp3.helpers import merge_pages, merge_results
+
+PAGE_COUNTS = (1000, 10000, 100000)
+ITEMS_PER_PAGE = 10
+
+
+def make_pages(count):
+    """
+    Build `count` pages shaped like a list members collection
+    """
+    member = {'id': '0' * 32, 'email_address': 'john.doe@example.com', 'status': 'subscribed'}
+    return [
+        {
+            'members': [member] * ITEMS_PER_PAGE,
+            'list_id': '123456',
+            'total_items': count * ITEMS_PER_PAGE,
+            '_links': [{'rel': 'self'}],
+        }
+        for _ in range(count)
+    ]
+
+
+def fold_merge_results(pages):
+    result = pages[0]
+    for page in pages[1:]:
+        result = merge_results(result, page)
+    return result
+
+
+def bench(function, count, repeat=3):
+    timer = timeit.Timer(lambda: function(make_pages(count)))
+    setup = timeit.Timer(lambda: make_pages(count))
+    return min(timer.repeat(repeat, 1)) - min(setup.repeat(repeat, 1))
+
+
+def main():
+    print('{:>8} {:>22} {:>22}'.format('pages', 'merge_results us/page', 'merge_pages us/page'))
+    for count in PAGE_COUNTS:
+        fold = bench(fold_merge_results, count)
+        single = bench(merge_pages, count)
+        print('{:>8} {:>22.3f} {:>22.3f}'.format(count, fold / count * 1e6, single / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
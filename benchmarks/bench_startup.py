@@ -0,0 +1,75 @@
+# coding=utf-8
+"""
+Benchmark of the client startup cost.
+
+Measures, each in a fresh interpreter, the time to import mailchimp3 with
+the endpoint modules imported lazily against importing all of them as the
+package used to, and the time to create a MailChimp client with the lazy
+endpoint tree against creating it and then accessing every endpoint, which
+is the work the client used to do eagerly.
+
+Run with: python benchmarks/bench_startup.py
+"""
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+
+from mailchimp3 import ENDPOINT_MODULES, MailChimp
+from mailchimp3.baseapi import BaseApi
+
+IMPORT_LAZY = 'import mailchimp3'
+IMPORT_EAGER = 'import importlib, mailchimp3\nfor m in mailchimp3.ENDPOINT_MODULES.values(): importlib.import_module(m)'
+
+
+def time_import(statement, repeat=10):
+    """
+    Get the best time in seconds to run statement in a fresh interpreter,
+    after requests is already imported
+    """
+    script = (
+        'import time, requests\n'
+        't = time.time()\n'
+        '{}\n'
+        'print(time.time() - t)\n'
+    ).format(statement)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', script], env=env)
+        times.append(float(output))
+    return min(times)
+
+
+def touch_all(obj, seen=None):
+    """
+    Access every endpoint reachable from obj
+    """
+    seen = seen if seen is not None else set()
+    for name in dir(type(obj)):
+        value = getattr(obj, name, None)
+        if isinstance(value, BaseApi) and id(value) not in seen:
+            seen.add(id(value))
+            touch_all(value, seen)
+    return seen
+
+
+def main():
+    print('endpoint modules: {}'.format(len(ENDPOINT_MODULES)))
+    print('import, lazy endpoints:     {:8.2f} ms'.format(time_import(IMPORT_LAZY) * 1e3))
+    print('import, all endpoints:      {:8.2f} ms'.format(time_import(IMPORT_EAGER) * 1e3))
+    number = 200
+    lazy = min(timeit.repeat(lambda: MailChimp('user', 'key-us1'), number=number, repeat=5)) / number
+    eager = min(timeit.repeat(lambda: touch_all(MailChimp('user', 'key-us1')), number=number, repeat=5)) / number
+    print('MailChimp(), lazy tree:     {:8.1f} us'.format(lazy * 1e6))
+    print('MailChimp(), full tree:     {:8.1f} us ({} endpoints)'.format(
+        eager * 1e6, len(touch_all(MailChimp('user', 'key-us1')))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+# coding=utf-8
+"""
+Benchmark of the subscriber hashing of many email addresses.
+
+Compares calling get_subscriber_hash once per email, before and after its
+patterns were compiled once, with the bulk get_subscriber_hashes, on its
+own, with an LRU cache over a list holding every address four times, and
+with a pool of worker processes. Each one is timed as the best of a few
+runs.
+
+Run with: python benchmarks/bench_subscriber_hashes.py [count]
+"""
+from __future__ import print_function
+
+import hashlib
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from mailchimp3.helpers import LRUCache, get_subscriber_hash, get_subscriber_hashes
+
+DEFAULT_COUNT = 200000
+
+
+def make_emails(count):
+    return ['John.Doe+{}@Example.com'.format(i) for i in range(count)]
+
+
+def uncompiled_get_subscriber_hash(member_email):
+    """
+    get_subscriber_hash as it was, matching the uncompiled pattern per call
+    """
+    if not re.match(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)", member_email):
+        raise ValueError('String passed is not a valid email address')
+    return hashlib.md5(member_email.lower().encode()).hexdigest()
+
+
+def per_call_uncompiled(emails):
+    return [uncompiled_get_subscriber_hash(email) for email in emails]
+
+
+def per_call(emails):
+    return [get_subscriber_hash(email) for email in emails]
+
+
+def bulk(emails):
+    return list(get_subscriber_hashes(emails))
+
+
+def bulk_cached(emails):
+    return list(get_subscriber_hashes(emails, cache=LRUCache(len(emails))))
+
+
+def bulk_processes(emails):
+    return list(get_subscriber_hashes(emails, processes=multiprocessing.cpu_count()))
+
+
+# The number of runs of each function, the best of which is kept
+REPEAT = 5
+
+
+def bench(function, emails):
+    times = []
+    for _ in range(REPEAT):
+        start = time.time()
+        function(emails)
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    emails = make_emails(count)
+    repeated = emails[:count // 4] * 4
+    assert per_call(emails) == bulk(emails) == bulk_processes(emails)
+    print('{:>42} {:>12}'.format('{} emails'.format(count), 'us/email'))
+    for name, function, data in (
+            ('uncompiled get_subscriber_hash per call', per_call_uncompiled, emails),
+            ('get_subscriber_hash per call', per_call, emails),
+            ('get_subscriber_hashes', bulk, emails),
+            ('get_subscriber_hashes, 3/4 cached', bulk_cached, repeated),
+            ('get_subscriber_hashes, {} processes'.format(multiprocessing.cpu_count()),
+             bulk_processes, emails)):
+        print('{:>42} {:>12.3f}'.format(name, bench(function, data) / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+# coding=utf-8
+"""
+Benchmark suite of the client, run offline against the fake Mailchimp API.
+
+Measures:
+  - iterate: get_all throughput over collections of several sizes, with the
+    pages fetched one at a time and concurrently, behind a fixed latency
+  - merge: the assembly of get_all pages, with merge_results and merge_pages
+  - update_members: the cost of a 500 member Lists.update_members call,
+    with and without validation, against a fake API without latency, and
+    of the validation of its members alone
+  - wire_bytes: the bytes sent and received over the wire by a 500 member
+    Lists.update_members call and a 1000 member get_all, with and without
+    the compression of request bodies
+  - projection: the size and throughput of a 5000 member get_all with the
+    _links of the records, without them (the default) and with only two
+    attributes, against a fake API without latency
+  - pool: the memory held by the clients of 500 accounts in 3 datacenters,
+    built one by one or by a ClientPool of 100 clients, and the throughput
+    of a fan-out over the accounts through the pool, behind a fixed latency
+  - subscriber_hash: get_subscriber_hash and get_subscriber_hashes throughput
+  - startup: the import time of mailchimp3 and the MailChimp() construction
+
+The results are printed and, with --output, written as JSON so they can be
+compared across releases:
+
+    {"meta": {...}, "results": [{"name": ..., "params": {...}, "value": ..., "unit": ...}]}
+
+Run with: python benchmarks/run.py [--quick] [--only NAME ...] [--output FILE]
+"""
+from __future__ import print_function
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+
+from bench_merge_results import bench as bench_merge_function
+from bench_merge_results import fold_merge_results
+from bench_startup import IMPORT_LAZY, time_import
+from bench_subscriber_hashes import make_emails
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.helpers import get_subscriber_hash, get_subscriber_hashes, merge_pages
+from mailchimp3.metrics import MetricsCollector
+from mailchimp3.pool import ClientPool
+from mailchimp3.validation import validate_members
+
+# The latency of each request to the fake API in the pagination benchmark
+LATENCY = 0.005
+# The number of runs of the subscriber hash benchmarks, whose functions are
+# only a few tens of percent apart
+HASH_REPEAT = 10
+
+
+def best_of(function, repeat=3):
+    """
+    Get the best time in seconds of a few calls of function
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        function()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def bench_iterate(quick):
+    server = FakeMailChimpServer()
+    list_id = server.add_list()
+    client = MailChimp('user', 'key-us1', transport=FakeTransport(server, latency=LATENCY))
+    added = 0
+    for size in (1000, 10000) if quick else (1000, 10000, 50000):
+        server.add_members(list_id, size - added)
+        added = size
+        for max_workers in (1, 5):
+            elapsed = best_of(lambda: client.lists.members.all(list_id, get_all=True, max_workers=max_workers),
+                              repeat=1 if size > 10000 else 3)
+            yield 'iterate', {'members': size, 'max_workers': max_workers, 'latency': LATENCY}, \
+                size / elapsed, 'records/s'
+
+
+def bench_merge(quick):
+    for count in (1000, 10000) if quick else (1000, 10000, 100000):
+        for name, function in (('merge_results', fold_merge_results), ('merge_pages', merge_pages)):
+            elapsed = bench_merge_function(function, count, repeat=1 if count > 10000 else 3)
+            yield 'merge', {'pages': count, 'function': name}, elapsed / count * 1e6, 'us/page'
+
+
+def bench_update_members(quick):
+    server = FakeMailChimpServer()
+    list_id = server.add_list()
+    client = MailChimp('user', 'key-us1', transport=FakeTransport(server))
+    members = [{'email_address': 'member{}@example.com'.format(i), 'status': 'subscribed'} for i in range(500)]
+    number = 20 if quick else 100
+    for validate in (True, False):
+        data = {'members': members, 'update_existing': True}
+        elapsed = min(timeit.repeat(lambda: client.lists.update_members(list_id, data, validate=validate),
+                                    number=number, repeat=3)) / number
+        yield 'update_members', {'members': len(members), 'validate': validate}, elapsed * 1e3, 'ms/call'
+    number *= 10
+    elapsed = min(timeit.repeat(lambda: validate_members(members), number=number, repeat=3)) / number
+    yield 'update_members', {'members': len(members), 'step': 'validate_members'}, elapsed * 1e3, 'ms/call'
+
+
+def bench_wire_bytes(quick):
+    server = FakeMailChimpServer()
+    list_id = server.add_list()
+    server.add_members(list_id, 1000)
+    members = [{'email_address': 'member{}@example.com'.format(i), 'status': 'subscribed',
+                'merge_fields': {'FNAME': 'John', 'LNAME': 'Doe {}'.format(i)}} for i in range(500)]
+    for compress_threshold in (None, 1024):
+        client = MailChimp('user', 'key-us1', transport=FakeTransport(server), compress_threshold=compress_threshold)
+        metrics = MetricsCollector()
+        metrics.attach(client)
+        client.lists.update_members(list_id, {'members': members, 'update_existing': True})
+        client.lists.members.all(list_id, get_all=True)
+        for stats in metrics.snapshot()['endpoints']:
+            params = {'path': stats['path'], 'method': stats['method'], 'compress_threshold': compress_threshold}
+            for direction in ('request', 'response'):
+                if stats[direction + '_bytes']:
+                    yield 'wire_bytes', dict(params, body=direction), stats[direction + '_wire_bytes'], 'bytes'
+                    yield 'wire_bytes', dict(params, body=direction, uncompressed=True), \
+                        stats[direction + '_bytes'], 'bytes'
+
+
+def bench_projection(quick):
+    server = FakeMailChimpServer()
+    list_id = server.add_list()
+    server.add_members(list_id, 5000)
+    client = MailChimp('user', 'key-us1', transport=FakeTransport(server))
+    metrics = MetricsCollector()
+    metrics.attach(client)
+    for name, params in (('links', {'links': True}), ('default', {}),
+                         ('attributes', {'attributes': ['email_address', 'status']})):
+        metrics.reset()
+        elapsed = best_of(lambda: client.lists.members.all(list_id, get_all=True, **params), repeat=1 if quick else 3)
+        stats = metrics.snapshot()['endpoints'][0]
+        yield 'projection', {'members': 5000, 'projection': name}, \
+            stats['response_bytes'] / float(stats['attempts']), 'bytes/page'
+        yield 'projection', {'members': 5000, 'projection': name}, 5000 / elapsed, 'records/s'
+
+
+def allocated(function):
+    """
+    Get the number of bytes allocated by function and still held after it
+    """
+    import tracemalloc  # Python 3.4+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = function()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def bench_pool(quick):
+    accounts = [('user', 'key{}-us{}'.format(i, i % 3)) for i in range(500)]
+
+    def standalone():
+        clients = [MailChimp(mc_user, mc_secret) for mc_user, mc_secret in accounts]
+        for client in clients:
+            client.lists.members
+        return clients
+
+    def pooled():
+        pool = ClientPool(maxsize=100)
+        for account in accounts:
+            pool.client(*account).lists.members
+        return pool
+
+    for name, function in (('standalone', standalone), ('pool', pooled)):
+        yield 'pool', {'accounts': len(accounts), 'clients': name}, allocated(function) / 1024.0, 'KiB'
+    server = FakeMailChimpServer()
+    server.add_list()
+    pool = ClientPool(maxsize=100, transport=FakeTransport(server, latency=LATENCY))
+    for max_workers in (1, 10):
+        elapsed = best_of(lambda: list(pool.map(lambda client: client.lists.all(get_all=True), accounts,
+                                                max_workers=max_workers)), repeat=1 if quick else 3)
+        yield 'pool', {'accounts': len(accounts), 'max_workers': max_workers, 'latency': LATENCY}, \
+            len(accounts) / elapsed, 'accounts/s'
+
+
+def bench_subscriber_hash(quick):
+    emails = make_emails(20000 if quick else 200000)
+    for name, function in (
+            ('get_subscriber_hash', lambda: [get_subscriber_hash(email) for email in emails]),
+            ('get_subscriber_hashes', lambda: list(get_subscriber_hashes(emails)))):
+        yield 'subscriber_hash', {'emails': len(emails), 'function': name}, \
+            len(emails) / best_of(function, repeat=HASH_REPEAT), 'emails/s'
+
+
+def bench_startup(quick):
+    yield 'startup', {'step': 'import'}, time_import(IMPORT_LAZY, repeat=3 if quick else 10) * 1e3, 'ms'
+    number = 200
+    elapsed = min(timeit.repeat(lambda: MailChimp('user', 'key-us1'), number=number, repeat=5)) / number
+    yield 'startup', {'step': 'MailChimp()'}, elapsed * 1e6, 'us'
+
+
+BENCHMARKS = {
+    'iterate': bench_iterate,
+    'merge': bench_merge,
+    'update_members': bench_update_members,
+    'wire_bytes': bench_wire_bytes,
+    'projection': bench_projection,
+    'pool': bench_pool,
+    'subscriber_hash': bench_subscriber_hash,
+    'startup': bench_startup,
+}
+
+
+def metadata():
+    """
+    Describe the environment of the run
+    """
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=ROOT,
+                                         stderr=subprocess.STDOUT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'date': datetime.datetime.utcnow().replace(microsecond=0).isoformat() + 'Z',
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--quick', action='store_true', help='use smaller inputs')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='the benchmarks to run')
+    parser.add_argument('--output', help='the file to write the JSON results to')
+    args = parser.parse_args()
+    results = []
+    for name in args.only or sorted(BENCHMARKS):
+        for benchmark, params, value, unit in BENCHMARKS[name](args.quick):
+            print('{:<16} {:<60} {:>14.3f} {}'.format(benchmark, json.dumps(params, sort_keys=True), value, unit))
+            results.append({'name': benchmark, 'params': params, 'value': value, 'unit': unit})
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'meta': metadata(), 'results': results}, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,171 +4,152 @@ Mailchimp v3 Api SDK
 
 Documentation at http://developer.mailchimp.com/documentation/mailchimp/reference/overview/
 """
+import importlib
+import sys
+
 # API Client
 from mailchimp3.mailchimpclient import MailChimpClient
-# API Root
-from mailchimp3.entities.root import Root
-# Authorized Apps
-from mailchimp3.entities.authorizedapps import AuthorizedApps
-# Automations
-from mailchimp3.entities.automations import Automations
-from mailchimp3.entities.automationactions import AutomationActions
-from mailchimp3.entities.automationemails import AutomationEmails
-from mailchimp3.entities.automationemailactions import AutomationEmailActions
-from mailchimp3.entities.automationemailqueues import AutomationEmailQueues
-from mailchimp3.entities.automationremovedsubscribers import AutomationRemovedSubscribers
-# Batche Operations
-from mailchimp3.entities.batches import Batches
-# Campaign Folders
-from mailchimp3.entities.campaignfolders import CampaignFolders
-# Campaigns
-from mailchimp3.entities.campaigns import Campaigns
-from mailchimp3.entities.campaignactions import CampaignActions
-from mailchimp3.entities.campaigncontent import CampaignContent
-from mailchimp3.entities.campaignfeedback import CampaignFeedback
-from mailchimp3.entities.campaignsendchecklist import CampaignSendChecklist
-# Conversations
-from mailchimp3.entities.conversations import Conversations
-from mailchimp3.entities.conversationmessages import ConversationMessages
-# E-commerce Stores
-from mailchimp3.entities.stores import Stores
-from mailchimp3.entities.storecarts import StoreCarts
-from mailchimp3.entities.storecartlines import StoreCartLines
-from mailchimp3.entities.storecustomers import StoreCustomers
-from mailchimp3.entities.storeorders import StoreOrders
-from mailchimp3.entities.storeorderlines import StoreOrderLines
-from mailchimp3.entities.storeproducts import StoreProducts
-from mailchimp3.entities.storeproductvariants import StoreProductVariants
-# File Manager Files
-from mailchimp3.entities.filemanagerfiles import FileManagerFiles
-# File Manager Folders
-from mailchimp3.entities.filemanagerfolders import FileManagerFolders
-# Lists
-from mailchimp3.entities.lists import Lists
-from mailchimp3.entities.listabusereports import ListAbuseReports
-from mailchimp3.entities.listactivity import ListActivity
-from mailchimp3.entities.listclients import ListClients
-from mailchimp3.entities.listgrowthhistory import ListGrowthHistory
-from mailchimp3.entities.listinterestcategories import ListInterestCategories
-from mailchimp3.entities.listinterestcategoryinterest import ListInterestCategoryInterest
-from mailchimp3.entities.listmembers import ListMembers
-from mailchimp3.entities.listmemberactivity import ListMemberActivity
-from mailchimp3.entities.listmembergoals import ListMemberGoals
-from mailchimp3.entities.listmembernotes import ListMemberNotes
-from mailchimp3.entities.listmergefields import ListMergeFields
-from mailchimp3.entities.listsegments import ListSegments
-from mailchimp3.entities.listsegmentmembers import ListSegmentMembers
-from mailchimp3.entities.listsignupforms import ListSignupForms
-from mailchimp3.entities.listtwitterleadgenerationcards import ListTwitterLeadGenerationCards
-from mailchimp3.entities.listwebhooks import ListWebhooks
-# Reports
-from mailchimp3.entities.reports import Reports
-from mailchimp3.entities.reportcampaignabusereports import ReportCampaignAbuseReports
-from mailchimp3.entities.reportcampaignadvice import ReportCampaignAdvice
-from mailchimp3.entities.reportclickdetailreports import ReportClickDetailReports
-from mailchimp3.entities.reportclickdetailmembers import ReportClickDetailMembers
-from mailchimp3.entities.reportdomainperformance import ReportDomainPerformance
-from mailchimp3.entities.reporteepurl import ReportEepURL
-from mailchimp3.entities.reportemailactivity import ReportEmailActivity
-from mailchimp3.entities.reportlocations import ReportLocations
-from mailchimp3.entities.reportsentto import ReportSentTo
-from mailchimp3.entities.reportsubreports import ReportSubReports
-from mailchimp3.entities.reportunsubscribes import ReportUnsubscribes
-# Search Campaigns
-from mailchimp3.entities.searchcampaigns import SearchCampaigns
-# Search Members
-from mailchimp3.entities.searchmembers import SearchMembers
-# Template Folders
-from mailchimp3.entities.templatefolders import TemplateFolders
-# Templates
-from mailchimp3.entities.templates import Templates
-from mailchimp3.entities.templatedefaultcontent import TemplateDefaultContent
+from mailchimp3.baseapi import LazyEndpoint
+
+# The endpoint classes are only imported when first used
+ENDPOINT_MODULES = {
+    # API Root
+    'Root': 'mailchimp3.entities.root',
+    # Authorized Apps
+    'AuthorizedApps': 'mailchimp3.entities.authorizedapps',
+    # Automations
+    'Automations': 'mailchimp3.entities.automations',
+    'AutomationActions': 'mailchimp3.entities.automationactions',
+    'AutomationEmails': 'mailchimp3.entities.automationemails',
+    'AutomationEmailActions': 'mailchimp3.entities.automationemailactions',
+    'AutomationEmailQueues': 'mailchimp3.entities.automationemailqueues',
+    'AutomationRemovedSubscribers': 'mailchimp3.entities.automationremovedsubscribers',
+    # Batche Operations
+    'Batches': 'mailchimp3.entities.batches',
+    # Campaign Folders
+    'CampaignFolders': 'mailchimp3.entities.campaignfolders',
+    # Campaigns
+    'Campaigns': 'mailchimp3.entities.campaigns',
+    'CampaignActions': 'mailchimp3.entities.campaignactions',
+    'CampaignContent': 'mailchimp3.entities.campaigncontent',
+    'CampaignFeedback': 'mailchimp3.entities.campaignfeedback',
+    'CampaignSendChecklist': 'mailchimp3.entities.campaignsendchecklist',
+    # Conversations
+    'Conversations': 'mailchimp3.entities.conversations',
+    'ConversationMessages': 'mailchimp3.entities.conversationmessages',
+    # E-commerce Stores
+    'Stores': 'mailchimp3.entities.stores',
+    'StoreCarts': 'mailchimp3.entities.storecarts',
+    'StoreCartLines': 'mailchimp3.entities.storecartlines',
+    'StoreCustomers': 'mailchimp3.entities.storecustomers',
+    'StoreOrders': 'mailchimp3.entities.storeorders',
+    'StoreOrderLines': 'mailchimp3.entities.storeorderlines',
+    'StoreProducts': 'mailchimp3.entities.storeproducts',
+    'StoreProductVariants': 'mailchimp3.entities.storeproductvariants',
+    # File Manager Files
+    'FileManagerFiles': 'mailchimp3.entities.filemanagerfiles',
+    # File Manager Folders
+    'FileManagerFolders': 'mailchimp3.entities.filemanagerfolders',
+    # Lists
+    'Lists': 'mailchimp3.entities.lists',
+    'ListAbuseReports': 'mailchimp3.entities.listabusereports',
+    'ListActivity': 'mailchimp3.entities.listactivity',
+    'ListClients': 'mailchimp3.entities.listclients',
+    'ListGrowthHistory': 'mailchimp3.entities.listgrowthhistory',
+    'ListInterestCategories': 'mailchimp3.entities.listinterestcategories',
+    'ListInterestCategoryInterest': 'mailchimp3.entities.listinterestcategoryinterest',
+    'ListMembers': 'mailchimp3.entities.listmembers',
+    'ListMemberActivity': 'mailchimp3.entities.listmemberactivity',
+    'ListMemberGoals': 'mailchimp3.entities.listmembergoals',
+    'ListMemberNotes': 'mailchimp3.entities.listmembernotes',
+    'ListMergeFields': 'mailchimp3.entities.listmergefields',
+    'ListSegments': 'mailchimp3.entities.listsegments',
+    'ListSegmentMembers': 'mailchimp3.entities.listsegmentmembers',
+    'ListSignupForms': 'mailchimp3.entities.listsignupforms',
+    'ListTwitterLeadGenerationCards': 'mailchimp3.entities.listtwitterleadgenerationcards',
+    'ListWebhooks': 'mailchimp3.entities.listwebhooks',
+    # Reports
+    'Reports': 'mailchimp3.entities.reports',
+    'ReportCampaignAbuseReports': 'mailchimp3.entities.reportcampaignabusereports',
+    'ReportCampaignAdvice': 'mailchimp3.entities.reportcampaignadvice',
+    'ReportClickDetailReports': 'mailchimp3.entities.reportclickdetailreports',
+    'ReportClickDetailMembers': 'mailchimp3.entities.reportclickdetailmembers',
+    'ReportDomainPerformance': 'mailchimp3.entities.reportdomainperformance',
+    'ReportEepURL': 'mailchimp3.entities.reporteepurl',
+    'ReportEmailActivity': 'mailchimp3.entities.reportemailactivity',
+    'ReportLocations': 'mailchimp3.entities.reportlocations',
+    'ReportSentTo': 'mailchimp3.entities.reportsentto',
+    'ReportSubReports': 'mailchimp3.entities.reportsubreports',
+    'ReportUnsubscribes': 'mailchimp3.entities.reportunsubscribes',
+    # Search Campaigns
+    'SearchCampaigns': 'mailchimp3.entities.searchcampaigns',
+    # Search Members
+    'SearchMembers': 'mailchimp3.entities.searchmembers',
+    # Template Folders
+    'TemplateFolders': 'mailchimp3.entities.templatefolders',
+    # Templates
+    'Templates': 'mailchimp3.entities.templates',
+    'TemplateDefaultContent': 'mailchimp3.entities.templatedefaultcontent',
+}
 
 
 class MailChimp(MailChimpClient):
     """
     MailChimp class to communicate with the v3 API
+
+    The endpoints are created the first time they are accessed.
     """
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the class with your user_id and secret_key and attach all
-        of the endpoints
-        """
-        super(MailChimp, self).__init__(*args, **kwargs)
-        # API Root
-        self.root = self.api_root = Root(self)
-        # Authorized Apps
-        self.authorized_apps = AuthorizedApps(self)
-        # Automations - Paid feature
-        self.automations = Automations(self)
-        self.automations.actions = AutomationActions(self)
-        self.automations.emails = AutomationEmails(self)
-        self.automations.emails.actions = AutomationEmailActions(self)
-        self.automations.emails.queues = AutomationEmailQueues(self)
-        self.automations.removed_subscribers = AutomationRemovedSubscribers(self)
-        # Batch operations
-        self.batches = self.batch_operations = Batches(self)
-        # Campaign Folders
-        self.campaign_folders = CampaignFolders(self)
-        # Campaigns
-        self.campaigns = Campaigns(self)
-        self.campaigns.actions = CampaignActions(self)
-        self.campaigns.content = CampaignContent(self)
-        self.campaigns.feedback = CampaignFeedback(self)
-        self.campaigns.send_checklist = CampaignSendChecklist(self)
-        # Conversations - Paid feature
-        self.conversations = Conversations(self)
-        self.conversations.messages = ConversationMessages(self)
-        # E-commerce Stores
-        self.stores = self.ecommerce = Stores(self)
-        self.stores.carts = StoreCarts(self)
-        self.stores.carts.lines = StoreCartLines(self)
-        self.stores.customers = StoreCustomers(self)
-        self.stores.orders = StoreOrders(self)
-        self.stores.orders.lines = StoreOrderLines(self)
-        self.stores.products = StoreProducts(self)
-        self.stores.products.variants = StoreProductVariants(self)
-        # File Manager Files
-        self.files = FileManagerFiles(self)
-        # File Manager Folders
-        self.folders = FileManagerFolders(self)
-        # Lists
-        self.lists = Lists(self)
-        self.lists.abuse_reports = ListAbuseReports(self)
-        self.lists.activity = ListActivity(self)
-        self.lists.clients = ListClients(self)
-        self.lists.growth_history = ListGrowthHistory(self)
-        self.lists.interest_categories = ListInterestCategories(self)
-        self.lists.interest_categories.interests = ListInterestCategoryInterest(self)
-        self.lists.members = ListMembers(self)
-        self.lists.members.activity = ListMemberActivity(self)
-        self.lists.members.goals = ListMemberGoals(self)
-        self.lists.members.notes = ListMemberNotes(self)
-        self.lists.merge_fields = ListMergeFields(self)
-        self.lists.segments = ListSegments(self)
-        self.lists.segments.members = ListSegmentMembers(self)
-        self.lists.signup_forms = ListSignupForms(self)
-        self.lists.twitter_cards = ListTwitterLeadGenerationCards(self)
-        self.lists.webhooks = ListWebhooks(self)
-        # Reports
-        self.reports = Reports(self)
-        self.reports.abuse_reports = ReportCampaignAbuseReports(self)
-        self.reports.advice = ReportCampaignAdvice(self)
-        self.reports.click_details = ReportClickDetailReports(self)
-        self.reports.click_details.members = ReportClickDetailMembers(self)
-        self.reports.domain_performance = ReportDomainPerformance(self)
-        self.reports.eepurl = ReportEepURL(self)
-        self.reports.email_activity = ReportEmailActivity(self)
-        self.reports.locations = ReportLocations(self)
-        self.reports.sent_to = ReportSentTo(self)
-        self.reports.subreports = ReportSubReports(self)
-        self.reports.unsubscribes = ReportUnsubscribes(self)
-        # Search Campaigns
-        self.search_campaigns = SearchCampaigns(self)
-        # Search Members
-        self.search_members = SearchMembers(self)
-        # Template Folders
-        self.template_folders = TemplateFolders(self)
-        # Templates
-        self.templates = Templates(self)
-        self.templates.default_content = TemplateDefaultContent(self)
+    # API Root
+    root = api_root = LazyEndpoint('mailchimp3.entities.root', 'Root')
+    # Authorized Apps
+    authorized_apps = LazyEndpoint('mailchimp3.entities.authorizedapps', 'AuthorizedApps')
+    # Automations - Paid feature
+    automations = LazyEndpoint('mailchimp3.entities.automations', 'Automations')
+    # Batch operations
+    batches = batch_operations = LazyEndpoint('mailchimp3.entities.batches', 'Batches')
+    # Campaign Folders
+    campaign_folders = LazyEndpoint('mailchimp3.entities.campaignfolders', 'CampaignFolders')
+    # Campaigns
+    campaigns = LazyEndpoint('mailchimp3.entities.campaigns', 'Campaigns')
+    # Conversations - Paid feature
+    conversations = LazyEndpoint('mailchimp3.entities.conversations', 'Conversations')
+    # E-commerce Stores
+    stores = ecommerce = LazyEndpoint('mailchimp3.entities.stores', 'Stores')
+    # File Manager Files
+    files = LazyEndpoint('mailchimp3.entities.filemanagerfiles', 'FileManagerFiles')
+    # File Manager Folders
+    folders = LazyEndpoint('mailchimp3.entities.filemanagerfolders', 'FileManagerFolders')
+    # Lists
+    lists = LazyEndpoint('mailchimp3.entities.lists', 'Lists')
+    # Reports
+    reports = LazyEndpoint('mailchimp3.entities.reports', 'Reports')
+    # Search Campaigns
+    search_campaigns = LazyEndpoint('mailchimp3.entities.searchcampaigns', 'SearchCampaigns')
+    # Search Members
+    search_members = LazyEndpoint('mailchimp3.entities.searchmembers', 'SearchMembers')
+    # Template Folders
+    template_folders = LazyEndpoint('mailchimp3.entities.templatefolders', 'TemplateFolders')
+    # Templates
+    templates = LazyEndpoint('mailchimp3.entities.templates', 'Templates')
+
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name == 'AsyncMailChimp':
+            module = 'mailchimp3.asyncclient'
+        elif name in ENDPOINT_MODULES:
+            module = ENDPOINT_MODULES[name]
+        else:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+        return getattr(importlib.import_module(module), name)
+
+
+    def __dir__():
+        return sorted(set(globals()) | set(ENDPOINT_MODULES) | {'AsyncMailChimp'})
+else:
+    # Module level __getattr__ is not supported, import everything now
+    for _name, _module in ENDPOINT_MODULES.items():
+        globals()[_name] = getattr(importlib.import_module(_module), _name)
+    # Asyncio client
+    if sys.version_info >= (3, 6):
+        from mailchimp3.asyncclient import AsyncMailChimp
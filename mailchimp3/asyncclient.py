@@ -0,0 +1,443 @@
+# coding=utf-8
+"""
+Asyncio client for the Mailchimp v3 API, requires Python 3.6+
+
+The endpoints are the same as the ones of :py:class:`mailchimp3.MailChimp`
+but their methods return awaitables, and iter_all() returns an asynchronous
+iterator:
+
+    async with AsyncMailChimp('YOUR_USERNAME', 'YOUR_SECRET_KEY') as client:
+        member = await client.lists.members.get('123456', 'john.doe@example.com')
+        async for member in client.lists.members.iter_all('123456'):
+            ...
+
+Each call runs the regular endpoint method against a client that records
+the request instead of sending it, so the argument validation is shared
+with the blocking client, and the recorded request is then sent through
+an asynchronous transport.
+"""
+from __future__ import unicode_literals
+
+import asyncio
+import base64
+import functools
+import threading
+import types
+from collections import deque
+
+from urllib.parse import urlencode, urljoin
+
+from mailchimp3 import MailChimp
+from mailchimp3.baseapi import BaseApi
+from mailchimp3.checkpoint import checkpoint_key
+from mailchimp3.codec import default_codec
+from mailchimp3.helpers import merge_pages
+from mailchimp3.mailchimpclient import MAX_CONCURRENT_CONNECTIONS
+from mailchimp3.ratelimit import parse_retry_after
+from mailchimp3.retry import RetryPolicy
+from mailchimp3.transport import ACCEPT_ENCODING, build_response, encode_body
+
+# How many times a request answered with a 429 is sent again
+MAX_THROTTLE_RETRIES = 3
+# The delay in seconds after a 429 without a Retry-After header
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class AiohttpTransport(object):
+    """
+    Asynchronous transport sending the requests with aiohttp.
+
+    Any object with the same `request` and `close` coroutines and an
+    `EXCEPTIONS` tuple of the transient errors it raises can be passed as
+    the transport of :py:class:`AsyncMailChimp` instead.
+    """
+    def __init__(self, session=None, limit=MAX_CONCURRENT_CONNECTIONS):
+        """
+        Initialize the transport
+
+        :param session: An existing session to send the requests with, the
+          transport will not close a session it did not create
+        :type session: :py:class:`aiohttp.ClientSession`
+        :param limit: The maximum number of pooled connections
+        :type limit: :py:class:`int`
+        """
+        super(AiohttpTransport, self).__init__()
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError('AiohttpTransport requires aiohttp, install it or pass another transport')
+        self._aiohttp = aiohttp
+        self.EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        self._owns_session = session is None
+        self._session = session
+        self._limit = limit
+
+
+    async def request(self, method, url, headers=None, data=None, timeout=None):
+        """
+        Send a request
+
+        :param method: The HTTP method
+        :type method: :py:class:`str`
+        :param url: The full url of the request
+        :type url: :py:class:`str`
+        :param headers: The headers of the request
+        :type headers: :py:class:`dict`
+        :param data: The body of the request
+        :type data: :py:class:`bytes`
+        :param timeout: The total timeout of the request in seconds
+        :type timeout: :py:class:`float`
+        :rtype: :py:class:`requests.Response`
+        """
+        if self._session is None:
+            # The session has to be created inside the running event loop
+            connector = self._aiohttp.TCPConnector(limit=self._limit)
+            self._session = self._aiohttp.ClientSession(connector=connector)
+        timeout = self._aiohttp.ClientTimeout(total=timeout)
+        async with self._session.request(method, url, headers=headers, data=data, timeout=timeout) as r:
+            content = await r.read()
+            return build_response(method, url, r.status, r.headers, content, r.reason)
+
+
+    async def close(self):
+        """
+        Close the session if it was created by the transport
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _RequestPlanner(MailChimp):
+    """
+    A client that records the requests of the endpoint methods instead of
+    sending them, behaving as a disabled client for the methods themselves.
+    """
+    def __init__(self, *args, **kwargs):
+        super(_RequestPlanner, self).__init__(*args, **kwargs)
+        self._local = threading.local()
+
+
+    def plan(self, endpoint):
+        """
+        Make an endpoint of the planner record its get_all reads, however
+        get_all is passed to its methods
+
+        :param endpoint: An endpoint of the planner
+        :type endpoint: :py:class:`mailchimp3.baseapi.BaseApi`
+        """
+        if '_iterate' not in endpoint.__dict__:
+            endpoint._iterate = functools.partial(self._iterate, endpoint)
+
+
+    def record(self, fn, *args, **kwargs):
+        """
+        Call fn and get the requests it made, and the arguments of the
+        get_all read it made if any
+
+        :returns: A list of (method, path, queryparams, data) tuples, and a
+          dict with the max_workers, stream and checkpoint arguments of the
+          read or None
+        :rtype: :py:class:`tuple`
+        """
+        self._local.calls = calls = []
+        self._local.iteration = None
+        try:
+            result = fn(*args, **kwargs)
+            if isinstance(result, types.GeneratorType):
+                # iter_all and stream=True only make their requests once consumed
+                for _ in result:
+                    pass
+            iteration = self._local.iteration
+        finally:
+            self._local.calls = None
+            self._local.iteration = None
+        return calls, iteration
+
+
+    def _iterate(self, endpoint, url, max_workers=1, stream=False, checkpoint=None, **kwargs):
+        """
+        Record the arguments of a get_all read, see
+        :py:meth:`mailchimp3.baseapi.BaseApi._iterate`, which records the
+        request of its first page, from the offset saved to the checkpoint
+        if any
+        """
+        self._local.iteration = {'max_workers': max_workers, 'stream': stream, 'checkpoint': checkpoint}
+        return BaseApi._iterate(endpoint, url, max_workers=max_workers, stream=stream, checkpoint=checkpoint,
+                                **kwargs)
+
+
+    def _record(self, method, url, queryparams=None, data=None):
+        """
+        Record a request of the endpoint method being called in this thread
+        """
+        calls = getattr(self._local, 'calls', None)
+        if calls is None:
+            # e.g. a method sending requests from worker threads, which should
+            # be marked with sync_only
+            raise TypeError('A request to {} was sent outside of an AsyncMailChimp call'.format(url))
+        calls.append((method, url, queryparams or {}, data))
+
+
+    def _post(self, url, data=None):
+        self._record('POST', url, data=data)
+
+
+    def _get(self, url, **queryparams):
+        self._record('GET', url, queryparams)
+
+
+    def _delete(self, url):
+        self._record('DELETE', url)
+
+
+    def _patch(self, url, data=None):
+        self._record('PATCH', url, data=data)
+
+
+    def _put(self, url, data=None):
+        self._record('PUT', url, data=data)
+
+
+class AsyncEndpoint(object):
+    """
+    Asynchronous view of an endpoint whose methods return awaitables
+
+    The methods sending several requests, such as Batches.wait, are marked
+    with :py:func:`mailchimp3.baseapi.sync_only` and refused.
+    """
+    def __init__(self, client, endpoint):
+        """
+        :param client: The asynchronous client
+        :type client: :py:class:`AsyncMailChimp`
+        :param endpoint: The endpoint of the request planner
+        :type endpoint: :py:class:`mailchimp3.baseapi.BaseApi`
+        """
+        super(AsyncEndpoint, self).__init__()
+        self._client = client
+        self._endpoint = endpoint
+        client._planner.plan(endpoint)
+
+
+    def __getattr__(self, name):
+        value = getattr(self._endpoint, name)
+        if isinstance(value, BaseApi):
+            value = AsyncEndpoint(self._client, value)
+            setattr(self, name, value)
+        elif callable(value) and not name.startswith('_'):
+            if getattr(value, 'sync_only', False):
+                raise TypeError('{}.{} sends several requests and is only available on MailChimp'.format(
+                    type(self._endpoint).__name__, name))
+            value = functools.partial(self._client._call, value, name)
+        return value
+
+
+class AsyncMailChimp(object):
+    """
+    AsyncMailChimp class to communicate with the v3 API from asyncio code
+    """
+    def __init__(self, mc_user, mc_secret, enabled=True, transport=None,
+                 max_concurrent=MAX_CONCURRENT_CONNECTIONS, retry=None, timeout=None, codec=None,
+                 compress_threshold=None):
+        """
+        Initialize the class with your user_id and secret_key.
+
+        :param mc_user: Mailchimp user id
+        :type mc_user: :py:class:`str`
+        :param mc_secret: Mailchimp secret key
+        :type mc_secret: :py:class:`str`
+        :param enabled: Whether the API should execute any requests
+        :type enabled: :py:class:`bool`
+        :param transport: The asynchronous transport, an
+          :py:class:`AiohttpTransport` by default
+        :param max_concurrent: The maximum number of requests in flight,
+          further requests wait for one of them to complete
+        :type max_concurrent: :py:class:`int`
+        :param retry: The policy to retry requests that failed with a
+          transient error
+        :type retry: :py:class:`mailchimp3.retry.RetryPolicy`
+        :param timeout: The total timeout of the requests in seconds
+        :type timeout: :py:class:`float`
+        :param codec: The JSON codec of the request and response bodies, by
+          default the fastest one installed
+        :type codec: :py:class:`mailchimp3.codec.StdlibCodec`
+        :param compress_threshold: The size in bytes from which request
+          bodies are compressed with gzip, never by default
+        :type compress_threshold: :py:class:`int`
+        """
+        super(AsyncMailChimp, self).__init__()
+        self.enabled = enabled
+        self._planner = _RequestPlanner(mc_user, mc_secret, enabled=enabled)
+        self.base_url = self._planner.base_url
+        credentials = '{}:{}'.format(mc_user, mc_secret).encode('latin1')
+        self._headers = {
+            'Authorization': 'Basic ' + base64.b64encode(credentials).decode('ascii'),
+            'Accept-Encoding': ACCEPT_ENCODING,
+        }
+        if transport is None:
+            transport = AiohttpTransport(limit=max_concurrent)
+        self.transport = transport
+        self.max_concurrent = max_concurrent
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.timeout = timeout
+        self.codec = codec if codec is not None else default_codec()
+        self.compress_threshold = compress_threshold
+        self._semaphore = None
+
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        value = getattr(self._planner, name)
+        if not isinstance(value, BaseApi):
+            raise AttributeError(name)
+        value = AsyncEndpoint(self, value)
+        setattr(self, name, value)
+        return value
+
+
+    async def close(self):
+        """
+        Close the transport and release its connections
+        """
+        await self.transport.close()
+        self._planner.close()
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+    def _call(self, fn, name, *args, **kwargs):
+        """
+        Run an endpoint method of the request planner and send the request it
+        made asynchronously.
+
+        :returns: An awaitable of the response, or an asynchronous iterator
+          of the records for iter_all() and stream=True
+        """
+        calls, iteration = self._planner.record(fn, *args, **kwargs)
+        if iteration is not None:
+            method, path, queryparams, data = calls[0]
+            pages = self._iterate_pages(path, queryparams, iteration['max_workers'], iteration['checkpoint'])
+            if iteration['stream']:
+                return self._iterate_records(pages)
+            return self._merge(pages)
+        if len(calls) != 1:
+            raise ValueError('{} made {} requests instead of one'.format(name, len(calls)))
+        return self._request(*calls[0])
+
+
+    async def _request(self, method, path, queryparams=None, data=None):
+        """
+        Send an authenticated request, retrying it as the retry policy allows
+        and after the delay asked by a 429 response.
+
+        :returns: The JSON output from the API
+        """
+        if not self.enabled:
+            return None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        url = urljoin(self.base_url, path)
+        if queryparams:
+            url += '?' + urlencode(queryparams)
+        headers = self._headers
+        body = None
+        if data is not None:
+            body, body_headers = encode_body(self.codec, data, self.compress_threshold)
+            headers = dict(headers, **body_headers)
+        throttled = 0
+        retries = 0
+        deadline = self.retry.deadline()
+        while True:
+            try:
+                async with self._semaphore:
+                    r = await self.transport.request(method, url, headers=headers, data=body,
+                                                     timeout=self.timeout)
+            except self.transport.EXCEPTIONS:
+                delay = self.retry.next_delay(method, retries, deadline)
+                if delay is None:
+                    raise
+                retries += 1
+                await asyncio.sleep(delay)
+                continue
+            retry_after = parse_retry_after(r.headers.get('Retry-After'))
+            if r.status_code == 429 and throttled < MAX_THROTTLE_RETRIES:
+                throttled += 1
+                await asyncio.sleep(retry_after if retry_after is not None else DEFAULT_RETRY_AFTER)
+                continue
+            if r.status_code >= 500:
+                delay = self.retry.next_delay(method, retries, deadline, r.status_code, retry_after)
+                if delay is not None:
+                    retries += 1
+                    await asyncio.sleep(delay)
+                    continue
+            r.raise_for_status()
+            if r.status_code == 204:
+                return None
+            return self.codec.loads(r.content)
+
+
+    async def _iterate_pages(self, path, queryparams, max_workers=1, checkpoint=None):
+        """
+        Yield every 100 item page of a collection in order from the offset
+        of the first page, fetching up to max_workers pages at the same time.
+
+        The progress is saved to the checkpoint as in
+        :py:meth:`mailchimp3.baseapi.BaseApi._iterate_pages`.
+        """
+        start = queryparams.get('offset', 0)
+        first = await self._request('GET', path, queryparams)
+        if first is None:  # The client is disabled
+            return
+        total = first['total_items']
+        if checkpoint is not None:
+            kwargs = {name: value for name, value in queryparams.items() if name not in ('offset', 'count')}
+            key = checkpoint_key(path, kwargs)
+
+        def consumed(offset):
+            if checkpoint is not None:
+                checkpoint.save(key, {'url': path, 'queryparams': kwargs, 'offset': offset, 'total_items': total})
+
+        yield first
+        consumed(start + 100)
+        pending = deque()
+        try:
+            for offset in range(start + 100, total, 100):
+                page_params = dict(queryparams, offset=offset, count=100)
+                pending.append((offset, asyncio.ensure_future(self._request('GET', path, page_params))))
+                if len(pending) >= max(1, max_workers):
+                    page_offset, future = pending.popleft()
+                    yield await future
+                    consumed(page_offset + 100)
+            while pending:
+                page_offset, future = pending.popleft()
+                yield await future
+                consumed(page_offset + 100)
+        finally:
+            for _, future in pending:
+                future.cancel()
+        if checkpoint is not None:
+            checkpoint.delete(key)
+
+
+    @staticmethod
+    async def _iterate_records(pages):
+        """
+        Yield the records of each page, see :py:meth:`BaseApi._iterate_records`
+        """
+        async for page in pages:
+            for key, value in page.items():
+                if key != '_links' and isinstance(value, list):
+                    for record in value:
+                        yield record
+
+
+    @staticmethod
+    async def _merge(pages):
+        return merge_pages([page async for page in pages])
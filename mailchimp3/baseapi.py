@@ -2,11 +2,75 @@
 """
 The base API object that allows constructions of various endpoint paths
 """
-from mailchimp3.helpers import  merge_results
+import importlib
+import itertools
+import threading
+
+from mailchimp3.checkpoint import checkpoint_key
+from mailchimp3.helpers import map_concurrently, merge_pages
+from mailchimp3.mailchimpclient import MAX_CONCURRENT_CONNECTIONS
+from mailchimp3.projection import merge_projection, projection
+
+# The arguments of the get_all reads, which are not query string parameters
+GET_ALL_ARGUMENTS = ('max_workers', 'stream', 'checkpoint', 'attributes', 'links')
+
+
+def sync_only(fn):
+    """
+    Mark an endpoint method that sends several requests, which the
+    endpoints of :py:class:`mailchimp3.AsyncMailChimp` cannot turn into a
+    single awaitable request and refuse
+    """
+    fn.sync_only = True
+    return fn
+
+
+class LazyEndpoint(object):
+    """
+    Attach an endpoint to a client or to a parent endpoint without importing
+    or creating it until it is first accessed.
+
+    The endpoint is created with the client of the object it is accessed on
+    and then cached on that object, so assigning the same descriptor to two
+    names makes them aliases of one endpoint.
+    """
+    def __init__(self, module, name):
+        """
+        :param module: The module defining the endpoint class
+        :type module: :py:class:`str`
+        :param name: The name of the endpoint class
+        :type name: :py:class:`str`
+        """
+        super(LazyEndpoint, self).__init__()
+        self.module = module
+        self.name = name
+        self._key = '_endpoint_{}'.format(name)
+        self._lock = threading.Lock()
+
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self._key]
+        except KeyError:
+            pass
+        with self._lock:
+            if self._key not in instance.__dict__:
+                cls = getattr(importlib.import_module(self.module), self.name)
+                mc_client = instance._mc_client if isinstance(instance, BaseApi) else instance
+                instance.__dict__[self._key] = cls(mc_client)
+            return instance.__dict__[self._key]
+
 
 class BaseApi(object):
     """
     Simple class to buid path for entities
+
+    The IDs that the endpoint methods record on the endpoint, such as
+    `list_id` or `subscriber_hash`, are kept per thread, so one client can
+    be shared by several threads. Reading one that was not set in the
+    current thread gives None.
     """
     def __init__(self, mc_client):
         """
@@ -17,9 +81,27 @@ class BaseApi(object):
         """
         super(BaseApi, self).__init__()
         self._mc_client = mc_client
+        self._local = threading.local()
+        self._local_names = set()
         self.endpoint = ''
 
 
+    def __setattr__(self, name, value):
+        if name.startswith('_') or name == 'endpoint' or isinstance(value, BaseApi):
+            object.__setattr__(self, name, value)
+        else:
+            self._local_names.add(name)
+            setattr(self._local, name, value)
+
+
+    def __getattr__(self, name):
+        # Only called for the attributes not found on the instance or class
+        local_names = self.__dict__.get('_local_names', ())
+        if name in local_names:
+            return getattr(self.__dict__['_local'], name, None)
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+
     def _build_path(self, *args):
         """
         Build path width endpoint and args
@@ -30,36 +112,184 @@ class BaseApi(object):
         return "/".join(str(component) for component in ([self.endpoint,] + list(args)))
 
 
-    def _iterate(self, url, **kwargs):
+    def iter_all(self, *args, **queryparams):
+        """
+        Iterate over every record of the collection one at a time. Takes
+        the same arguments as the all() method of the endpoint and is only
+        available on the endpoints where all() accepts get_all.
+
+        Pages are fetched as the records are consumed, so memory use does
+        not grow with the size of the collection.
+
+        Besides the query string parameters, iter_all() and the all()
+        methods called with get_all=True take these arguments:
+
+        - `max_workers`, the number of pages to fetch concurrently
+        - `stream`, whether all() returns a generator of the records rather
+          than the merged result, always True for iter_all()
+        - `checkpoint`, a store to save the progress to and resume from,
+          see :py:mod:`mailchimp3.checkpoint`
+        - `attributes`, the attributes of the records to fetch, see
+          :py:func:`mailchimp3.projection.projection`
+        - `links`, whether to fetch the _links of the pages and records
+
+        :param args: The path parameters of the endpoint's all() method
+        :param queryparams: The query string parameters
+        """
+        return self.all(*args, get_all=True, stream=True, **queryparams)
+
+
+    def _check_queryparams(self, queryparams):
+        """
+        Check that the arguments of the get_all reads are not passed to a
+        single page read, where they would be sent as query string
+        parameters
+
+        :param queryparams: The query string parameters
+        :type queryparams: :py:class:`dict`
+        """
+        names = [name for name in GET_ALL_ARGUMENTS if name in queryparams]
+        if names:
+            raise ValueError('{} can only be used with get_all=True'.format(', '.join(names)))
+
+
+    def _iterate(self, url, max_workers=1, stream=False, checkpoint=None, attributes=None, links=False,
+                 **kwargs):
         """
         Iterate over all pages for the given url. Feed in the result of self._build_path as the url.
 
+        The pages after the first one are fetched one after another unless
+        `max_workers` is greater than one, in which case up to that many
+        pages (capped to the number of simultaneous connections Mailchimp
+        allows) are requested at the same time. The pages are merged in
+        the same order either way.
+
+        If `stream` is True, a generator of the records is returned instead
+        of the merged result and the pages are only fetched as it is
+        consumed. With `max_workers` greater than one the following pages
+        are fetched while the current one is being consumed.
+
+        If a `checkpoint` store is given, the next offset to fetch is saved
+        to it once each page is consumed, and a later call with the same url
+        and query parameters resumes from the saved offset instead of the
+        start. The pages before it are not fetched again, so a checkpoint can
+        only be given with `stream`, where the records are handled as they
+        are consumed, as a merged result would miss them. The checkpoint is
+        deleted once the last page is consumed.
+
+        Only the `attributes` of the records are fetched if given, see
+        :py:func:`mailchimp3.projection.projection`. Unless `links` is True
+        or `fields` are given, the _links of the pages and of their records,
+        which often make up most of their size, are excluded.
+
         :param url: The url of the endpoint
         :type url: :py:class:`str`
+        :param max_workers: The number of pages to fetch concurrently
+        :type max_workers: :py:class:`int`
+        :param stream: Whether to return a generator of the records
+        :type stream: :py:class:`bool`
+        :param checkpoint: The store to save the progress to and resume from
+        :type checkpoint: :py:class:`mailchimp3.checkpoint.MemoryCheckpointStore`
+        :param attributes: The attributes of the records to fetch, as dotted
+          paths below the record such as 'merge_fields.FNAME'
+        :type attributes: :py:class:`list`
+        :param links: Whether to fetch the _links of the pages and records
+        :type links: :py:class:`bool`
         :param kwargs: The query string parameters
         kwargs['fields'] = []
         kwargs['exclude_fields'] = []
         kwargs['count'] = integer
         kwargs['offset'] = integer
         """
+        if checkpoint is not None and not stream:
+            raise ValueError('A checkpoint can only be used with stream=True or iter_all()')
+        if attributes is not None:
+            kwargs = merge_projection(kwargs, projection(url, attributes, links=links))
+        elif not links and 'fields' not in kwargs:
+            kwargs = merge_projection(kwargs, projection(url))
         #fields as a kwarg ought to be a string with comma-separated substring
         #values to pass along to self._mc_client._get(). it also ought to
         #contain total_items whenever the kwarg is employed, this is enforced
         if 'fields' in kwargs:
             if not 'total_items' in kwargs['fields'].split(','):
                 kwargs['fields'] += ',total_items'
+        pages = self._iterate_pages(url, max_workers, checkpoint, **kwargs)
+        if stream:
+            return self._iterate_records(pages)
+        return merge_pages(pages)
+
+
+    def _iterate_pages(self, url, max_workers=1, checkpoint=None, **kwargs):
+        """
+        Yield every 100 item page for the given url in order.
+
+        :param url: The url of the endpoint
+        :type url: :py:class:`str`
+        :param max_workers: The number of pages to fetch concurrently
+        :type max_workers: :py:class:`int`
+        :param checkpoint: The store to save the progress to and resume from
+        :type checkpoint: :py:class:`mailchimp3.checkpoint.MemoryCheckpointStore`
+        :param kwargs: The query string parameters
+        """
+        start = 0
+        if checkpoint is not None:
+            key = checkpoint_key(url, kwargs)
+            saved = checkpoint.load(key)
+            if saved is not None:
+                start = saved['offset']
         #Fetch results from mailchimp, up to first 100
-        result = self._mc_client._get(url=url, offset=0, count=100, **kwargs)
-        total = result['total_items']
-        #Fetch further results if necessary
-        if total > 100:
-            for offset in range(1, int(total / 100) + 1):
-                result = merge_results(result, self._mc_client._get(
-                    url=url,
-                    offset=int(offset*100),
-                    count=100,
-                    **kwargs
-                ))
-            return result
-        else:  # Further results not necessary
-            return result
+        first = self._mc_client._get(url=url, offset=start, count=100, **kwargs)
+        if first is None:  # The client is disabled
+            return
+        total = first['total_items']
+        offsets = range(start + 100, total, 100)
+        pages = itertools.chain([first], self._fetch_pages(url, offsets, max_workers, **kwargs))
+        for index, page in enumerate(pages):
+            yield page
+            if checkpoint is not None:
+                checkpoint.save(key, {
+                    'url': url,
+                    'queryparams': kwargs,
+                    'offset': start + 100 * (index + 1),
+                    'total_items': total,
+                })
+        if checkpoint is not None:
+            checkpoint.delete(key)
+
+
+    @staticmethod
+    def _iterate_records(pages):
+        """
+        Yield the records of each page, i.e. the items of every list value
+        other than the _links of the page.
+
+        :param pages: The pages of the collection
+        :type pages: :py:class:`collections.Iterable`
+        """
+        for page in pages:
+            for key, value in page.items():
+                if key != '_links' and isinstance(value, list):
+                    for record in value:
+                        yield record
+
+
+    def _fetch_pages(self, url, offsets, max_workers=1, **kwargs):
+        """
+        Fetch the 100 item pages starting at each of the offsets, yielding
+        them in the order of the offsets.
+
+        When fetching concurrently, only a bounded number of pages are
+        requested ahead of the one being consumed.
+
+        :param url: The url of the endpoint
+        :type url: :py:class:`str`
+        :param offsets: The offset of each page to fetch
+        :type offsets: :py:class:`list`
+        :param max_workers: The number of pages to fetch concurrently
+        :type max_workers: :py:class:`int`
+        :param kwargs: The query string parameters
+        """
+        def fetch(offset):
+            return self._mc_client._get(url=url, offset=offset, count=100, **kwargs)
+        max_workers = min(max_workers or 1, MAX_CONCURRENT_CONNECTIONS)
+        return map_concurrently(fetch, offsets, max_workers)
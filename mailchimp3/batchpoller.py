@@ -0,0 +1,214 @@
+# coding=utf-8
+"""
+Waiting for many batch operations at once
+"""
+from __future__ import unicode_literals
+
+import heapq
+import itertools
+import time
+
+from concurrent.futures import Future
+
+
+class BatchPoller(object):
+    """
+    Track many batch operations and poll their status until they finish.
+
+    Each batch is polled on its own schedule. While a batch makes progress,
+    its next poll is planned for about half the time its remaining
+    operations should take at the observed rate, and while it makes none,
+    the interval doubles. Intervals stay between `min_interval` and
+    `max_interval`, and polls of all the batches are spaced out so that no
+    more than `max_rate` requests per second are made.
+
+    The bulk helpers such as
+    :py:meth:`mailchimp3.entities.listmembers.ListMembers.bulk_create_or_update`
+    wait for their batches with a poller.
+
+    The poller runs in the thread calling :py:meth:`wait` or
+    :py:meth:`as_completed`:
+
+        poller = BatchPoller(client.batches)
+        for batch_id in batch_ids:
+            poller.add(batch_id, callback=handle_batch)
+        poller.wait()
+    """
+    def __init__(self, batches, min_interval=1.0, max_interval=60.0, max_rate=1.0):
+        """
+        Initialize the poller
+
+        :param batches: The batch operations endpoint of a client
+        :type batches: :py:class:`mailchimp3.entities.batches.Batches`
+        :param min_interval: The shortest time in seconds between two polls
+          of a batch
+        :type min_interval: :py:class:`float`
+        :param max_interval: The longest time in seconds between two polls
+          of a batch
+        :type max_interval: :py:class:`float`
+        :param max_rate: The maximum number of polls per second, unlimited
+          if None
+        :type max_rate: :py:class:`float`
+        """
+        super(BatchPoller, self).__init__()
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError('The polling rate must be positive')
+        self._batches = batches
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_rate = max_rate
+        self._schedule = []
+        self._tracked = {}
+        self._counter = itertools.count()
+        self._last_poll = 0.0
+
+
+    def add(self, batch_id, callback=None):
+        """
+        Start tracking a batch, which is first polled right away.
+
+        :param batch_id: The unique id for the batch operation.
+        :type batch_id: :py:class:`str`
+        :param callback: A function called with the finished batch
+        :type callback: :py:class:`collections.Callable`
+        :returns: A future resolved with the finished batch, or with the
+          exception raised by polling it
+        :rtype: :py:class:`concurrent.futures.Future`
+        """
+        if batch_id in self._tracked:
+            return self._tracked[batch_id]['future']
+        future = Future()
+        future.set_running_or_notify_cancel()
+        if callback is not None:
+            def done(future):
+                if future.exception() is None:
+                    callback(future.result())
+            future.add_done_callback(done)
+        self._tracked[batch_id] = {
+            'future': future,
+            'interval': self.min_interval,
+            'progress': None,
+        }
+        heapq.heappush(self._schedule, (time.time(), next(self._counter), batch_id))
+        return future
+
+
+    @property
+    def pending(self):
+        """
+        The ids of the batches that are not finished yet
+        """
+        return list(self._tracked)
+
+
+    def as_completed(self, timeout=None):
+        """
+        Poll the tracked batches, yielding each one as it finishes.
+
+        :param timeout: The number of seconds after which to stop polling,
+          unlimited if None
+        :type timeout: :py:class:`float`
+        :returns: A generator of the finished batches
+        :rtype: :py:class:`types.GeneratorType`
+        """
+        for batch in self._polls(timeout):
+            if batch is not None:
+                yield batch
+
+
+    def wait(self, timeout=None):
+        """
+        Poll the tracked batches until they are all finished.
+
+        :param timeout: The number of seconds after which to stop polling,
+          unlimited if None
+        :type timeout: :py:class:`float`
+        :returns: Whether all of the batches are finished
+        :rtype: :py:class:`bool`
+        """
+        for _ in self.as_completed(timeout):
+            pass
+        return not self._tracked
+
+
+    def result(self, future, timeout=None):
+        """
+        Poll the tracked batches until the one of a future is finished.
+
+        :param future: The future returned by :py:meth:`add` for the batch
+        :type future: :py:class:`concurrent.futures.Future`
+        :param timeout: The number of seconds after which to stop polling,
+          unlimited if None
+        :type timeout: :py:class:`float`
+        :returns: The finished batch, raising the exception raised by
+          polling it, or a :py:class:`concurrent.futures.TimeoutError` if
+          it is not finished within the timeout
+        :rtype: :py:class:`dict`
+        """
+        if not future.done():
+            for _ in self._polls(timeout):
+                if future.done():
+                    break
+        return future.result(timeout=0)
+
+
+    def _polls(self, timeout):
+        """
+        Poll the tracked batches when they are due, yielding the batch of
+        each poll if it is finished or None
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        while self._schedule:
+            due, _, batch_id = self._schedule[0]
+            if self.max_rate is not None:
+                due = max(due, self._last_poll + 1.0 / self.max_rate)
+            if deadline is not None and due > deadline:
+                time.sleep(max(0, deadline - time.time()))
+                return
+            time.sleep(max(0, due - time.time()))
+            heapq.heappop(self._schedule)
+            yield self._poll(batch_id)
+
+
+    def _poll(self, batch_id):
+        """
+        Poll a batch and either resolve its future or schedule its next poll
+
+        :returns: The batch if it is finished
+        :rtype: :py:class:`dict`
+        """
+        state = self._tracked[batch_id]
+        self._last_poll = now = time.time()
+        try:
+            batch = self._batches.get(batch_id)
+        except Exception as error:
+            del self._tracked[batch_id]
+            state['future'].set_exception(error)
+            return None
+        if batch is None or batch['status'] == 'finished':
+            del self._tracked[batch_id]
+            state['future'].set_result(batch)
+            return batch
+        interval = self._next_interval(state, now, batch)
+        heapq.heappush(self._schedule, (now + interval, next(self._counter), batch_id))
+        return None
+
+
+    def _next_interval(self, state, now, batch):
+        """
+        Plan the next poll of an unfinished batch from its progress
+
+        :returns: The number of seconds until the next poll
+        :rtype: :py:class:`float`
+        """
+        finished = batch.get('finished_operations') or 0
+        total = batch.get('total_operations') or 0
+        previous = state['progress']
+        state['progress'] = (now, finished)
+        if previous is not None and finished > previous[1] and now > previous[0]:
+            rate = (finished - previous[1]) / (now - previous[0])
+            interval = (total - finished) / rate / 2.0
+        else:
+            interval = state['interval'] * 2
+        state['interval'] = min(self.max_interval, max(self.min_interval, interval))
+        return state['interval']
@@ -0,0 +1,52 @@
+# coding=utf-8
+"""
+Reader for the results of batch operations
+
+When a batch is finished, its response_body_url points to a gzipped tar
+archive of JSON files, each holding a list of the results of some of the
+operations:
+
+    [
+        {
+            "status_code": 200,
+            "operation_id": "...",
+            "response": "<the JSON body of the response, as a string>"
+        }
+    ]
+"""
+from __future__ import unicode_literals
+
+import tarfile
+
+from mailchimp3.codec import default_codec
+
+
+def iter_batch_results(fileobj, codec=None):
+    """
+    Read the results of batch operations from a gzipped tar archive.
+
+    The archive is read sequentially and one JSON file is decoded at a time,
+    so it can be streamed from a response without being held in memory.
+
+    :param fileobj: The archive, opened in binary mode
+    :type fileobj: :py:class:`io.BufferedIOBase`
+    :param codec: The JSON codec, by default the fastest one installed
+    :type codec: :py:class:`mailchimp3.codec.StdlibCodec`
+    :returns: A generator of (operation_id, status_code, response) tuples,
+      with the response decoded from JSON, or None if it was empty
+    :rtype: :py:class:`types.GeneratorType`
+    """
+    if codec is None:
+        codec = default_codec()
+    with tarfile.open(fileobj=fileobj, mode='r|gz') as archive:
+        for member in archive:
+            if not member.isfile() or not member.name.endswith('.json'):
+                continue
+            results = codec.loads(archive.extractfile(member).read())
+            for result in results:
+                response = result.get('response')
+                if response:
+                    response = codec.loads(response)
+                else:
+                    response = None
+                yield result.get('operation_id'), result.get('status_code'), response
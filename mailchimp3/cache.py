@@ -0,0 +1,168 @@
+# coding=utf-8
+"""
+Cache for the responses of GET requests
+
+Pass a :py:class:`ResponseCache` as the `cache` of a client to answer
+repeated reads of rarely changing resources, such as merge fields or
+interest categories, without a round trip:
+
+    cache = ResponseCache(ttl=60, ttls={'lists/*/merge-fields*': 300, 'lists/*/members*': 0})
+    client = MailChimp('YOUR_USERNAME', 'YOUR_SECRET_KEY', cache=cache)
+"""
+from __future__ import unicode_literals
+
+import fnmatch
+import time
+from collections import namedtuple
+
+from mailchimp3.helpers import LRUCache
+
+CachedResponse = namedtuple('CachedResponse', ['account', 'path', 'content', 'etag', 'expires'])
+
+
+class ResponseCache(object):
+    """
+    An LRU cache of the responses of GET requests, safe to share between
+    threads.
+
+    A response is served from the cache until its TTL expires. After that,
+    if the server gave it an ETag, the request is sent again with an
+    If-None-Match header and a 304 response renews the cached one. Any POST,
+    PATCH, PUT or DELETE request sent by the client invalidates the cached
+    responses of the same path, of the paths below it and of the paths
+    above it, since a collection or its parent may include the changed
+    resource. Changes made by other clients or by batch operations are only
+    seen once the TTL expires.
+
+    The responses are cached per account, so a cache shared by the clients
+    of several accounts never answers one of them with the response of
+    another.
+    """
+    def __init__(self, maxsize=1000, ttl=60, ttls=None):
+        """
+        Initialize the cache
+
+        :param maxsize: The maximum number of cached responses
+        :type maxsize: :py:class:`int`
+        :param ttl: The number of seconds a response is served from the cache
+        :type ttl: :py:class:`float`
+        :param ttls: The TTL of the paths matching each glob pattern, such as
+          'lists/*/interest-categories*', overriding the default. The most
+          specific, i.e. longest, matching pattern wins, and a TTL of 0
+          disables caching for its paths
+        :type ttls: :py:class:`dict`
+        """
+        super(ResponseCache, self).__init__()
+        self.ttl = ttl
+        self.ttls = sorted((ttls or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self._responses = LRUCache(maxsize)
+
+
+    def ttl_for(self, path):
+        """
+        Get the TTL of a path
+
+        :param path: The path of the endpoint, without query string
+        :type path: :py:class:`str`
+        :rtype: :py:class:`float`
+        """
+        for pattern, ttl in self.ttls:
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+
+    def get(self, url, account=None):
+        """
+        Get the cached response of a url, fresh or not
+
+        :param url: The full url of the request, with its query string
+        :type url: :py:class:`str`
+        :param account: The identity of the account the request is sent for
+        :type account: :py:class:`str`
+        :rtype: :py:class:`CachedResponse`
+        """
+        return self._responses.get((account, url))
+
+
+    def store(self, path, url, response, account=None):
+        """
+        Cache a successful response
+
+        :param path: The path of the endpoint, without query string
+        :type path: :py:class:`str`
+        :param url: The full url of the request, with its query string
+        :type url: :py:class:`str`
+        :param response: The response
+        :type response: :py:class:`requests.Response`
+        :param account: The identity of the account the request was sent for
+        :type account: :py:class:`str`
+        """
+        path = path.strip('/')
+        ttl = self.ttl_for(path)
+        if not ttl:
+            return
+        etag = response.headers.get('ETag')
+        self._responses.set((account, url), CachedResponse(account, path, response.content, etag, time.time() + ttl))
+
+
+    def renew(self, url, cached):
+        """
+        Serve a cached response for another TTL, after the server confirmed
+        it did not change
+
+        :param url: The full url of the request, with its query string
+        :type url: :py:class:`str`
+        :param cached: The cached response
+        :type cached: :py:class:`CachedResponse`
+        """
+        self._responses.set((cached.account, url), cached._replace(expires=time.time() + self.ttl_for(cached.path)))
+
+
+    def invalidate(self, path, account=None):
+        """
+        Remove the cached responses of an account for a path, the paths below
+        it and the paths above it
+
+        :param path: The path of the endpoint, without query string
+        :type path: :py:class:`str`
+        :param account: The identity of the account
+        :type account: :py:class:`str`
+        """
+        path = path.strip('/')
+        for key in self._responses.keys():
+            cached = self._responses.get(key)
+            if cached is None or cached.account != account:
+                continue
+            if _is_within(cached.path, path) or _is_within(path, cached.path):
+                self._responses.pop(key)
+
+
+    def clear(self):
+        """
+        Remove every cached response
+        """
+        self._responses.clear()
+
+
+    def __len__(self):
+        return len(self._responses)
+
+
+    @staticmethod
+    def is_fresh(cached):
+        """
+        Check whether a cached response can be served without revalidation
+
+        :param cached: The cached response
+        :type cached: :py:class:`CachedResponse`
+        :rtype: :py:class:`bool`
+        """
+        return time.time() < cached.expires
+
+
+def _is_within(path, parent):
+    """
+    Check whether a path is the same as or below another one
+    """
+    return not parent or path == parent or path.startswith(parent + '/')
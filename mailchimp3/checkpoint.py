@@ -0,0 +1,127 @@
+# coding=utf-8
+"""
+Checkpoint stores for resumable pagination
+
+A store is passed as the `checkpoint` of a get_all or iter_all call, and
+records the next offset to fetch after each page is consumed, so that a
+later call with the same url and query parameters resumes from there:
+
+    store = FileCheckpointStore('export.checkpoint')
+    for activity in client.reports.email_activity.iter_all(campaign_id, checkpoint=store):
+        write(activity)
+
+Any object with the same `load`, `save` and `delete` methods can be used as
+a store.
+"""
+from __future__ import unicode_literals
+
+import json
+import os
+import threading
+
+
+def checkpoint_key(url, queryparams):
+    """
+    Get the key identifying the pagination of a url with query parameters
+
+    :param url: The url of the endpoint
+    :type url: :py:class:`str`
+    :param queryparams: The query string parameters
+    :type queryparams: :py:class:`dict`
+    :rtype: :py:class:`str`
+    """
+    return json.dumps([url, queryparams], sort_keys=True)
+
+
+class MemoryCheckpointStore(object):
+    """
+    A store keeping the checkpoints in memory, which survive errors but not
+    the process
+    """
+    def __init__(self):
+        super(MemoryCheckpointStore, self).__init__()
+        self._checkpoints = {}
+        self._lock = threading.Lock()
+
+
+    def load(self, key):
+        """
+        Get a checkpoint
+
+        :param key: The key of the checkpoint
+        :type key: :py:class:`str`
+        :returns: The url, queryparams, offset and total_items of the
+          checkpoint, or None if there is none
+        :rtype: :py:class:`dict`
+        """
+        with self._lock:
+            checkpoint = self._checkpoints.get(key)
+            return dict(checkpoint) if checkpoint is not None else None
+
+
+    def save(self, key, checkpoint):
+        """
+        Record a checkpoint
+
+        :param key: The key of the checkpoint
+        :type key: :py:class:`str`
+        :param checkpoint: The url, queryparams, offset and total_items
+        :type checkpoint: :py:class:`dict`
+        """
+        with self._lock:
+            self._checkpoints[key] = dict(checkpoint)
+
+
+    def delete(self, key):
+        """
+        Remove a checkpoint, once the pagination is complete
+
+        :param key: The key of the checkpoint
+        :type key: :py:class:`str`
+        """
+        with self._lock:
+            self._checkpoints.pop(key, None)
+
+
+class FileCheckpointStore(MemoryCheckpointStore):
+    """
+    A store keeping the checkpoints in a JSON file, which is replaced
+    atomically each time a checkpoint is recorded so that it survives the
+    process being stopped at any point
+    """
+    def __init__(self, path):
+        """
+        Initialize the store
+
+        :param path: The path of the file
+        :type path: :py:class:`str`
+        """
+        super(FileCheckpointStore, self).__init__()
+        self.path = path
+        if os.path.exists(path):
+            with open(path) as f:
+                self._checkpoints = json.load(f)
+
+
+    def save(self, key, checkpoint):
+        super(FileCheckpointStore, self).save(key, checkpoint)
+        self._write()
+
+
+    def delete(self, key):
+        super(FileCheckpointStore, self).delete(key)
+        self._write()
+
+
+    def _write(self):
+        """
+        Write every checkpoint to a temporary file and move it into place
+        """
+        with self._lock:
+            temporary = '{}.tmp'.format(self.path)
+            with open(temporary, 'w') as f:
+                json.dump(self._checkpoints, f)
+                f.flush()
+                os.fsync(f.fileno())
+            # os.replace is atomic on every platform but missing on Python 2
+            getattr(os, 'replace', os.rename)(temporary, self.path)
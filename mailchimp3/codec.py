@@ -0,0 +1,106 @@
+# coding=utf-8
+"""
+JSON codecs used to encode the request bodies and decode the responses
+
+By default the client uses the fastest codec available: orjson or ujson
+when one of them is installed, or the json module of the standard library.
+Any object with the same `dumps` and `loads` methods can be passed as the
+`codec` of a client instead:
+
+    client = MailChimp('YOUR_USERNAME', 'YOUR_SECRET_KEY', codec=StdlibCodec())
+"""
+from __future__ import unicode_literals
+
+import json
+
+
+class StdlibCodec(object):
+    """
+    Codec using the json module of the standard library
+    """
+    name = 'json'
+
+    def dumps(self, obj):
+        """
+        Encode an object
+
+        :param obj: The object
+        :returns: The JSON document, encoded in UTF-8
+        :rtype: :py:class:`bytes`
+        """
+        return json.dumps(obj).encode('utf-8')
+
+
+    def loads(self, content):
+        """
+        Decode a JSON document
+
+        :param content: The document, as UTF-8 bytes or text
+        :type content: :py:class:`bytes`
+        :returns: The decoded object
+        """
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        return json.loads(content)
+
+
+class OrjsonCodec(StdlibCodec):
+    """
+    Codec using orjson, which has to be installed
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        super(OrjsonCodec, self).__init__()
+        import orjson
+        self._orjson = orjson
+
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj)
+
+
+    def loads(self, content):
+        return self._orjson.loads(content)
+
+
+class UjsonCodec(StdlibCodec):
+    """
+    Codec using ujson, which has to be installed
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        super(UjsonCodec, self).__init__()
+        import ujson
+        self._ujson = ujson
+
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+    def loads(self, content):
+        return self._ujson.loads(content)
+
+
+# The codecs in order of preference
+CODECS = (OrjsonCodec, UjsonCodec, StdlibCodec)
+_default = None
+
+
+def default_codec():
+    """
+    Get the fastest codec available
+
+    :rtype: :py:class:`StdlibCodec`
+    """
+    global _default
+    if _default is None:
+        for codec in CODECS:
+            try:
+                _default = codec()
+            except ImportError:
+                continue
+            break
+    return _default
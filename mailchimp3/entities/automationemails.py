@@ -9,15 +9,16 @@ Schema: https://api.mailchimp.com/schema/3.0/Automations/Emails/Instance.json
 """
 from __future__ import unicode_literals
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.automationemailactions import AutomationEmailActions
-from mailchimp3.entities.automationemailqueues import AutomationEmailQueues
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class AutomationEmails(BaseApi):
     """
     Manage individual emails in an Automation workflow.
     """
+    actions = LazyEndpoint('mailchimp3.entities.automationemailactions', 'AutomationEmailActions')
+    queues = LazyEndpoint('mailchimp3.entities.automationemailqueues', 'AutomationEmailQueues')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -26,8 +27,6 @@ class AutomationEmails(BaseApi):
         self.endpoint = 'automations'
         self.workflow_id = None
         self.email_id = None
-        self.actions = AutomationEmailActions(self)
-        self.queues = AutomationEmailQueues(self)
 
 
     # Paid feature
@@ -9,10 +9,7 @@ Schema: https://api.mailchimp.com/schema/3.0/Automations/Instance.json
 """
 from __future__ import unicode_literals
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.automationactions import AutomationActions
-from mailchimp3.entities.automationemails import AutomationEmails
-from mailchimp3.entities.automationremovedsubscribers import AutomationRemovedSubscribers
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class Automations(BaseApi):
@@ -21,6 +18,10 @@ class Automations(BaseApi):
     emails that are sent to subscribers over a set period of time. Use the
     Automation API calls to manage Automation workflows, emails, and queues.
     """
+    actions = LazyEndpoint('mailchimp3.entities.automationactions', 'AutomationActions')
+    emails = LazyEndpoint('mailchimp3.entities.automationemails', 'AutomationEmails')
+    removed_subscribers = LazyEndpoint('mailchimp3.entities.automationremovedsubscribers', 'AutomationRemovedSubscribers')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -28,9 +29,6 @@ class Automations(BaseApi):
         super(Automations, self).__init__(*args, **kwargs)
         self.endpoint = 'automations'
         self.workflow_id = None
-        self.actions = AutomationActions(self)
-        self.emails = AutomationEmails(self)
-        self.removed_subscribers = AutomationRemovedSubscribers(self)
 
 
     # Paid feature
@@ -40,7 +38,9 @@ class Automations(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: the query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         """
@@ -48,6 +48,7 @@ class Automations(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
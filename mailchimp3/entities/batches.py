@@ -9,8 +9,18 @@ from __future__ import unicode_literals
 
 import six
 import sys
+import time
 
-from mailchimp3.baseapi import BaseApi
+from concurrent.futures import TimeoutError
+
+from mailchimp3.baseapi import BaseApi, sync_only
+from mailchimp3.batchresults import iter_batch_results
+
+# The number of operations sent in each batch by the bulk helpers
+BATCH_CHUNK_SIZE = 500
+# The longest number of seconds between two polls of a batch by the bulk
+# helpers
+BATCH_MAX_POLL_INTERVAL = 60
 
 
 class Batches(BaseApi):
@@ -71,7 +81,9 @@ class Batches(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -82,6 +94,7 @@ class Batches(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
@@ -100,6 +113,65 @@ class Batches(BaseApi):
         return self._mc_client._get(url=self._build_path(batch_id), **queryparams)
 
 
+    @sync_only
+    def wait(self, batch_id, interval=5, timeout=None):
+        """
+        Wait for a batch request to finish by polling its status.
+
+        :param batch_id: The unique id for the batch operation.
+        :type batch_id: :py:class:`str`
+        :param interval: The number of seconds between two polls
+        :type interval: :py:class:`float`
+        :param timeout: The number of seconds after which to stop waiting,
+          unlimited if None
+        :type timeout: :py:class:`float`
+        :returns: The finished batch, raising a
+          :py:class:`concurrent.futures.TimeoutError` if it is not finished
+          within the timeout
+        :rtype: :py:class:`dict`
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        while True:
+            response = self.get(batch_id)
+            if response is None or response['status'] == 'finished':
+                return response
+            if deadline is not None and time.time() + interval > deadline:
+                raise TimeoutError('The batch {} is not finished after {} seconds'.format(batch_id, timeout))
+            time.sleep(interval)
+
+
+    @sync_only
+    def results(self, batch):
+        """
+        Get the result of each operation of a finished batch request.
+
+        The archive of the results is streamed and decompressed as the
+        results are consumed, so it is never held in memory.
+
+        :param batch: The unique id for the batch operation, or the finished
+          batch as returned by get() or wait()
+        :type batch: :py:class:`str` or :py:class:`dict`
+        :returns: A generator of (operation_id, status_code, response)
+          tuples, with the response decoded from JSON
+        :rtype: :py:class:`types.GeneratorType`
+        """
+        if not isinstance(batch, dict):
+            batch = self.get(batch)
+            if batch is None:
+                return
+        self.batch_id = batch['id']
+        if batch['status'] != 'finished':
+            raise ValueError('The batch {} is not finished'.format(batch['id']))
+        response = self._mc_client._download(batch['response_body_url'])
+        if response is None:
+            return
+        try:
+            for result in iter_batch_results(response.raw, self._mc_client.codec):
+                yield result
+        finally:
+            response.close()
+
+
     def delete(self, batch_id):
         """
         Stops a batch request from running. Since only one batch request is
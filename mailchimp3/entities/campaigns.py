@@ -10,11 +10,7 @@ from __future__ import unicode_literals
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.campaignactions import CampaignActions
-from mailchimp3.entities.campaigncontent import CampaignContent
-from mailchimp3.entities.campaignfeedback import CampaignFeedback
-from mailchimp3.entities.campaignsendchecklist import CampaignSendChecklist
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 from mailchimp3.helpers import check_email
 
 
@@ -23,6 +19,11 @@ class Campaigns(BaseApi):
     Campaigns are how you send emails to your MailChimp list. Use the
     Campaigns API calls to manage campaigns in your MailChimp account.
     """
+    actions = LazyEndpoint('mailchimp3.entities.campaignactions', 'CampaignActions')
+    content = LazyEndpoint('mailchimp3.entities.campaigncontent', 'CampaignContent')
+    feedback = LazyEndpoint('mailchimp3.entities.campaignfeedback', 'CampaignFeedback')
+    send_checklist = LazyEndpoint('mailchimp3.entities.campaignsendchecklist', 'CampaignSendChecklist')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -30,10 +31,6 @@ class Campaigns(BaseApi):
         super(Campaigns, self).__init__(*args, **kwargs)
         self.endpoint = 'campaigns'
         self.campaign_id = None
-        self.actions = CampaignActions(self)
-        self.content = CampaignContent(self)
-        self.feedback = CampaignFeedback(self)
-        self.send_checklist = CampaignSendChecklist(self)
 
 
     def create(self, data):
@@ -133,7 +130,9 @@ class Campaigns(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -151,6 +150,7 @@ class Campaigns(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
@@ -9,8 +9,7 @@ Schema: https://api.mailchimp.com/schema/3.0/Conversations/Instance.json
 """
 from __future__ import unicode_literals
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.conversationmessages import ConversationMessages
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class Conversations(BaseApi):
@@ -18,6 +17,8 @@ class Conversations(BaseApi):
     Conversation tracking is a paid feature that lets you view subscribers’
     replies to your campaigns in your MailChimp account.
     """
+    messages = LazyEndpoint('mailchimp3.entities.conversationmessages', 'ConversationMessages')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -25,7 +26,6 @@ class Conversations(BaseApi):
         super(Conversations, self).__init__(*args, **kwargs)
         self.endpoint = 'conversations'
         self.conversation_id = None
-        self.messages = ConversationMessages(self)
 
 
     # Paid feature
@@ -35,7 +35,9 @@ class Conversations(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -48,6 +50,7 @@ class Conversations(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
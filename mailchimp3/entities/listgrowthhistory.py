@@ -32,7 +32,9 @@ class ListGrowthHistory(BaseApi):
         :type list_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -41,8 +43,9 @@ class ListGrowthHistory(BaseApi):
         self.list_id = list_id
         self.month = None
         if get_all:
-            self._iterate(url=self._build_path(list_id, 'growth-history'), **queryparams)
+            return self._iterate(url=self._build_path(list_id, 'growth-history'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(list_id, 'growth-history'), **queryparams)
 
 
@@ -10,8 +10,7 @@ from __future__ import unicode_literals
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.listinterestcategoryinterest import ListInterestCategoryInterest
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class ListInterestCategories(BaseApi):
@@ -21,6 +20,8 @@ class ListInterestCategories(BaseApi):
     preferences. These correspond to ‘group titles’ in the MailChimp
     application.
     """
+    interests = LazyEndpoint('mailchimp3.entities.listinterestcategoryinterest', 'ListInterestCategoryInterest')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -29,7 +30,6 @@ class ListInterestCategories(BaseApi):
         self.endpoint = 'lists'
         self.list_id = None
         self.category_id = None
-        self.interests = ListInterestCategoryInterest(self)
 
 
     def create(self, list_id, data):
@@ -75,7 +75,9 @@ class ListInterestCategories(BaseApi):
         :type list_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -87,6 +89,7 @@ class ListInterestCategories(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(list_id, 'interest-categories'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(list_id, 'interest-categories'), **queryparams)
 
 
@@ -76,7 +76,9 @@ class ListInterestCategoryInterest(BaseApi):
         :type category_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -86,8 +88,9 @@ class ListInterestCategoryInterest(BaseApi):
         self.category_id = category_id
         self.interest_id = None
         if get_all:
-            self._iterate(url=self._build_path(list_id, 'interest-categories', category_id, 'interests'), **queryparams)
+            return self._iterate(url=self._build_path(list_id, 'interest-categories', category_id, 'interests'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(
                 url=self._build_path(list_id, 'interest-categories', category_id, 'interests'),
                 **queryparams
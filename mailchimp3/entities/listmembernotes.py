@@ -75,7 +75,9 @@ class ListMemberNotes(BaseApi):
         :type subscriber_hash: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -88,6 +90,7 @@ class ListMemberNotes(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(list_id, 'members', subscriber_hash, 'notes'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(list_id, 'members', subscriber_hash, 'notes'), **queryparams)
 
 
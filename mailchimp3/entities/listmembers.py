@@ -9,12 +9,12 @@ from __future__ import unicode_literals
 
 import six
 import sys
+from collections import deque
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.listmemberactivity import ListMemberActivity
-from mailchimp3.entities.listmembergoals import ListMemberGoals
-from mailchimp3.entities.listmembernotes import ListMemberNotes
-from mailchimp3.helpers import check_email, check_subscriber_hash
+from mailchimp3.baseapi import BaseApi, LazyEndpoint, sync_only
+from mailchimp3.batchpoller import BatchPoller
+from mailchimp3.entities.batches import BATCH_CHUNK_SIZE, BATCH_MAX_POLL_INTERVAL, Batches
+from mailchimp3.helpers import check_email, check_subscriber_hash, chunks, get_subscriber_hash
 
 
 class ListMembers(BaseApi):
@@ -22,6 +22,10 @@ class ListMembers(BaseApi):
     Manage members of a specific MailChimp list, including currently
     subscribed, unsubscribed, and bounced members.
     """
+    activity = LazyEndpoint('mailchimp3.entities.listmemberactivity', 'ListMemberActivity')
+    goals = LazyEndpoint('mailchimp3.entities.listmembergoals', 'ListMemberGoals')
+    notes = LazyEndpoint('mailchimp3.entities.listmembernotes', 'ListMemberNotes')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -30,9 +34,6 @@ class ListMembers(BaseApi):
         self.endpoint = 'lists'
         self.list_id = None
         self.subscriber_hash = None
-        self.activity = ListMemberActivity(self)
-        self.goals = ListMemberGoals(self)
-        self.notes = ListMemberNotes(self)
 
 
     def create(self, list_id, data):
@@ -79,7 +80,9 @@ class ListMembers(BaseApi):
         :type list_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -101,6 +104,7 @@ class ListMembers(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(list_id, 'members'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(list_id, 'members'), **queryparams)
 
 
@@ -161,6 +165,131 @@ class ListMembers(BaseApi):
         subscriber_hash = check_subscriber_hash(subscriber_hash)
         self.list_id = list_id
         self.subscriber_hash = subscriber_hash
+        self._check_create_or_update(data)
+        return self._mc_client._put(url=self._build_path(list_id, 'members', subscriber_hash), data=data)
+
+
+    @sync_only
+    def bulk_create_or_update(self, list_id, members, chunk_size=BATCH_CHUNK_SIZE, max_pending=1, poll_interval=5,
+                              operation_results=False, validate=True, timeout=None):
+        """
+        Add or update many list members through batch operations, waiting
+        for every batch to finish.
+
+        Each member is validated as in create_or_update and becomes a PUT
+        operation whose operation_id is the member's subscriber hash. The
+        members are sent in batches of chunk_size operations, with up to
+        max_pending batches submitted before waiting for the oldest one to
+        finish. The pending batches are polled by a
+        :py:class:`mailchimp3.batchpoller.BatchPoller`, more often while they
+        make progress.
+
+        If operation_results is True, the result of each operation is
+        returned instead of the finished batches, see Batches.results. Use
+        iter_bulk_create_or_update to handle the batches as they finish
+        without keeping all of them in memory.
+
+        :param list_id: The unique id for the list.
+        :type list_id: :py:class:`str`
+        :param members: The request body parameters of each member
+        :type members: :py:class:`collections.Iterable`
+        members = [
+            {
+                "email_address": string*,
+                "status_if_new": string* (Must be one of 'subscribed', 'unsubscribed', 'cleaned' or 'pending')
+            }
+        ]
+        :param chunk_size: The number of operations in each batch
+        :type chunk_size: :py:class:`int`
+        :param max_pending: The number of batches to submit before waiting
+        :type max_pending: :py:class:`int`
+        :param poll_interval: The shortest number of seconds between two
+          polls of a batch's status
+        :type poll_interval: :py:class:`float`
+        :param operation_results: Whether to return the result of each
+          operation rather than the finished batches
+        :type operation_results: :py:class:`bool`
+        :param validate: Whether to check each member, which can be skipped
+          for members coming from a trusted source
+        :type validate: :py:class:`bool`
+        :param timeout: The number of seconds to wait for each batch,
+          unlimited if None
+        :type timeout: :py:class:`float`
+        :returns: The finished batches, or the (operation_id, status_code,
+          response) tuples, in order, raising a
+          :py:class:`concurrent.futures.TimeoutError` when a batch is not
+          finished within the timeout
+        :rtype: :py:class:`list`
+        """
+        return list(self.iter_bulk_create_or_update(list_id, members, chunk_size, max_pending, poll_interval,
+                                                    operation_results, validate, timeout))
+
+
+    @sync_only
+    def iter_bulk_create_or_update(self, list_id, members, chunk_size=BATCH_CHUNK_SIZE, max_pending=1,
+                                   poll_interval=5, operation_results=False, validate=True, timeout=None):
+        """
+        Add or update many list members through batch operations, yielding
+        each batch, or the result of each of its operations, as it finishes.
+        Takes the same arguments as bulk_create_or_update.
+
+        Nothing is sent until the generator is consumed: the members are
+        read and their batches submitted as the finished ones are consumed,
+        so any iterable of members can be passed without keeping them all
+        in memory.
+
+        :returns: A generator of the finished batches, or of
+          (operation_id, status_code, response) tuples, in order
+        :rtype: :py:class:`types.GeneratorType`
+        """
+        for batch in self._bulk_create_or_update(list_id, members, chunk_size, max_pending, poll_interval,
+                                                 validate, timeout):
+            if not operation_results:
+                yield batch
+            elif batch is not None:
+                for result in Batches(self._mc_client).results(batch):
+                    yield result
+
+
+    def _bulk_create_or_update(self, list_id, members, chunk_size, max_pending, poll_interval, validate, timeout):
+        """
+        Submit the batches of iter_bulk_create_or_update and yield them once finished
+        """
+        self.list_id = list_id
+        self.subscriber_hash = None
+        batches = Batches(self._mc_client)
+        poller = BatchPoller(batches, min_interval=poll_interval,
+                             max_interval=max(poll_interval, BATCH_MAX_POLL_INTERVAL), max_rate=None)
+        codec = self._mc_client.codec
+        pending = deque()
+        for chunk in chunks(members, chunk_size):
+            operations = []
+            for member in chunk:
+                if validate:
+                    self._check_create_or_update(member)
+                subscriber_hash = get_subscriber_hash(member['email_address'])
+                operations.append({
+                    'method': 'PUT',
+                    'path': self._build_path(list_id, 'members', subscriber_hash),
+                    'operation_id': subscriber_hash,
+                    'body': codec.dumps(member).decode('utf-8'),
+                })
+            response = batches.create(data={'operations': operations})
+            if response is not None:
+                pending.append(poller.add(response['id']))
+            if len(pending) >= max_pending:
+                yield poller.result(pending.popleft(), timeout)
+        while pending:
+            yield poller.result(pending.popleft(), timeout)
+
+
+    def _check_create_or_update(self, data):
+        """
+        Check the request body of a member to add or update.
+
+        :param data: The request body parameters
+        :type data: :py:class:`dict`
+        """
         try:
             test = data['email_address']
         except KeyError as error:
@@ -175,7 +304,6 @@ class ListMembers(BaseApi):
         if data['status_if_new'] not in ['subscribed', 'unsubscribed', 'cleaned', 'pending']:
             raise ValueError('The list member status_if_new must be one of "subscribed", "unsubscribed", "cleaned", '
                              'or "pending"')
-        return self._mc_client._put(url=self._build_path(list_id, 'members', subscriber_hash), data=data)
 
 
     def delete(self, list_id, subscriber_hash):
@@ -9,26 +9,32 @@ from __future__ import unicode_literals
 
 import six
 import sys
+from collections import deque
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.listabusereports import ListAbuseReports
-from mailchimp3.entities.listactivity import ListActivity
-from mailchimp3.entities.listclients import ListClients
-from mailchimp3.entities.listgrowthhistory import ListGrowthHistory
-from mailchimp3.entities.listinterestcategories import ListInterestCategories
-from mailchimp3.entities.listmembers import ListMembers
-from mailchimp3.entities.listmergefields import ListMergeFields
-from mailchimp3.entities.listsegments import ListSegments
-from mailchimp3.entities.listsignupforms import ListSignupForms
-from mailchimp3.entities.listtwitterleadgenerationcards import ListTwitterLeadGenerationCards
-from mailchimp3.entities.listwebhooks import ListWebhooks
-from mailchimp3.helpers import check_email
+from concurrent.futures import ThreadPoolExecutor
+
+from mailchimp3.baseapi import BaseApi, LazyEndpoint, sync_only
+from mailchimp3.helpers import check_email, chunks
+from mailchimp3.validation import validate_members
+from mailchimp3.mailchimpclient import MAX_CONCURRENT_CONNECTIONS
 
 
 class Lists(BaseApi):
     """
     A MailChimp list is a powerful and flexible tool that helps you manage your contacts.
     """
+    abuse_reports = LazyEndpoint('mailchimp3.entities.listabusereports', 'ListAbuseReports')
+    activity = LazyEndpoint('mailchimp3.entities.listactivity', 'ListActivity')
+    clients = LazyEndpoint('mailchimp3.entities.listclients', 'ListClients')
+    growth_history = LazyEndpoint('mailchimp3.entities.listgrowthhistory', 'ListGrowthHistory')
+    interest_categories = LazyEndpoint('mailchimp3.entities.listinterestcategories', 'ListInterestCategories')
+    members = LazyEndpoint('mailchimp3.entities.listmembers', 'ListMembers')
+    merge_fields = LazyEndpoint('mailchimp3.entities.listmergefields', 'ListMergeFields')
+    segments = LazyEndpoint('mailchimp3.entities.listsegments', 'ListSegments')
+    signup_forms = LazyEndpoint('mailchimp3.entities.listsignupforms', 'ListSignupForms')
+    twitter_cards = LazyEndpoint('mailchimp3.entities.listtwitterleadgenerationcards', 'ListTwitterLeadGenerationCards')
+    webhooks = LazyEndpoint('mailchimp3.entities.listwebhooks', 'ListWebhooks')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -36,17 +42,6 @@ class Lists(BaseApi):
         super(Lists, self).__init__(*args, **kwargs)
         self.endpoint = 'lists'
         self.list_id = None
-        self.abuse_reports = ListAbuseReports(self)
-        self.activity = ListActivity(self)
-        self.clients = ListClients(self)
-        self.growth_history = ListGrowthHistory(self)
-        self.interest_categories = ListInterestCategories(self)
-        self.members = ListMembers(self)
-        self.merge_fields = ListMergeFields(self)
-        self.segments = ListSegments(self)
-        self.signup_forms = ListSignupForms(self)
-        self.twitter_cards = ListTwitterLeadGenerationCards(self)
-        self.webhooks = ListWebhooks(self)
 
 
     def create(self, data):
@@ -163,7 +158,7 @@ class Lists(BaseApi):
         return response
 
 
-    def update_members(self, list_id, data):
+    def update_members(self, list_id, data, validate=True):
         """
         Batch subscribe or unsubscribe list members.
 
@@ -188,6 +183,9 @@ class Lists(BaseApi):
             ],
             "update_existing": boolean*
         }
+        :param validate: Whether to check each member, which can be skipped
+          for members coming from a trusted source
+        :type validate: :py:class:`bool`
         """
         self.list_id = list_id
         try:
@@ -197,22 +195,8 @@ class Lists(BaseApi):
         except KeyError as error:
             new_msg = 'The update must have at least one member, {}'.format(error)
             six.reraise(KeyError, KeyError(new_msg), sys.exc_info()[2])
-        for member in data['members']:
-            try:
-                test = member['email_address']
-            except KeyError as error:
-                new_msg = 'Each list member must have an email_address, {}'.format(error)
-                six.reraise(KeyError, KeyError(new_msg), sys.exc_info()[2])
-            check_email(member['email_address'])
-            if 'status' not in member and 'status_if_new' not in member:
-                raise KeyError('Each list member must have either a status or a status_if_new')
-            valid_statuses = ['subscribed', 'unsubscribed', 'cleaned', 'pending']
-            if 'status' in member and member['status'] not in valid_statuses:
-                raise ValueError('The list member status must be one of "subscribed", "unsubscribed", "cleaned", or '
-                                 '"pending"')
-            if 'status_if_new' in member and member['status_if_new'] not in valid_statuses:
-                raise ValueError('The list member status_if_new must be one of "subscribed", "unsubscribed", '
-                                 '"cleaned", or "pending"')
+        if validate:
+            validate_members(data['members'])
         try:
             test = data['update_existing']
         except KeyError:
@@ -220,13 +204,93 @@ class Lists(BaseApi):
         return self._mc_client._post(url=self._build_path(list_id), data=data)
 
 
+    @sync_only
+    def bulk_update_members(self, list_id, members, update_existing=False, max_workers=MAX_CONCURRENT_CONNECTIONS,
+                            validate=True):
+        """
+        Batch subscribe or unsubscribe any number of list members.
+
+        The members are split into chunks of 500, the most update_members
+        accepts, which are submitted concurrently, within the limits of the
+        client's rate limiter, and the responses are aggregated into a single
+        summary with the same fields as the update_members response. The
+        members are consumed lazily, so any iterable can be passed.
+
+        Each chunk is validated before it is submitted, and no chunk is
+        submitted after an invalid member or a failed request. The exception
+        then raised has a `summary` attribute aggregating the responses of
+        the chunks that were applied; the members of the other chunks were
+        not, or their request failed.
+
+        :param list_id: The unique id for the list.
+        :type list_id: :py:class:`str`
+        :param members: The members, as in the members array of update_members
+        :type members: :py:class:`collections.Iterable`
+        :param update_existing: Whether to update the existing members
+        :type update_existing: :py:class:`bool`
+        :param max_workers: The number of chunks to submit concurrently
+        :type max_workers: :py:class:`int`
+        :param validate: Whether to check each member, see update_members
+        :type validate: :py:class:`bool`
+        :returns: The aggregated new_members, updated_members and errors
+        :rtype: :py:class:`dict`
+        """
+        self.list_id = list_id
+        def update(chunk):
+            return self.update_members(list_id, {'members': chunk, 'update_existing': update_existing}, False)
+        summary = {
+            'new_members': [],
+            'updated_members': [],
+            'errors': [],
+            'total_created': 0,
+            'total_updated': 0,
+            'error_count': 0,
+        }
+        def add(response):
+            if response is None:
+                return
+            summary['new_members'].extend(response.get('new_members', []))
+            summary['updated_members'].extend(response.get('updated_members', []))
+            summary['errors'].extend(response.get('errors', []))
+            summary['total_created'] += response.get('total_created', 0)
+            summary['total_updated'] += response.get('total_updated', 0)
+            summary['error_count'] += response.get('error_count', 0)
+        max_workers = min(max_workers or 1, MAX_CONCURRENT_CONNECTIONS)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = deque()
+        try:
+            for chunk in chunks(members, 500):
+                if validate:
+                    validate_members(chunk)
+                pending.append(executor.submit(update, chunk))
+                if len(pending) >= max_workers * 2:
+                    add(pending.popleft().result())
+            while pending:
+                add(pending.popleft().result())
+        except Exception as error:
+            # The chunks already submitted are still applied, unless they
+            # have not started yet
+            for future in pending:
+                future.cancel()
+            for future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    add(future.result())
+            error.summary = summary
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        return summary
+
+
     def all(self, get_all=False, **queryparams):
         """
         Get information about all lists in the account.
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -241,6 +305,7 @@ class Lists(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
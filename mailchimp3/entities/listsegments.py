@@ -10,8 +10,7 @@ from __future__ import unicode_literals
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.listsegmentmembers import ListSegmentMembers
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class ListSegments(BaseApi):
@@ -20,6 +19,8 @@ class ListSegments(BaseApi):
     your list that includes only those subscribers who share specific common
     field information.
     """
+    members = LazyEndpoint('mailchimp3.entities.listsegmentmembers', 'ListSegmentMembers')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -28,7 +29,6 @@ class ListSegments(BaseApi):
         self.endpoint = 'lists'
         self.list_id = None
         self.segment_id = None
-        self.members = ListSegmentMembers(self)
 
 
     def create(self, list_id, data):
@@ -65,7 +65,9 @@ class ListSegments(BaseApi):
         :type list_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -81,6 +83,7 @@ class ListSegments(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(list_id, 'segments'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(list_id, 'segments'), **queryparams)
 
 
@@ -7,14 +7,15 @@ Schema: https://api.mailchimp.com/schema/3.0/Reports/ClickDetails/Instance.json
 """
 from __future__ import unicode_literals
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.reportclickdetailmembers import ReportClickDetailMembers
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class ReportClickDetailReports(BaseApi):
     """
     Get detailed information about links clicked in campaigns.
     """
+    members = LazyEndpoint('mailchimp3.entities.reportclickdetailmembers', 'ReportClickDetailMembers')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -23,7 +24,6 @@ class ReportClickDetailReports(BaseApi):
         self.endpoint = 'reports'
         self.campaign_id = None
         self.link_id = None
-        self.members = ReportClickDetailMembers(self)
 
 
     def all(self, campaign_id, get_all=False, **queryparams):
@@ -35,7 +35,9 @@ class ReportClickDetailReports(BaseApi):
         :type campaign_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -46,6 +48,7 @@ class ReportClickDetailReports(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(campaign_id, 'click-details'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(campaign_id, 'click-details'), **queryparams)
 
 
@@ -7,17 +7,7 @@ Schema: https://api.mailchimp.com/schema/3.0/Reports/Instance.json
 """
 from __future__ import unicode_literals
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.reportcampaignabusereports import ReportCampaignAbuseReports
-from mailchimp3.entities.reportcampaignadvice import ReportCampaignAdvice
-from mailchimp3.entities.reportclickdetailreports import ReportClickDetailReports
-from mailchimp3.entities.reportdomainperformance import ReportDomainPerformance
-from mailchimp3.entities.reporteepurl import ReportEepURL
-from mailchimp3.entities.reportemailactivity import ReportEmailActivity
-from mailchimp3.entities.reportlocations import ReportLocations
-from mailchimp3.entities.reportsentto import ReportSentTo
-from mailchimp3.entities.reportsubreports import ReportSubReports
-from mailchimp3.entities.reportunsubscribes import ReportUnsubscribes
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class Reports(BaseApi):
@@ -26,6 +16,17 @@ class Reports(BaseApi):
     are read-only. MailChimp’s campaign and Automation reports analyze clicks,
     opens, subscribers’ social activity, e-commerce data, and more.
     """
+    abuse_reports = LazyEndpoint('mailchimp3.entities.reportcampaignabusereports', 'ReportCampaignAbuseReports')
+    advice = LazyEndpoint('mailchimp3.entities.reportcampaignadvice', 'ReportCampaignAdvice')
+    click_details = LazyEndpoint('mailchimp3.entities.reportclickdetailreports', 'ReportClickDetailReports')
+    domain_performance = LazyEndpoint('mailchimp3.entities.reportdomainperformance', 'ReportDomainPerformance')
+    eepurl = LazyEndpoint('mailchimp3.entities.reporteepurl', 'ReportEepURL')
+    email_activity = LazyEndpoint('mailchimp3.entities.reportemailactivity', 'ReportEmailActivity')
+    locations = LazyEndpoint('mailchimp3.entities.reportlocations', 'ReportLocations')
+    sent_to = LazyEndpoint('mailchimp3.entities.reportsentto', 'ReportSentTo')
+    subreports = LazyEndpoint('mailchimp3.entities.reportsubreports', 'ReportSubReports')
+    unsubscribes = LazyEndpoint('mailchimp3.entities.reportunsubscribes', 'ReportUnsubscribes')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -33,16 +34,6 @@ class Reports(BaseApi):
         super(Reports, self).__init__(*args, **kwargs)
         self.endpoint = 'reports'
         self.campaign_id = None
-        self.abuse_reports = ReportCampaignAbuseReports(self)
-        self.advice = ReportCampaignAdvice(self)
-        self.click_details = ReportClickDetailReports(self)
-        self.domain_performance = ReportDomainPerformance(self)
-        self.eepurl = ReportEepURL(self)
-        self.email_activity = ReportEmailActivity(self)
-        self.locations = ReportLocations(self)
-        self.sent_to = ReportSentTo(self)
-        self.subreports = ReportSubReports(self)
-        self.unsubscribes = ReportUnsubscribes(self)
 
 
     def all(self, get_all=False, **queryparams):
@@ -51,7 +42,9 @@ class Reports(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -64,6 +57,7 @@ class Reports(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
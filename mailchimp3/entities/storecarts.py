@@ -11,8 +11,7 @@ import re
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.storecartlines import StoreCartLines
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class StoreCarts(BaseApi):
@@ -21,6 +20,8 @@ class StoreCarts(BaseApi):
     used to create an Abandoned Cart workflow, or to save a consumer’s
     shopping cart pending a successful Order.
     """
+    lines = LazyEndpoint('mailchimp3.entities.storecartlines', 'StoreCartLines')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -29,7 +30,6 @@ class StoreCarts(BaseApi):
         self.endpoint = 'ecommerce/stores'
         self.store_id = None
         self.cart_id = None
-        self.lines = StoreCartLines(self)
 
 
     def create(self, store_id, data):
@@ -135,7 +135,9 @@ class StoreCarts(BaseApi):
         :type store_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -146,6 +148,7 @@ class StoreCarts(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(store_id, 'carts'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(store_id, 'carts'), **queryparams)
 
 
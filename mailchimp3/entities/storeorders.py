@@ -11,8 +11,7 @@ import re
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.storeorderlines import StoreOrderLines
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class StoreOrders(BaseApi):
@@ -22,6 +21,8 @@ class StoreOrders(BaseApi):
     personalize emails to your targeted consumers, and view other e-commerce
     data in your MailChimp account.
     """
+    lines = LazyEndpoint('mailchimp3.entities.storeorderlines', 'StoreOrderLines')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -30,7 +31,6 @@ class StoreOrders(BaseApi):
         self.endpoint = 'ecommerce/stores'
         self.store_id = None
         self.order_id = None
-        self.lines = StoreOrderLines(self)
 
 
     def create(self, store_id, data):
@@ -136,7 +136,9 @@ class StoreOrders(BaseApi):
         :type store_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -148,6 +150,7 @@ class StoreOrders(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(store_id, 'orders'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(store_id, 'orders'), **queryparams)
 
 
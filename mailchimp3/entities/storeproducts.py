@@ -10,8 +10,7 @@ from __future__ import unicode_literals
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.storeproductvariants import StoreProductVariants
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class StoreProducts(BaseApi):
@@ -20,6 +19,8 @@ class StoreProducts(BaseApi):
     you can add the items to a Cart or an Order. Each Product requires at
     least one Product Variant.
     """
+    variants = LazyEndpoint('mailchimp3.entities.storeproductvariants', 'StoreProductVariants')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -28,7 +29,6 @@ class StoreProducts(BaseApi):
         self.endpoint = 'ecommerce/stores'
         self.store_id = None
         self.product_id = None
-        self.variants = StoreProductVariants(self)
 
 
     def create(self, store_id, data):
@@ -94,7 +94,9 @@ class StoreProducts(BaseApi):
         :type store_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -105,6 +107,7 @@ class StoreProducts(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(store_id, 'products'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(store_id, 'products'), **queryparams)
 
 
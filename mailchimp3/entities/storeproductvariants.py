@@ -75,7 +75,9 @@ class StoreProductVariants(BaseApi):
         :type product_id: :py:class:`str`
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -87,6 +89,7 @@ class StoreProductVariants(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(store_id, 'products', product_id, 'variants'), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._post(url=self._build_path(store_id, 'products', product_id, 'variants'), **queryparams)
 
 
@@ -11,11 +11,7 @@ import re
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.storecarts import StoreCarts
-from mailchimp3.entities.storecustomers import StoreCustomers
-from mailchimp3.entities.storeorders import StoreOrders
-from mailchimp3.entities.storeproducts import StoreProducts
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class Stores(BaseApi):
@@ -24,6 +20,11 @@ class Stores(BaseApi):
     reporting and personalization features and to learn more about your
     customers.
     """
+    carts = LazyEndpoint('mailchimp3.entities.storecarts', 'StoreCarts')
+    customers = LazyEndpoint('mailchimp3.entities.storecustomers', 'StoreCustomers')
+    orders = LazyEndpoint('mailchimp3.entities.storeorders', 'StoreOrders')
+    products = LazyEndpoint('mailchimp3.entities.storeproducts', 'StoreProducts')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -31,10 +32,6 @@ class Stores(BaseApi):
         super(Stores, self).__init__(*args, **kwargs)
         self.endpoint = 'ecommerce/stores'
         self.store_id = None
-        self.carts = StoreCarts(self)
-        self.customers = StoreCustomers(self)
-        self.orders = StoreOrders(self)
-        self.products = StoreProducts(self)
 
     def create(self, data):
         """
@@ -90,7 +87,9 @@ class Stores(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -100,6 +99,7 @@ class Stores(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
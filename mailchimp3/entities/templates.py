@@ -10,8 +10,7 @@ from __future__ import unicode_literals
 import six
 import sys
 
-from mailchimp3.baseapi import BaseApi
-from mailchimp3.entities.templatedefaultcontent import TemplateDefaultContent
+from mailchimp3.baseapi import BaseApi, LazyEndpoint
 
 
 class Templates(BaseApi):
@@ -19,6 +18,8 @@ class Templates(BaseApi):
     Manage your MailChimp templates. A template is an HTML file used to create
     the layout and basic design for a campaign.
     """
+    default_content = LazyEndpoint('mailchimp3.entities.templatedefaultcontent', 'TemplateDefaultContent')
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the endpoint
@@ -26,7 +27,6 @@ class Templates(BaseApi):
         super(Templates, self).__init__(*args, **kwargs)
         self.endpoint = 'templates'
         self.template_id = None
-        self.default_content = TemplateDefaultContent(self)
 
 
     def create(self, data):
@@ -65,7 +65,9 @@ class Templates(BaseApi):
 
         :param get_all: Should the query get all results
         :type get_all: :py:class:`bool`
-        :param queryparams: The query string parameters
+        :param queryparams: The query string parameters, and with get_all the
+          max_workers, stream, checkpoint, attributes and links arguments,
+          see :py:meth:`mailchimp3.baseapi.BaseApi.iter_all`
         queryparams['fields'] = []
         queryparams['exclude_fields'] = []
         queryparams['count'] = integer
@@ -80,6 +82,7 @@ class Templates(BaseApi):
         if get_all:
             return self._iterate(url=self._build_path(), **queryparams)
         else:
+            self._check_queryparams(queryparams)
             return self._mc_client._get(url=self._build_path(), **queryparams)
 
 
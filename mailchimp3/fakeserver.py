@@ -0,0 +1,610 @@
+# coding=utf-8
+"""
+In-process fake of the Mailchimp v3 API
+
+:py:class:`FakeMailChimpServer` keeps lists, members, batch operations,
+e-commerce stores and reports in memory, and :py:class:`FakeTransport`
+sends the requests of a client to it instead of the network, with
+configurable latency, errors and rate limiting, so that code using the
+client can be exercised and measured reproducibly offline:
+
+    server = FakeMailChimpServer()
+    list_id = server.add_list()
+    server.add_members(list_id, 10000)
+    client = MailChimp('user', 'key-us1', transport=FakeTransport(server, latency=0.05))
+    members = client.lists.members.all(list_id, get_all=True, max_workers=5)
+
+Collections that are not modeled specifically, such as reports, behave as
+plain collections of records that can be seeded with :py:meth:`add`.
+"""
+from __future__ import unicode_literals
+
+import datetime
+import hashlib
+import io
+import itertools
+import json
+import random
+import tarfile
+import threading
+import time
+import uuid
+import zlib
+
+import requests
+from six.moves.http_client import responses as reasons
+from six.moves.urllib.parse import parse_qsl, urlparse
+
+from mailchimp3.projection import collection_key
+from mailchimp3.transport import RequestsTransport, build_response, decode_body, get_header
+
+# The collections that exist before any record is added to them
+COLLECTIONS = frozenset([
+    'automations', 'batches', 'campaigns', 'carts', 'click-details', 'customers', 'email-activity',
+    'interest-categories', 'interests', 'lines', 'lists', 'members', 'merge-fields', 'orders',
+    'products', 'reports', 'segments', 'stores', 'templates', 'variants',
+])
+# The field holding the id of the records of each kind of collection
+ID_FIELDS = {
+    'email-activity': 'email_id',
+    'interest-categories': 'id',
+    'merge-fields': 'merge_id',
+}
+# The host serving the results of the batch operations
+BATCH_RESULTS_URL = 'https://fake-mailchimp.invalid/batch-results/{}.tar.gz'
+# The root of the API in the links of the records
+API_URL = 'https://fake-mailchimp.invalid/3.0/'
+# The relations, methods and schemas of the links of each record
+RECORD_LINKS = (
+    ('self', 'GET', 'Instance'),
+    ('parent', 'GET', 'Collection'),
+    ('update', 'PATCH', 'Instance'),
+    ('upsert', 'PUT', 'Instance'),
+    ('delete', 'DELETE', None),
+)
+
+
+def _now():
+    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + '+00:00'
+
+
+def _public(record, path):
+    """
+    Copy a record of a collection as it is returned, without its private
+    fields and with its links
+    """
+    public = dict((key, value) for key, value in record.items() if not key.startswith('_'))
+    href = '{}{}/{}'.format(API_URL, path, record[FakeMailChimpServer._id_field(path)])
+    schema = 'https://fake-mailchimp.invalid/schema/3.0/{}/{}.json'
+    public['_links'] = [
+        dict({'rel': rel, 'href': href if rel != 'parent' else API_URL + path, 'method': method},
+             **({'targetSchema': schema.format(path.rpartition('/')[2], kind)} if kind else {}))
+        for rel, method, kind in RECORD_LINKS
+    ]
+    return public
+
+
+def _project(body, queryparams):
+    """
+    Keep the fields of a response named by the fields query parameter, then
+    remove the ones named by exclude_fields
+    """
+    if queryparams.get('fields'):
+        body = _select(body, [field.split('.') for field in queryparams['fields'].split(',')])
+    if queryparams.get('exclude_fields'):
+        body = _exclude(body, [field.split('.') for field in queryparams['exclude_fields'].split(',')])
+    return body
+
+
+def _select(value, paths):
+    if isinstance(value, list):
+        return [_select(item, paths) for item in value]
+    if not isinstance(value, dict) or any(not path for path in paths):
+        return value
+    selected = {}
+    for key in value:
+        below = [path[1:] for path in paths if path[0] == key]
+        if below:
+            selected[key] = _select(value[key], below)
+    return selected
+
+
+def _exclude(value, paths):
+    if isinstance(value, list):
+        return [_exclude(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+    excluded = {}
+    for key in value:
+        below = [path[1:] for path in paths if path[0] == key]
+        if any(not path for path in below):
+            continue
+        excluded[key] = _exclude(value[key], below) if below else value[key]
+    return excluded
+
+
+def _error(status, title, detail):
+    return status, {'type': 'about:blank', 'title': title, 'status': status, 'detail': detail}
+
+
+class FakeMailChimpServer(object):
+    """
+    The state and routes of a fake Mailchimp API, safe to share between
+    threads.
+
+    Reads honour the fields and exclude_fields query parameters. Every
+    request is answered synchronously, except batch operations: they
+    are applied when created but reported as started, with a number of
+    finished operations growing over `batch_duration` seconds, until they
+    are finished.
+    """
+    def __init__(self, batch_duration=0.0):
+        """
+        Initialize the server
+
+        :param batch_duration: The number of seconds a batch operation takes
+          to finish
+        :type batch_duration: :py:class:`float`
+        """
+        super(FakeMailChimpServer, self).__init__()
+        self.batch_duration = batch_duration
+        self._collections = {}
+        self._batch_results = {}
+        self._counter = itertools.count(1)
+        self._lock = threading.RLock()
+
+
+    def add(self, path, records):
+        """
+        Add records to a collection, such as 'reports/abc123/email-activity'
+
+        :param path: The path of the collection
+        :type path: :py:class:`str`
+        :param records: The records, with or without ids
+        :type records: :py:class:`collections.Iterable`
+        :returns: The ids of the records
+        :rtype: :py:class:`list`
+        """
+        path = path.strip('/')
+        with self._lock:
+            collection = self._collections.setdefault(path, {})
+            ids = []
+            for record in records:
+                record = self._new_record(path, dict(record))
+                collection[record[self._id_field(path)]] = record
+                ids.append(record[self._id_field(path)])
+            return ids
+
+
+    def add_list(self, name='Fake list', **fields):
+        """
+        Add a list
+
+        :returns: The id of the list
+        :rtype: :py:class:`str`
+        """
+        fields.setdefault('name', name)
+        return self.add('lists', [fields])[0]
+
+
+    def add_members(self, list_id, count, status='subscribed'):
+        """
+        Add members with generated email addresses to a list
+
+        :returns: The subscriber hashes of the members
+        :rtype: :py:class:`list`
+        """
+        start = next(self._counter)
+        return self.add('lists/{}/members'.format(list_id), (
+            {'email_address': 'member{}.{}@example.com'.format(start, i), 'status': status}
+            for i in range(count)
+        ))
+
+
+    def records(self, path):
+        """
+        Get the records of a collection
+
+        :param path: The path of the collection
+        :type path: :py:class:`str`
+        :rtype: :py:class:`list`
+        """
+        with self._lock:
+            return list(self._collections.get(path.strip('/'), {}).values())
+
+
+    def handle(self, method, path, queryparams=None, body=None):
+        """
+        Answer a request
+
+        :param method: The HTTP method
+        :type method: :py:class:`str`
+        :param path: The path of the request, relative to the API root
+        :type path: :py:class:`str`
+        :param queryparams: The query string parameters
+        :type queryparams: :py:class:`dict`
+        :param body: The decoded JSON body of the request
+        :type body: :py:class:`dict`
+        :returns: The status and the body of the response, None for no body
+        :rtype: :py:class:`tuple`
+        """
+        path = path.strip('/')
+        queryparams = queryparams or {}
+        method = method.upper()
+        with self._lock:
+            if path == '':
+                if method != 'GET':
+                    return _error(405, 'Method Not Allowed', 'The requested method is not allowed.')
+                return 200, {'account_id': 'fake', 'account_name': 'Fake account',
+                             'total_subscribers': sum(len(records) for key, records in self._collections.items()
+                                                      if key.endswith('/members'))}
+            if path == 'batches' and method == 'POST':
+                return self._create_batch(body or {})
+            if path.startswith('batches/') and method == 'GET':
+                return self._get_batch(path.split('/', 1)[1])
+            if self._is_collection(path):
+                if method == 'GET':
+                    return self._list(path, queryparams)
+                if method == 'POST':
+                    return self._create(path, body or {})
+                return _error(405, 'Method Not Allowed', 'The requested method is not allowed.')
+            parent, _, record_id = path.rpartition('/')
+            if self._is_collection(parent):
+                if method == 'GET':
+                    return self._get(parent, record_id, queryparams)
+                if method == 'PATCH':
+                    return self._update(parent, record_id, body or {})
+                if method == 'PUT':
+                    return self._create_or_update(parent, record_id, body or {})
+                if method == 'DELETE':
+                    return self._delete(parent, record_id)
+                if method == 'POST' and parent == 'lists':
+                    return self._update_members(record_id, body or {})
+                return _error(405, 'Method Not Allowed', 'The requested method is not allowed.')
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+
+
+    def batch_results(self, batch_id):
+        """
+        Get the gzipped tar archive of the results of a finished batch
+
+        :rtype: :py:class:`bytes`
+        """
+        with self._lock:
+            return self._batch_results.get(batch_id)
+
+
+    def _is_collection(self, path):
+        return path in self._collections or path.rpartition('/')[2] in COLLECTIONS
+
+
+    @staticmethod
+    def _id_field(path):
+        return ID_FIELDS.get(path.rpartition('/')[2], 'id')
+
+
+    def _new_record(self, path, record):
+        """
+        Fill in the generated fields of a new record
+        """
+        id_field = self._id_field(path)
+        if path.endswith('/members'):
+            email = record.get('email_address', '')
+            record['id'] = hashlib.md5(email.lower().encode('utf-8')).hexdigest()
+            record.setdefault('status', record.pop('status_if_new', 'subscribed'))
+            record['list_id'] = path.split('/')[1]
+        elif id_field not in record:
+            record[id_field] = uuid.uuid4().hex[:10]
+        record['last_changed'] = _now()
+        return record
+
+
+    def _parent_exists(self, path):
+        """
+        Check that the record a nested collection belongs to exists
+        """
+        parent, _, record_id = path.rpartition('/')[0].rpartition('/')
+        if parent not in self._collections:
+            return True  # Not nested, e.g. ecommerce/stores, or the parent is not modeled
+        return record_id in self._collections[parent]
+
+
+    def _list(self, path, queryparams):
+        if not self._parent_exists(path):
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        records = list(self._collections.get(path, {}).values())
+        if 'status' in queryparams:
+            records = [record for record in records if record.get('status') == queryparams['status']]
+        if 'since_last_changed' in queryparams:
+            records = [record for record in records
+                       if record.get('last_changed', '') >= queryparams['since_last_changed']]
+        offset = int(queryparams.get('offset', 0))
+        count = int(queryparams.get('count', 10))
+        page = [_public(record, path) for record in records[offset:offset + count]]
+        links = [{'rel': 'self', 'href': API_URL + path, 'method': 'GET'}]
+        return 200, _project({collection_key(path): page, 'total_items': len(records), '_links': links}, queryparams)
+
+
+    def _get(self, path, record_id, queryparams):
+        record = self._collections.get(path, {}).get(record_id)
+        if record is None:
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        return 200, _project(_public(record, path), queryparams)
+
+
+    def _create(self, path, body):
+        if not self._parent_exists(path):
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        record = self._new_record(path, dict(body))
+        collection = self._collections.setdefault(path, {})
+        record_id = record[self._id_field(path)]
+        if record_id in collection:
+            return _error(400, 'Member Exists', '{} is already a list member.'.format(body.get('email_address')))
+        collection[record_id] = record
+        return 200, _public(record, path)
+
+
+    def _update(self, path, record_id, body):
+        record = self._collections.get(path, {}).get(record_id)
+        if record is None:
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        record.update(body)
+        record['last_changed'] = _now()
+        return 200, _public(record, path)
+
+
+    def _create_or_update(self, path, record_id, body):
+        if record_id in self._collections.get(path, {}):
+            body = dict(body)
+            body.pop('status_if_new', None)
+            return self._update(path, record_id, body)
+        status, record = self._create(path, body)
+        if status == 200 and record['id'] != record_id and path.endswith('/members'):
+            del self._collections[path][record['id']]
+            return _error(400, 'Invalid Resource', 'The email address does not match the subscriber hash.')
+        return status, record
+
+
+    def _delete(self, path, record_id):
+        collection = self._collections.get(path, {})
+        if record_id not in collection:
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        del collection[record_id]
+        prefix = '{}/{}/'.format(path, record_id)
+        for key in [key for key in self._collections if key.startswith(prefix)]:
+            del self._collections[key]
+        return 204, None
+
+
+    def _update_members(self, list_id, body):
+        """
+        Batch subscribe or unsubscribe members, as Lists.update_members
+        """
+        if list_id not in self._collections.get('lists', {}):
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        path = 'lists/{}/members'.format(list_id)
+        summary = {'new_members': [], 'updated_members': [], 'errors': []}
+        for member in body.get('members', []):
+            email = member.get('email_address', '')
+            subscriber_hash = hashlib.md5(email.lower().encode('utf-8')).hexdigest()
+            exists = subscriber_hash in self._collections.get(path, {})
+            if exists and not body.get('update_existing'):
+                summary['errors'].append({'email_address': email, 'error': '{} is already a list member'.format(email)})
+            elif exists:
+                summary['updated_members'].append(self._update(path, subscriber_hash, member)[1])
+            else:
+                summary['new_members'].append(self._create(path, member)[1])
+        summary.update(total_created=len(summary['new_members']), total_updated=len(summary['updated_members']),
+                       error_count=len(summary['errors']))
+        return 200, summary
+
+
+    def _create_batch(self, body):
+        """
+        Apply the operations of a batch and record their results
+        """
+        operations = body.get('operations')
+        if not isinstance(operations, list):
+            return _error(400, 'Invalid Resource', 'The batch must have a list of operations.')
+        results = []
+        errored = 0
+        for operation in operations:
+            params = operation.get('params') or {}
+            data = json.loads(operation['body']) if operation.get('body') else None
+            status, response = self.handle(operation.get('method', 'GET'), operation.get('path', ''), params, data)
+            errored += status >= 400
+            results.append({
+                'status_code': status,
+                'operation_id': operation.get('operation_id'),
+                'response': json.dumps(response) if response is not None else '',
+            })
+        batch_id = uuid.uuid4().hex[:10]
+        self._batch_results[batch_id] = self._archive(batch_id, results)
+        batch = {
+            'id': batch_id,
+            'status': 'pending',
+            'total_operations': len(operations),
+            'finished_operations': 0,
+            'errored_operations': errored,
+            'submitted_at': _now(),
+            'completed_at': '',
+            'response_body_url': '',
+            '_started': time.time(),
+        }
+        self._collections.setdefault('batches', {})[batch_id] = batch
+        return self._get_batch(batch_id)
+
+
+    def _get_batch(self, batch_id):
+        batch = self._collections.get('batches', {}).get(batch_id)
+        if batch is None:
+            return _error(404, 'Resource Not Found', 'The requested resource could not be found.')
+        if batch['status'] != 'finished':
+            elapsed = time.time() - batch['_started']
+            if elapsed >= self.batch_duration:
+                batch.update(status='finished', finished_operations=batch['total_operations'],
+                             completed_at=_now(), response_body_url=BATCH_RESULTS_URL.format(batch_id))
+            else:
+                batch.update(status='started',
+                             finished_operations=int(batch['total_operations'] * elapsed / self.batch_duration))
+        return 200, _public(batch, 'batches')
+
+
+    @staticmethod
+    def _archive(batch_id, results):
+        """
+        Pack the results of a batch as Mailchimp does, in a gzipped tar
+        archive of JSON files
+        """
+        content = json.dumps(results).encode('utf-8')
+        buf = io.BytesIO()
+        with tarfile.open(fileobj=buf, mode='w:gz') as archive:
+            info = tarfile.TarInfo('{}/{}.json'.format(batch_id, batch_id))
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+        return buf.getvalue()
+
+
+class FakeTransport(object):
+    """
+    Transport sending the requests of a client to a
+    :py:class:`FakeMailChimpServer`.
+
+    Each request waits for `latency` seconds, plus up to `jitter` seconds,
+    before it is answered, without holding the GIL, so concurrent requests
+    overlap as they would over the network. A share `error_rate` of the
+    requests fails with `error_status`, or with a connection error if it is
+    None. Requests beyond `max_concurrent` in flight, or beyond `rate` per
+    second, are answered with a 429 and a Retry-After header. Request bodies
+    compressed with gzip are decompressed, and responses are compressed
+    with gzip when the request accepts it, with a Content-Length giving
+    their compressed size.
+    """
+    EXCEPTIONS = RequestsTransport.EXCEPTIONS
+
+    def __init__(self, server=None, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503,
+                 max_concurrent=None, rate=None, retry_after=1, seed=None):
+        """
+        Initialize the transport
+
+        :param server: The fake server, a new empty one by default
+        :type server: :py:class:`FakeMailChimpServer`
+        :param latency: The number of seconds each request takes
+        :type latency: :py:class:`float`
+        :param jitter: The maximum number of seconds added at random to the
+          latency
+        :type jitter: :py:class:`float`
+        :param error_rate: The share of the requests that fail, between 0
+          and 1
+        :type error_rate: :py:class:`float`
+        :param error_status: The status of the failed requests, or None to
+          raise a connection error
+        :type error_status: :py:class:`int`
+        :param max_concurrent: The number of requests in flight past which
+          the next ones are throttled, unlimited if None
+        :type max_concurrent: :py:class:`int`
+        :param rate: The number of requests per second past which the next
+          ones are throttled, unlimited if None
+        :type rate: :py:class:`float`
+        :param retry_after: The value of the Retry-After header of the 429
+          responses
+        :type retry_after: :py:class:`float`
+        :param seed: The seed of the random jitter and errors, for
+          reproducible runs
+        :type seed: :py:class:`int`
+        """
+        super(FakeTransport, self).__init__()
+        self.server = server if server is not None else FakeMailChimpServer()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.retry_after = retry_after
+        self.requests = 0
+        self.throttled = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._in_flight = 0
+        self._window = []
+        self._lock = threading.Lock()
+
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request to the fake server, see
+        :py:meth:`requests.Session.request`
+
+        :rtype: :py:class:`requests.Response`
+        """
+        with self._lock:
+            self.requests += 1
+            now = time.time()
+            if self.rate is not None:
+                self._window = [sent for sent in self._window if sent > now - 1.0]
+            throttled = ((self.max_concurrent is not None and self._in_flight >= self.max_concurrent) or
+                         (self.rate is not None and len(self._window) >= self.rate))
+            if throttled:
+                self.throttled += 1
+            else:
+                self._in_flight += 1
+                if self.rate is not None:
+                    self._window.append(now)
+            failed = not throttled and self._random.random() < self.error_rate
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if throttled:
+            return self._response(method, url, *_error(429, 'Too Many Requests',
+                                                        'You have exceeded the limit of simultaneous connections.'),
+                                  headers={'Retry-After': str(self.retry_after)})
+        try:
+            if delay:
+                time.sleep(delay)
+            if failed:
+                with self._lock:
+                    self.errors += 1
+                if self.error_status is None:
+                    raise requests.exceptions.ConnectionError('Injected connection error')
+                return self._response(method, url, *_error(self.error_status, reasons.get(self.error_status, ''),
+                                                            'Injected error.'))
+            parsed = urlparse(url)
+            if parsed.path.startswith('/batch-results/'):
+                content = self.server.batch_results(parsed.path.rsplit('/', 1)[1].split('.')[0])
+                if content is None:
+                    return self._response(method, url, *_error(404, 'Not Found', 'No such batch results.'))
+                response = build_response(method, url, 200, {'Content-Type': 'application/x-gzip'}, content, 'OK')
+                response.raw = io.BytesIO(content)
+                return response
+            path = parsed.path.split('/3.0/', 1)[-1]
+            body = kwargs.get('json')
+            if body is None and kwargs.get('data'):
+                data = kwargs['data']
+                data = decode_body(data, kwargs.get('headers'))
+                body = json.loads(data.decode('utf-8') if isinstance(data, bytes) else data)
+            status, body = self.server.handle(method, path, dict(parse_qsl(parsed.query)), body)
+            compress = 'gzip' in (get_header(kwargs.get('headers'), 'Accept-Encoding') or '')
+            return self._response(method, url, status, body, compress=compress)
+        finally:
+            if not throttled:
+                with self._lock:
+                    self._in_flight -= 1
+
+
+    def close(self):
+        """
+        Nothing to release
+        """
+
+
+    @staticmethod
+    def _response(method, url, status, body, headers=None, compress=False):
+        content = json.dumps(body).encode('utf-8') if body is not None else b''
+        response_headers = {'Content-Type': 'application/json'} if body is not None else {}
+        if compress and content:
+            # The content stays decoded, as requests exposes it
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            response_headers['Content-Encoding'] = 'gzip'
+            response_headers['Content-Length'] = str(len(compressor.compress(content) + compressor.flush()))
+        response_headers.update(headers or {})
+        return build_response(method, url, status, response_headers, content, reasons.get(status, ''))
+
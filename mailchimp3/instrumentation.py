@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+Events sent to the hooks of a client around each request
+
+A hook is a function called with a :py:class:`RequestEvent` before each
+attempt to send a request, or with a :py:class:`ResponseEvent` once the
+attempt got a response or failed:
+
+    def log_slow_requests(event):
+        if event.elapsed > 1:
+            print(event.method, event.path, event.status_code, event.elapsed)
+
+    client.add_hook('response', log_slow_requests)
+
+The path of the events is templated, e.g. 'lists/{list_id}/members', so
+that the requests to the same endpoint can be aggregated. The sizes of the
+bodies are given uncompressed, in `request_bytes` and `response_bytes`, and
+as they went over the wire, in `request_wire_bytes` and
+`response_wire_bytes`, headers excluded.
+"""
+from __future__ import unicode_literals
+
+from collections import namedtuple
+
+RequestEvent = namedtuple('RequestEvent', ['method', 'path', 'url', 'attempt'])
+ResponseEvent = namedtuple('ResponseEvent', [
+    'method', 'path', 'url', 'attempt', 'status_code', 'request_bytes', 'response_bytes', 'request_wire_bytes',
+    'response_wire_bytes', 'elapsed', 'error',
+])
+
+# The name of the id that follows each collection in a path
+ID_NAMES = {
+    'abuse-reports': 'report_id',
+    'authorized-apps': 'app_id',
+    'automations': 'workflow_id',
+    'batch-webhooks': 'batch_webhook_id',
+    'batches': 'batch_id',
+    'campaign-folders': 'folder_id',
+    'campaigns': 'campaign_id',
+    'carts': 'cart_id',
+    'click-details': 'link_id',
+    'conversations': 'conversation_id',
+    'customers': 'customer_id',
+    'email-activity': 'subscriber_hash',
+    'emails': 'workflow_email_id',
+    'feedback': 'feedback_id',
+    'files': 'file_id',
+    'folders': 'folder_id',
+    'growth-history': 'month',
+    'interest-categories': 'interest_category_id',
+    'interests': 'interest_id',
+    'lines': 'line_id',
+    'lists': 'list_id',
+    'members': 'subscriber_hash',
+    'merge-fields': 'merge_id',
+    'messages': 'message_id',
+    'notes': 'note_id',
+    'orders': 'order_id',
+    'products': 'product_id',
+    'queue': 'subscriber_hash',
+    'removed-subscribers': 'subscriber_hash',
+    'reports': 'campaign_id',
+    'segments': 'segment_id',
+    'sent-to': 'subscriber_hash',
+    'stores': 'store_id',
+    'template-folders': 'folder_id',
+    'templates': 'template_id',
+    'unsubscribed': 'subscriber_hash',
+    'variants': 'variant_id',
+    'webhooks': 'webhook_id',
+}
+
+
+def template_path(path):
+    """
+    Replace the ids in the path of a request with the names of the
+    parameters they stand for, e.g. 'lists/123456/members' becomes
+    'lists/{list_id}/members'
+
+    :param path: The path of the request relative to the API root, without
+      query string
+    :type path: :py:class:`str`
+    :rtype: :py:class:`str`
+    """
+    segments = path.strip('/').split('/')
+    for i in range(1, len(segments)):
+        previous = segments[i - 1]
+        if previous in ID_NAMES and segments[i] not in ID_NAMES:
+            segments[i] = '{' + ID_NAMES[previous] + '}'
+    return '/'.join(segments)
@@ -6,9 +6,14 @@ Documentation: http://developer.mailchimp.com/documentation/mailchimp/
 """
 from __future__ import unicode_literals
 import functools
+import hashlib
+import sys
+import time
 
 import requests
+import six
 from requests.auth import HTTPBasicAuth
+from requests.packages.urllib3.response import HTTPResponse
 # Handle library reorganisation Python 2 > Python 3.
 try:
     from urllib.parse import urljoin
@@ -17,6 +22,13 @@ except ImportError:
     from urlparse import urljoin
     from urllib import urlencode
 
+from mailchimp3.codec import default_codec
+from mailchimp3.instrumentation import RequestEvent, ResponseEvent, template_path
+from mailchimp3.ratelimit import RateLimiter, parse_retry_after
+from mailchimp3.retry import RetryPolicy
+from mailchimp3.transport import (ACCEPT_ENCODING, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE,
+                                  MAX_CONCURRENT_CONNECTIONS, RequestsTransport, body_size, encode_body)
+
 
 def _enabled_or_noop(fn):
     @functools.wraps(fn)
@@ -26,29 +38,287 @@ def _enabled_or_noop(fn):
     return wrapper
 
 
+def _request_bytes(response, kwargs):
+    """
+    Get the size of the body of a request, uncompressed and as sent
+    """
+    body = getattr(getattr(response, 'request', None), 'body', None)
+    if body is None:
+        body = kwargs.get('data')
+    if not body:
+        return 0, 0
+    return body_size(body, kwargs.get('headers')), len(body)
+
+
+def _response_bytes(response, kwargs):
+    """
+    Get the size of the body of a response, decoded and as received, without
+    reading a streamed one. The received size is None when it cannot be
+    measured, i.e. for a compressed body sent in chunks.
+    """
+    if response is None:
+        return None, None
+    length = response.headers.get('Content-Length')
+    wire = int(length) if length is not None and length.isdigit() else None
+    compressed = bool(response.headers.get('Content-Encoding'))
+    if kwargs.get('stream'):
+        return wire if not compressed else None, wire
+    size = len(response.content)
+    if wire is None and isinstance(response.raw, HTTPResponse):
+        # The number of bytes read from the socket, only counted for bodies
+        # with a Content-Length by urllib3
+        wire = response.raw.tell() or None
+    if wire is None and not compressed:
+        wire = size
+    return size, wire
+
+
 class MailChimpClient(object):
     """
     MailChimp class to communicate with the v3 API
     """
-    def __init__(self, mc_user, mc_secret, enabled=True):
+    def __init__(self, mc_user, mc_secret, enabled=True, session=None,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 keep_alive=True, limiter=None, retry=None, timeout=None, cache=None, transport=None,
+                 codec=None, compress_threshold=None):
         """
         Initialize the class with you user_id and secret_key.
 
         If `enabled` is not True, these methods become no-ops. This is
         particularly useful for testing or disabling with configuration.
 
+        All requests go through a single transport, by default a
+        :py:class:`mailchimp3.transport.RequestsTransport` whose session keeps
+        the connections to the datacenter alive so they are reused by every
+        endpoint attached to the client. Call :py:meth:`close` (or use the
+        client as a context manager) to release the pooled connections.
+
         :param mc_user: Mailchimp user id
         :type mc_user: :py:class:`str`
         :param mc_secret: Mailchimp secret key
         :type mc_secret: :py:class:`str`
         :param enabled: Whether the API should execute any requests
         :type enabled: :py:class:`bool`
+        :param session: An existing session to send the requests with, the
+          client will not close a session it did not create
+        :type session: :py:class:`requests.Session`
+        :param pool_connections: The number of host connection pools to cache
+        :type pool_connections: :py:class:`int`
+        :param pool_maxsize: The maximum number of connections to keep in
+          each pool
+        :type pool_maxsize: :py:class:`int`
+        :param keep_alive: Whether connections should be kept open between
+          requests, ignored when a session is given
+        :type keep_alive: :py:class:`bool`
+        :param limiter: The rate limiter for the requests of the client, by
+          default one allowing as many simultaneous connections as
+          Mailchimp does
+        :type limiter: :py:class:`mailchimp3.ratelimit.RateLimiter`
+        :param retry: The policy to retry requests that failed with a
+          transient error, by default GET, PUT and DELETE requests are
+          retried up to 3 times
+        :type retry: :py:class:`mailchimp3.retry.RetryPolicy`
+        :param timeout: The connect and read timeout of the requests in
+          seconds, either a single value or a (connect, read) tuple
+        :type timeout: :py:class:`float` or :py:class:`tuple`
+        :param cache: The cache to answer GET requests from, responses are
+          not cached by default
+        :type cache: :py:class:`mailchimp3.cache.ResponseCache`
+        :param transport: The transport to send the requests with instead of
+          a session, such as a :py:class:`mailchimp3.fakeserver.FakeTransport`
+        :param codec: The JSON codec of the request and response bodies, by
+          default the fastest one installed
+        :type codec: :py:class:`mailchimp3.codec.StdlibCodec`
+        :param compress_threshold: The size in bytes from which request
+          bodies are compressed with gzip, never by default
+        :type compress_threshold: :py:class:`int`
         """
         super(MailChimpClient, self).__init__()
         self.enabled = enabled
         self.auth = HTTPBasicAuth(mc_user, mc_secret)
+        # Identifies the account in a cache shared with other clients
+        self._account = hashlib.sha256('{}:{}'.format(mc_user, mc_secret).encode('utf-8')).hexdigest()
         datacenter = mc_secret.split('-').pop()
         self.base_url = 'https://{}.api.mailchimp.com/3.0/'.format(datacenter)
+        if transport is None:
+            transport = RequestsTransport(session, pool_connections, pool_maxsize, keep_alive)
+        self.transport = transport
+        if limiter is None:
+            limiter = RateLimiter(max_concurrent=MAX_CONCURRENT_CONNECTIONS)
+        self.limiter = limiter
+        if retry is None:
+            retry = RetryPolicy()
+        self.retry = retry
+        self.timeout = timeout
+        self.cache = cache
+        self.codec = codec if codec is not None else default_codec()
+        self.compress_threshold = compress_threshold
+        self._hooks = {'request': [], 'response': []}
+
+
+    def close(self):
+        """
+        Close the transport and release its pooled connections
+        """
+        self.transport.close()
+
+
+    def add_hook(self, event, hook):
+        """
+        Call a function around each attempt to send a request.
+
+        The 'request' hooks are called with a
+        :py:class:`mailchimp3.instrumentation.RequestEvent` before the
+        attempt, and the 'response' hooks with a
+        :py:class:`mailchimp3.instrumentation.ResponseEvent` after it, in the
+        thread sending the request.
+
+        :param event: Either 'request' or 'response'
+        :type event: :py:class:`str`
+        :param hook: The function to call with the event
+        :type hook: :py:class:`collections.Callable`
+        """
+        if event not in self._hooks:
+            raise ValueError('The event must be either "request" or "response"')
+        self._hooks[event].append(hook)
+
+
+    def remove_hook(self, event, hook):
+        """
+        Stop calling a function added with :py:meth:`add_hook`
+
+        :param event: Either 'request' or 'response'
+        :type event: :py:class:`str`
+        :param hook: The function
+        :type hook: :py:class:`collections.Callable`
+        """
+        if event not in self._hooks:
+            raise ValueError('The event must be either "request" or "response"')
+        self._hooks[event].remove(hook)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def _make_request(self, method, url, **kwargs):
+        """
+        Send an authenticated request through the rate limiter. Requests
+        answered with a 429 are sent again once the limiter lets them
+        through, up to the number of retries it allows, and requests that
+        failed with a transient error are retried as the retry policy
+        allows. Compressed responses are accepted.
+
+        :param method: The HTTP method
+        :type method: :py:class:`str`
+        :param url: The full url of the request
+        :type url: :py:class:`str`
+        :param kwargs: Extra arguments for :py:meth:`requests.Session.request`
+        :returns: The response
+        :rtype: :py:class:`requests.Response`
+        """
+        throttled = 0
+        retries = 0
+        attempt = 0
+        deadline = self.retry.deadline()
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        headers.update(kwargs.get('headers') or {})
+        kwargs['headers'] = headers
+        while True:
+            attempt += 1
+            try:
+                r = self._send(method, url, attempt, **kwargs)
+            except self.transport.EXCEPTIONS:
+                delay = self.retry.next_delay(method, retries, deadline)
+                if delay is None:
+                    raise
+                retries += 1
+                time.sleep(delay)
+                continue
+            if r.status_code == 429:
+                if throttled >= self.limiter.max_retries:
+                    return r
+                throttled += 1
+                self.limiter.throttled(parse_retry_after(r.headers.get('Retry-After')))
+                continue
+            self.limiter.succeeded()
+            if r.status_code >= 500:
+                delay = self.retry.next_delay(method, retries, deadline, r.status_code,
+                                              parse_retry_after(r.headers.get('Retry-After')))
+                if delay is not None:
+                    retries += 1
+                    time.sleep(delay)
+                    continue
+            return r
+
+
+    def _send(self, method, url, attempt, **kwargs):
+        """
+        Send one attempt of a request through the rate limiter, calling the
+        hooks around it if there are any
+
+        :returns: The response
+        :rtype: :py:class:`requests.Response`
+        """
+        request_hooks = self._hooks['request']
+        response_hooks = self._hooks['response']
+        if not request_hooks and not response_hooks:
+            with self.limiter:
+                return self.transport.request(method, url, auth=self.auth, timeout=self.timeout, **kwargs)
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        path = template_path(path.split('?', 1)[0])
+        for hook in request_hooks:
+            hook(RequestEvent(method, path, url, attempt))
+        r = None
+        error = None
+        with self.limiter:
+            start = time.time()
+            try:
+                r = self.transport.request(method, url, auth=self.auth, timeout=self.timeout, **kwargs)
+            except Exception as e:
+                error = e
+                exc_info = sys.exc_info()
+            elapsed = time.time() - start
+        # The hooks are called once the limiter is released, so a slow hook
+        # does not hold back the requests of other threads
+        if response_hooks:
+            request_bytes, request_wire_bytes = _request_bytes(r, kwargs)
+            response_bytes, response_wire_bytes = _response_bytes(r, kwargs)
+            event = ResponseEvent(
+                method, path, url, attempt,
+                status_code=r.status_code if r is not None else None,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                request_wire_bytes=request_wire_bytes,
+                response_wire_bytes=response_wire_bytes,
+                elapsed=elapsed,
+                error=error,
+            )
+            for hook in response_hooks:
+                hook(event)
+        if error is not None:
+            six.reraise(*exc_info)
+        return r
+
+
+    def _body(self, data):
+        """
+        Encode a request body with the codec, compressing it if it reaches
+        the compression threshold
+
+        :param data: The request body parameters
+        :type data: :py:data:`none` or :py:class:`dict`
+        :returns: The arguments of the body for :py:meth:`_make_request`
+        :rtype: :py:class:`dict`
+        """
+        if data is None:
+            return {}
+        body, headers = encode_body(self.codec, data, self.compress_threshold)
+        return {'data': body, 'headers': headers}
 
 
     @_enabled_or_noop
@@ -62,14 +332,16 @@ class MailChimpClient(object):
         :type data: :py:data:`none` or :py:class:`dict`
         :returns: The JSON output from the API or an error message
         """
+        path = url
         url = urljoin(self.base_url, url)
         try:
-            r = requests.post(url, auth=self.auth, json=data)
+            r = self._make_request('POST', url, **self._body(data))
         except requests.exceptions.RequestException as e:
             raise e
         else:
+            self._invalidate(path)
             r.raise_for_status()
-            return r.json()
+            return self.codec.loads(r.content)
 
 
     @_enabled_or_noop
@@ -82,16 +354,57 @@ class MailChimpClient(object):
         :param queryparams: The query string parameters
         :returns: The JSON output from the API
         """
+        path = url
         url = urljoin(self.base_url, url)
         if len(queryparams):
             url += '?' + urlencode(queryparams)
+        if self.cache is not None:
+            return self._cached_get(path, url)
         try:
-            r = requests.get(url, auth=self.auth)
+            r = self._make_request('GET', url)
         except requests.exceptions.RequestException as e:
             raise e
         else:
             r.raise_for_status()
-            return r.json()
+            return self.codec.loads(r.content)
+
+
+    def _cached_get(self, path, url):
+        """
+        Answer a GET request from the cache while its response is fresh, and
+        revalidate it with its ETag once it is stale
+
+        :param path: The url for the endpoint including path parameters
+        :type path: :py:class:`str`
+        :param url: The full url of the request
+        :type url: :py:class:`str`
+        :returns: The JSON output from the API
+        """
+        cached = self.cache.get(url, self._account)
+        headers = {}
+        if cached is not None:
+            if self.cache.is_fresh(cached):
+                return self.codec.loads(cached.content)
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+        r = self._make_request('GET', url, headers=headers)
+        if r.status_code == 304 and cached is not None:
+            self.cache.renew(url, cached)
+            return self.codec.loads(cached.content)
+        r.raise_for_status()
+        self.cache.store(path, url, r, self._account)
+        return self.codec.loads(r.content)
+
+
+    def _invalidate(self, path):
+        """
+        Remove the cached responses that a write to the path may have changed
+
+        :param path: The url for the endpoint including path parameters
+        :type path: :py:class:`str`
+        """
+        if self.cache is not None:
+            self.cache.invalidate(path, self._account)
 
 
     @_enabled_or_noop
@@ -103,16 +416,18 @@ class MailChimpClient(object):
         :type url: :py:class:`str`
         :returns: The JSON output from the API
         """
+        path = url
         url = urljoin(self.base_url, url)
         try:
-            r = requests.delete(url, auth=self.auth)
+            r = self._make_request('DELETE', url)
         except requests.exceptions.RequestException as e:
             raise e
         else:
+            self._invalidate(path)
             r.raise_for_status()
             if r.status_code == 204:
                 return
-            return r.json()
+            return self.codec.loads(r.content)
 
 
     @_enabled_or_noop
@@ -126,14 +441,16 @@ class MailChimpClient(object):
         :type data: :py:data:`none` or :py:class:`dict`
         :returns: The JSON output from the API
         """
+        path = url
         url = urljoin(self.base_url, url)
         try:
-            r = requests.patch(url, auth=self.auth, json=data)
+            r = self._make_request('PATCH', url, **self._body(data))
         except requests.exceptions.RequestException as e:
             raise e
         else:
+            self._invalidate(path)
             r.raise_for_status()
-            return r.json()
+            return self.codec.loads(r.content)
 
 
     @_enabled_or_noop
@@ -147,11 +464,33 @@ class MailChimpClient(object):
         :type data: :py:data:`none` or :py:class:`dict`
         :returns: The JSON output from the API
         """
+        path = url
         url = urljoin(self.base_url, url)
         try:
-            r = requests.put(url, auth=self.auth, json=data)
+            r = self._make_request('PUT', url, **self._body(data))
+        except requests.exceptions.RequestException as e:
+            raise e
+        else:
+            self._invalidate(path)
+            r.raise_for_status()
+            return self.codec.loads(r.content)
+
+
+    @_enabled_or_noop
+    def _download(self, url):
+        """
+        Handle unauthenticated GET requests of files hosted outside of the
+        API, such as the results of batch operations
+
+        :param url: The full url of the file
+        :type url: :py:class:`str`
+        :returns: The response, with its body left unread
+        :rtype: :py:class:`requests.Response`
+        """
+        try:
+            r = self.transport.request('GET', url, stream=True, timeout=self.timeout)
         except requests.exceptions.RequestException as e:
             raise e
         else:
             r.raise_for_status()
-            return r.json()
+            return r
@@ -0,0 +1,186 @@
+# coding=utf-8
+"""
+In-process metrics of the requests of a client
+
+A :py:class:`MetricsCollector` attached to a client aggregates the response
+events of its hooks per method and templated path, and its snapshots can
+be exported to a monitoring system:
+
+    metrics = MetricsCollector()
+    metrics.attach(client)
+    ...
+    print(format_prometheus(metrics.snapshot()))
+"""
+from __future__ import unicode_literals
+
+import bisect
+import json
+import threading
+
+# The upper bounds in seconds of the buckets of the latency histograms
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class MetricsCollector(object):
+    """
+    Count the attempts, errors, throttled attempts, bytes, uncompressed and
+    over the wire, and latencies of the requests to each endpoint, safe to
+    share between threads and clients.
+
+    An attempt is an error if it raised an exception or got a 4xx or 5xx
+    response other than a 429, which is counted as throttled instead.
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Initialize the collector
+
+        :param buckets: The upper bounds in seconds of the buckets of the
+          latency histograms, in increasing order
+        :type buckets: :py:class:`tuple`
+        """
+        super(MetricsCollector, self).__init__()
+        self.buckets = tuple(buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+
+    def attach(self, client):
+        """
+        Start collecting the metrics of a client
+
+        :param client: The client
+        :type client: :py:class:`mailchimp3.MailChimp`
+        """
+        client.add_hook('response', self.record)
+
+
+    def detach(self, client):
+        """
+        Stop collecting the metrics of a client
+
+        :param client: The client
+        :type client: :py:class:`mailchimp3.MailChimp`
+        """
+        client.remove_hook('response', self.record)
+
+
+    def record(self, event):
+        """
+        Add a response event to the metrics, this is the hook attached to
+        the clients
+
+        :param event: The event
+        :type event: :py:class:`mailchimp3.instrumentation.ResponseEvent`
+        """
+        bucket = bisect.bisect_left(self.buckets, event.elapsed)
+        with self._lock:
+            stats = self._endpoints.get((event.method, event.path))
+            if stats is None:
+                stats = self._endpoints[(event.method, event.path)] = {
+                    'attempts': 0,
+                    'errors': 0,
+                    'throttled': 0,
+                    'request_bytes': 0,
+                    'response_bytes': 0,
+                    'request_wire_bytes': 0,
+                    'response_wire_bytes': 0,
+                    'latency_sum': 0.0,
+                    'latency_buckets': [0] * (len(self.buckets) + 1),
+                    'statuses': {},
+                }
+            stats['attempts'] += 1
+            status = event.status_code
+            if status == 429:
+                stats['throttled'] += 1
+            elif status is None or status >= 400:
+                stats['errors'] += 1
+            key = str(status) if status is not None else 'exception'
+            stats['statuses'][key] = stats['statuses'].get(key, 0) + 1
+            stats['request_bytes'] += event.request_bytes or 0
+            stats['response_bytes'] += event.response_bytes or 0
+            stats['request_wire_bytes'] += event.request_wire_bytes or 0
+            stats['response_wire_bytes'] += event.response_wire_bytes or 0
+            stats['latency_sum'] += event.elapsed
+            stats['latency_buckets'][bucket] += 1
+
+
+    def snapshot(self):
+        """
+        Get a copy of the metrics, which can be serialized to JSON
+
+        :returns: The buckets and a list of the metrics of each endpoint,
+          with the count of each latency bucket, the last one holding the
+          latencies above the last bound
+        :rtype: :py:class:`dict`
+        """
+        with self._lock:
+            endpoints = [
+                dict(stats, method=method, path=path, latency_buckets=list(stats['latency_buckets']),
+                     statuses=dict(stats['statuses']))
+                for (method, path), stats in sorted(self._endpoints.items())
+            ]
+        return {'buckets': list(self.buckets), 'endpoints': endpoints}
+
+
+    def reset(self):
+        """
+        Clear the metrics
+        """
+        with self._lock:
+            self._endpoints.clear()
+
+
+def format_json(snapshot):
+    """
+    Format a snapshot as JSON
+
+    :param snapshot: A snapshot of :py:meth:`MetricsCollector.snapshot`
+    :type snapshot: :py:class:`dict`
+    :rtype: :py:class:`str`
+    """
+    return json.dumps(snapshot, sort_keys=True)
+
+
+def format_prometheus(snapshot, prefix='mailchimp3'):
+    """
+    Format a snapshot in the Prometheus text exposition format, to be served
+    to a Prometheus scraper or pushed to a gateway
+
+    :param snapshot: A snapshot of :py:meth:`MetricsCollector.snapshot`
+    :type snapshot: :py:class:`dict`
+    :param prefix: The prefix of the metric names
+    :type prefix: :py:class:`str`
+    :rtype: :py:class:`str`
+    """
+    lines = []
+    counters = (
+        ('attempts', 'Requests sent, retries included'),
+        ('errors', 'Requests that failed with an exception or an error status'),
+        ('throttled', 'Requests answered with a 429'),
+        ('request_bytes', 'Bytes of the request bodies, uncompressed'),
+        ('response_bytes', 'Bytes of the response bodies, uncompressed'),
+        ('request_wire_bytes', 'Bytes of the request bodies sent over the wire'),
+        ('response_wire_bytes', 'Bytes of the response bodies received over the wire'),
+    )
+    for name, description in counters:
+        lines.append('# HELP {}_{}_total {}'.format(prefix, name, description))
+        lines.append('# TYPE {}_{}_total counter'.format(prefix, name))
+        for stats in snapshot['endpoints']:
+            lines.append('{}_{}_total{{{}}} {}'.format(prefix, name, _labels(stats), stats[name]))
+    lines.append('# HELP {}_request_duration_seconds Duration of the requests'.format(prefix))
+    lines.append('# TYPE {}_request_duration_seconds histogram'.format(prefix))
+    for stats in snapshot['endpoints']:
+        labels = _labels(stats)
+        cumulative = 0
+        bounds = [repr(float(bound)) for bound in snapshot['buckets']] + ['+Inf']
+        for bound, count in zip(bounds, stats['latency_buckets']):
+            cumulative += count
+            lines.append('{}_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(
+                prefix, labels, bound, cumulative))
+        lines.append('{}_request_duration_seconds_sum{{{}}} {}'.format(prefix, labels, stats['latency_sum']))
+        lines.append('{}_request_duration_seconds_count{{{}}} {}'.format(prefix, labels, stats['attempts']))
+    return '\n'.join(lines) + '\n'
+
+
+def _labels(stats):
+    return 'method="{}",path="{}"'.format(stats['method'], stats['path'].replace('\\', '\\\\').replace('"', '\\"'))
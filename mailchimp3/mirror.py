@@ -0,0 +1,198 @@
+# coding=utf-8
+"""
+Local SQLite mirror of the members of a list
+
+The members are stored keyed by their subscriber hash, so they can be
+looked up without a request to the API, and refreshed incrementally with
+the members changed since the last sync:
+
+    mirror = ListMemberMirror(client, '123456', 'members.db')
+    mirror.sync()
+    member = mirror.get('john.doe@example.com')
+"""
+from __future__ import unicode_literals
+
+import json
+import sqlite3
+import time
+
+from mailchimp3.helpers import check_subscriber_hash, chunks
+
+# The number of members written to the database at a time
+WRITE_CHUNK_SIZE = 1000
+# The number of seconds before the start of a sync from which the next one
+# fetches the changed members, covering the skew between the local clock and
+# the clock of Mailchimp
+SYNC_OVERLAP = 300
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    list_id TEXT NOT NULL,
+    subscriber_hash TEXT NOT NULL,
+    email_address TEXT,
+    status TEXT,
+    last_changed TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (list_id, subscriber_hash)
+);
+CREATE INDEX IF NOT EXISTS members_status ON members (list_id, status);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    list_id TEXT PRIMARY KEY,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+class ListMemberMirror(object):
+    """
+    A SQLite mirror of the members of a list.
+
+    The first :py:meth:`sync` loads every member of the list, and the
+    following ones only fetch the members changed since shortly before the
+    previous sync started, using the since_last_changed query parameter.
+    The checkpoint is taken from the local clock, so it is moved back by
+    `SYNC_OVERLAP` seconds and the members changed around it are fetched
+    twice rather than missed. The checkpoint is written in the same
+    transaction as the members, so a sync that fails is simply retried from
+    the previous checkpoint.
+
+    Members that are deleted or archived no longer appear in the list and
+    are only removed from the mirror by a full sync.
+    """
+    def __init__(self, client, list_id, database=':memory:'):
+        """
+        Initialize the mirror
+
+        :param client: The client to fetch the members with
+        :type client: :py:class:`mailchimp3.MailChimp`
+        :param list_id: The unique id for the list.
+        :type list_id: :py:class:`str`
+        :param database: The path of the SQLite database, several lists can
+          be mirrored in the same database
+        :type database: :py:class:`str`
+        """
+        super(ListMemberMirror, self).__init__()
+        self._client = client
+        self.list_id = list_id
+        self._db = sqlite3.connect(database)
+        self._db.executescript(SCHEMA)
+
+
+    def close(self):
+        """
+        Close the database
+        """
+        self._db.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    @property
+    def checkpoint(self):
+        """
+        The time the next sync fetches the changed members from, shortly
+        before the last successful sync started, in ISO 8601 format, or None
+        if the list was never synced
+        """
+        row = self._db.execute('SELECT synced_at FROM checkpoints WHERE list_id = ?', (self.list_id,)).fetchone()
+        return row[0] if row is not None else None
+
+
+    def sync(self, full=False, **queryparams):
+        """
+        Fetch the members changed since the last sync, or every member for
+        the first sync, and store them in the mirror.
+
+        :param full: Whether to reload every member, removing the ones that
+          are no longer in the list
+        :type full: :py:class:`bool`
+        :param queryparams: The query string parameters of
+          :py:meth:`mailchimp3.entities.listmembers.ListMembers.all`, such
+          as max_workers to fetch several pages at a time
+        :returns: The number of members fetched
+        :rtype: :py:class:`int`
+        """
+        started = time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(time.time() - SYNC_OVERLAP))
+        checkpoint = None if full else self.checkpoint
+        if checkpoint is not None:
+            queryparams['since_last_changed'] = checkpoint
+        members = self._client.lists.members.iter_all(self.list_id, **queryparams)
+        count = 0
+        with self._db:
+            if checkpoint is None:
+                self._db.execute('DELETE FROM members WHERE list_id = ?', (self.list_id,))
+            for chunk in chunks(members, WRITE_CHUNK_SIZE):
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?, ?, ?)',
+                    [(self.list_id, member['id'], member.get('email_address'), member.get('status'),
+                      member.get('last_changed'), json.dumps(member)) for member in chunk]
+                )
+                count += len(chunk)
+            self._db.execute('INSERT OR REPLACE INTO checkpoints VALUES (?, ?)', (self.list_id, started))
+        return count
+
+
+    def get(self, subscriber_hash):
+        """
+        Get a member of the mirror.
+
+        :param subscriber_hash: The MD5 hash of the lowercase version of the
+          list member’s email address, or the email address itself
+        :type subscriber_hash: :py:class:`str`
+        :returns: The member as returned by the API, or None if it is not in
+          the mirror
+        :rtype: :py:class:`dict`
+        """
+        subscriber_hash = check_subscriber_hash(subscriber_hash)
+        row = self._db.execute(
+            'SELECT data FROM members WHERE list_id = ? AND subscriber_hash = ?', (self.list_id, subscriber_hash)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+
+    def members(self, status=None):
+        """
+        Iterate over the members of the mirror.
+
+        :param status: Only the members with this status if given
+        :type status: :py:class:`str`
+        :returns: A generator of the members
+        :rtype: :py:class:`types.GeneratorType`
+        """
+        if status is None:
+            rows = self._db.execute('SELECT data FROM members WHERE list_id = ?', (self.list_id,))
+        else:
+            rows = self._db.execute('SELECT data FROM members WHERE list_id = ? AND status = ?',
+                                    (self.list_id, status))
+        for row in rows:
+            yield json.loads(row[0])
+
+
+    def count(self, status=None):
+        """
+        Count the members of the mirror.
+
+        :param status: Only count the members with this status if given
+        :type status: :py:class:`str`
+        :rtype: :py:class:`int`
+        """
+        if status is None:
+            row = self._db.execute('SELECT COUNT(*) FROM members WHERE list_id = ?', (self.list_id,)).fetchone()
+        else:
+            row = self._db.execute('SELECT COUNT(*) FROM members WHERE list_id = ? AND status = ?',
+                                   (self.list_id, status)).fetchone()
+        return row[0]
+
+
+    def __contains__(self, subscriber_hash):
+        return self.get(subscriber_hash) is not None
+
+
+    def __len__(self):
+        return self.count()
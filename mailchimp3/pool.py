@@ -0,0 +1,179 @@
+# coding=utf-8
+"""
+Pool of clients for many Mailchimp accounts
+
+A :py:class:`ClientPool` builds the client of each account when it is first
+used and keeps only the most recently used ones. The clients of the
+accounts hosted in the same datacenter share one session, so their
+connections are reused across accounts:
+
+    pool = ClientPool(maxsize=100)
+    for mc_user, mc_secret in accounts:
+        pool.client(mc_user, mc_secret).lists.all(get_all=True)
+
+    # Or fetch the lists of 10 accounts at a time
+    results = pool.map(lambda client: client.lists.all(get_all=True), accounts, max_workers=10)
+"""
+from __future__ import unicode_literals
+
+import threading
+import weakref
+
+from mailchimp3 import MailChimp
+from mailchimp3.helpers import LRUCache, map_concurrently
+from mailchimp3.ratelimit import RateLimiter
+from mailchimp3.transport import MAX_CONCURRENT_CONNECTIONS, RequestsTransport
+
+# The number of connections kept alive to each datacenter
+DEFAULT_DATACENTER_POOL_MAXSIZE = 50
+# The arguments of the clients that the pool sets itself or that cannot be
+# shared by the clients of several accounts
+POOL_ARGUMENTS = ('cache', 'limiter', 'session')
+
+
+class ClientPool(object):
+    """
+    A bounded pool of the clients of several accounts, safe to share between
+    threads.
+
+    Each account has its own rate limiter, so it never has more than
+    `max_concurrent` requests in flight whichever thread sends them. A
+    client evicted from the pool while it is still in use keeps working,
+    and a new client built for the same account meanwhile shares its
+    limiter.
+    """
+    def __init__(self, maxsize=100, max_concurrent=MAX_CONCURRENT_CONNECTIONS, rate=None,
+                 pool_maxsize=DEFAULT_DATACENTER_POOL_MAXSIZE, transport=None, **kwargs):
+        """
+        Initialize the pool
+
+        :param maxsize: The maximum number of clients kept in the pool
+        :type maxsize: :py:class:`int`
+        :param max_concurrent: The maximum number of requests in flight for
+          each account
+        :type max_concurrent: :py:class:`int`
+        :param rate: The maximum number of requests per second for each
+          account, unlimited if None
+        :type rate: :py:class:`float`
+        :param pool_maxsize: The maximum number of connections kept alive to
+          each datacenter
+        :type pool_maxsize: :py:class:`int`
+        :param transport: A transport shared by every client instead of a
+          session per datacenter, such as a
+          :py:class:`mailchimp3.fakeserver.FakeTransport`
+        :param kwargs: The other arguments of the clients, such as `retry`
+          or `timeout`, but not `cache`, `limiter` or `session`
+        """
+        super(ClientPool, self).__init__()
+        for name in POOL_ARGUMENTS:
+            if name in kwargs:
+                raise TypeError('ClientPool does not accept the {} argument of the clients'.format(name))
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.pool_maxsize = pool_maxsize
+        self.transport = transport
+        self._kwargs = kwargs
+        self._clients = LRUCache(maxsize)
+        self._limiters = weakref.WeakValueDictionary()
+        self._transports = {}
+        self._lock = threading.Lock()
+
+
+    def client(self, mc_user, mc_secret):
+        """
+        Get the client of an account, building it if it is not in the pool
+
+        :param mc_user: Mailchimp user id
+        :type mc_user: :py:class:`str`
+        :param mc_secret: Mailchimp secret key
+        :type mc_secret: :py:class:`str`
+        :rtype: :py:class:`mailchimp3.MailChimp`
+        """
+        key = (mc_user, mc_secret)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = self._limiters[key] = RateLimiter(max_concurrent=self.max_concurrent, rate=self.rate)
+                # The datacenter is derived from the key as the client does
+                transport = _SharedTransport(self._transport(mc_secret.split('-').pop()))
+                client = MailChimp(mc_user, mc_secret, transport=transport, limiter=limiter, **self._kwargs)
+                self._clients.set(key, client)
+            return client
+
+
+    def map(self, fn, accounts, max_workers=1):
+        """
+        Call a function with the client of each account, yielding the
+        results in the order of the accounts.
+
+        :param fn: The function to call with each client
+        :type fn: :py:class:`collections.Callable`
+        :param accounts: The (mc_user, mc_secret) pairs of the accounts
+        :type accounts: :py:class:`collections.Iterable`
+        :param max_workers: The number of accounts to call the function for
+          concurrently
+        :type max_workers: :py:class:`int`
+        :returns: A generator of the results
+        :rtype: :py:class:`types.GeneratorType`
+        """
+        return map_concurrently(lambda account: fn(self.client(*account)), accounts, max_workers)
+
+
+    def close(self):
+        """
+        Remove every client and close the sessions of the datacenters
+        """
+        with self._lock:
+            self._clients.clear()
+            transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            transport.close()
+
+
+    def __len__(self):
+        return len(self._clients)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def _transport(self, datacenter):
+        """
+        Get the transport shared by the clients of a datacenter
+        """
+        if self.transport is not None:
+            return self.transport
+        transport = self._transports.get(datacenter)
+        if transport is None:
+            transport = self._transports[datacenter] = RequestsTransport(pool_connections=1,
+                                                                         pool_maxsize=self.pool_maxsize)
+        return transport
+
+
+class _SharedTransport(object):
+    """
+    A view of a transport shared by several clients, which closing a client
+    leaves open
+    """
+    def __init__(self, transport):
+        super(_SharedTransport, self).__init__()
+        self._transport = transport
+        self.EXCEPTIONS = transport.EXCEPTIONS
+
+
+    def request(self, method, url, **kwargs):
+        return self._transport.request(method, url, **kwargs)
+
+
+    def close(self):
+        pass
@@ -0,0 +1,101 @@
+# coding=utf-8
+"""
+Projection of the records returned by the collection endpoints
+
+Mailchimp only returns the fields of the records named by the `fields`
+query parameter, or all of them but those named by `exclude_fields`, as
+dotted paths starting with the key holding the records in the pages, e.g.
+'members.email_address'. :py:func:`projection` builds these parameters from
+the attributes of the records that will be read:
+
+    client.lists.members.all('123456', **projection('members', ['email_address', 'status']))
+
+The get_all reads take the same attributes directly, and drop the _links of
+the records by default:
+
+    client.lists.members.all('123456', get_all=True, attributes=['email_address', 'status'])
+"""
+from __future__ import unicode_literals
+
+# The key holding the records of each kind of collection in its pages, when
+# it is not the name of the collection with underscores instead of dashes
+COLLECTION_KEYS = {
+    'authorized-apps': 'apps',
+    'campaign-folders': 'folders',
+    'click-details': 'urls_clicked',
+    'email-activity': 'emails',
+    'growth-history': 'history',
+    'interest-categories': 'categories',
+    'template-folders': 'folders',
+    'unsubscribed': 'unsubscribes',
+}
+
+
+def collection_key(collection):
+    """
+    Get the key holding the records in the pages of a collection
+
+    :param collection: The path of the collection, such as
+      'lists/123456/members', or its name
+    :type collection: :py:class:`str`
+    :rtype: :py:class:`str`
+    """
+    name = collection.strip('/').rpartition('/')[2]
+    return COLLECTION_KEYS.get(name, name.replace('-', '_'))
+
+
+def projection(collection, attributes=None, exclude=None, links=False):
+    """
+    Build the `fields` and `exclude_fields` query parameters that select the
+    attributes of the records of a collection
+
+    :param collection: The path of the collection, such as
+      'lists/123456/members', or its name
+    :type collection: :py:class:`str`
+    :param attributes: The attributes of the records to return, as dotted
+      paths below the record such as 'merge_fields.FNAME', all of them if
+      None
+    :type attributes: :py:class:`list`
+    :param exclude: The attributes of the records not to return, ignored if
+      attributes are given
+    :type exclude: :py:class:`list`
+    :param links: Whether to return the _links of the records and of the
+      page
+    :type links: :py:class:`bool`
+    :returns: The query string parameters
+    :rtype: :py:class:`dict`
+    """
+    key = collection_key(collection)
+    if attributes is not None:
+        fields = ['{}.{}'.format(key, attribute) for attribute in attributes]
+        if links:
+            fields.extend(['_links', '{}._links'.format(key)])
+        return {'fields': ','.join(fields)}
+    exclude_fields = ['{}.{}'.format(key, attribute) for attribute in exclude or []]
+    if not links:
+        exclude_fields.extend(['_links', '{}._links'.format(key)])
+    if not exclude_fields:
+        return {}
+    return {'exclude_fields': ','.join(exclude_fields)}
+
+
+def merge_projection(queryparams, params):
+    """
+    Add the fields of a projection to the ones already in query string
+    parameters
+
+    :param queryparams: The query string parameters
+    :type queryparams: :py:class:`dict`
+    :param params: The query string parameters of a projection
+    :type params: :py:class:`dict`
+    :returns: A copy of the query string parameters with the fields of both
+    :rtype: :py:class:`dict`
+    """
+    merged = dict(queryparams)
+    for name, value in params.items():
+        fields = [field for field in merged.get(name, '').split(',') if field]
+        for field in value.split(','):
+            if field not in fields:
+                fields.append(field)
+        merged[name] = ','.join(fields)
+    return merged
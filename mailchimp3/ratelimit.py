@@ -0,0 +1,175 @@
+# coding=utf-8
+"""
+Client side rate limiting for the Mailchimp API
+
+Mailchimp limits the number of simultaneous connections per API key and
+answers with a 429 status when it is exceeded.
+"""
+from __future__ import unicode_literals
+
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+
+
+def parse_retry_after(value):
+    """
+    Get the number of seconds to wait from the value of a Retry-After header,
+    which is either a number of seconds or an HTTP date.
+
+    :param value: The value of the header
+    :type value: :py:class:`str`
+    :returns: The number of seconds to wait or None if it can't be parsed
+    :rtype: :py:class:`float`
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        parsed = parsedate_tz(value)
+        if parsed is None:
+            return None
+        return max(0.0, mktime_tz(parsed) - time.time())
+
+
+class RateLimiter(object):
+    """
+    A token bucket and concurrency limiter shared by every endpoint of a
+    client, and safe to share between threads.
+
+    The number of requests in flight is capped at `max_concurrent`, and if
+    a `rate` is given, requests are also spaced out to that many per second
+    with bursts of up to `burst` requests. When the API answers with a 429,
+    :py:meth:`throttled` halves the concurrency and the rate, and no request
+    is let through until the Retry-After delay has passed. They both grow
+    back as requests succeed.
+    """
+    def __init__(self, max_concurrent=10, rate=None, burst=None, max_retries=3,
+                 default_retry_after=1.0, max_retry_after=60.0):
+        """
+        Initialize the limiter
+
+        :param max_concurrent: The maximum number of requests in flight
+        :type max_concurrent: :py:class:`int`
+        :param rate: The maximum number of requests per second, unlimited if
+          None
+        :type rate: :py:class:`float`
+        :param burst: The size of the token bucket, defaults to the rate
+        :type burst: :py:class:`float`
+        :param max_retries: How many times a request answered with a 429 is
+          sent again before giving up
+        :type max_retries: :py:class:`int`
+        :param default_retry_after: The delay in seconds after a 429 without
+          a Retry-After header
+        :type default_retry_after: :py:class:`float`
+        :param max_retry_after: The longest delay in seconds to honor
+        :type max_retry_after: :py:class:`float`
+        """
+        super(RateLimiter, self).__init__()
+        if max_concurrent < 1:
+            raise ValueError('The limiter must allow at least one request at a time')
+        self.max_concurrent = max_concurrent
+        self.max_rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.max_retries = max_retries
+        self.default_retry_after = default_retry_after
+        self.max_retry_after = max_retry_after
+        self.concurrency = max_concurrent
+        self.rate = rate
+        self._tokens = self.burst
+        self._last_refill = time.time()
+        self._active = 0
+        self._successes = 0
+        self._blocked_until = 0.0
+        self._condition = threading.Condition(threading.Lock())
+
+
+    def acquire(self):
+        """
+        Block until a request can be sent
+        """
+        with self._condition:
+            while True:
+                now = time.time()
+                wait = self._blocked_until - now
+                if wait <= 0 and self._active < self.concurrency:
+                    wait = self._take_token(now)
+                    if wait <= 0:
+                        self._active += 1
+                        return
+                self._condition.wait(wait if wait > 0 else None)
+
+
+    def release(self):
+        """
+        Signal that a request acquired with :py:meth:`acquire` is complete
+        """
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+
+    def succeeded(self):
+        """
+        Record a request that was not throttled, growing the concurrency and
+        the rate back after enough successes in a row
+        """
+        with self._condition:
+            self._successes += 1
+            if self._successes < self.concurrency:
+                return
+            self._successes = 0
+            if self.concurrency < self.max_concurrent:
+                self.concurrency += 1
+            if self.rate is not None and self.max_rate is not None and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate * 1.25)
+            self._condition.notify_all()
+
+
+    def throttled(self, retry_after=None):
+        """
+        Record a request answered with a 429
+
+        :param retry_after: The number of seconds the API asked to wait
+        :type retry_after: :py:class:`float`
+        :returns: The number of seconds before requests are let through
+        :rtype: :py:class:`float`
+        """
+        if retry_after is None:
+            retry_after = self.default_retry_after
+        retry_after = min(retry_after, self.max_retry_after)
+        with self._condition:
+            self._successes = 0
+            self.concurrency = max(1, self.concurrency // 2)
+            if self.rate is not None:
+                self.rate = max(self.rate / 2.0, 1.0 / self.max_retry_after)
+            self._blocked_until = max(self._blocked_until, time.time() + retry_after)
+            self._condition.notify_all()
+        return retry_after
+
+
+    def _take_token(self, now):
+        """
+        Take a token from the bucket, must be called with the lock held.
+
+        :returns: 0 if a token was taken, or the seconds until one is available
+        :rtype: :py:class:`float`
+        """
+        if self.rate is None:
+            return 0
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -0,0 +1,131 @@
+# coding=utf-8
+"""
+Retry policy for requests that failed with a transient error
+"""
+from __future__ import unicode_literals
+
+import random
+import time
+
+
+class RetryPolicy(object):
+    """
+    Decide whether and when a failed request is sent again.
+
+    Requests using one of the `methods` are retried after one of the
+    transient errors in the `EXCEPTIONS` of the transport, such as a
+    connection error or a timeout, or after a response with one of the
+    `status_codes`. The delay before each retry is drawn at random between
+    zero and an exponentially growing backoff ("full jitter"), capped at
+    `max_backoff`, and no retry is attempted once `total_timeout` seconds
+    have passed since the first attempt.
+
+    GET, PUT and DELETE are idempotent and retried by default, POST and
+    PATCH have to be opted into:
+
+        RetryPolicy(methods=RetryPolicy.DEFAULT_METHODS + ('POST',))
+    """
+    DEFAULT_METHODS = ('GET', 'PUT', 'DELETE')
+    DEFAULT_STATUS_CODES = (500, 502, 503, 504)
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30.0, total_timeout=120.0,
+                 methods=DEFAULT_METHODS, status_codes=DEFAULT_STATUS_CODES, jitter=True):
+        """
+        Initialize the policy
+
+        :param max_retries: The maximum number of retries of a request
+        :type max_retries: :py:class:`int`
+        :param backoff_factor: The backoff in seconds before the first retry,
+          doubled for each following one
+        :type backoff_factor: :py:class:`float`
+        :param max_backoff: The longest backoff in seconds
+        :type max_backoff: :py:class:`float`
+        :param total_timeout: The number of seconds after the first attempt
+          past which the request is no longer retried, unlimited if None
+        :type total_timeout: :py:class:`float`
+        :param methods: The HTTP methods to retry
+        :type methods: :py:class:`tuple`
+        :param status_codes: The response statuses to retry
+        :type status_codes: :py:class:`tuple`
+        :param jitter: Whether to randomize the backoff
+        :type jitter: :py:class:`bool`
+        """
+        super(RetryPolicy, self).__init__()
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.total_timeout = total_timeout
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.jitter = jitter
+
+
+    def deadline(self):
+        """
+        Get the time past which a request started now is no longer retried
+
+        :returns: The deadline as a timestamp or None
+        :rtype: :py:class:`float`
+        """
+        if self.total_timeout is None:
+            return None
+        return time.time() + self.total_timeout
+
+
+    def is_retryable(self, method, status_code=None):
+        """
+        Check whether a request failed with the given status, or with an
+        exception if there is no status, can be retried
+
+        :param method: The HTTP method of the request
+        :type method: :py:class:`str`
+        :param status_code: The status of the response
+        :type status_code: :py:class:`int`
+        :rtype: :py:class:`bool`
+        """
+        if method.upper() not in self.methods:
+            return False
+        return status_code is None or status_code in self.status_codes
+
+
+    def backoff(self, retries):
+        """
+        Get the delay before a retry
+
+        :param retries: The number of retries already made
+        :type retries: :py:class:`int`
+        :returns: The delay in seconds
+        :rtype: :py:class:`float`
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** retries))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+    def next_delay(self, method, retries, deadline, status_code=None, retry_after=None):
+        """
+        Get the delay before retrying a failed request
+
+        :param method: The HTTP method of the request
+        :type method: :py:class:`str`
+        :param retries: The number of retries already made
+        :type retries: :py:class:`int`
+        :param deadline: The deadline returned by :py:meth:`deadline` when
+          the request was first sent
+        :type deadline: :py:class:`float`
+        :param status_code: The status of the response, None for an exception
+        :type status_code: :py:class:`int`
+        :param retry_after: The delay asked by the Retry-After header
+        :type retry_after: :py:class:`float`
+        :returns: The delay in seconds or None if it should not be retried
+        :rtype: :py:class:`float`
+        """
+        if retries >= self.max_retries or not self.is_retryable(method, status_code):
+            return None
+        delay = self.backoff(retries)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if deadline is not None and time.time() + delay > deadline:
+            return None
+        return delay
@@ -0,0 +1,189 @@
+# coding=utf-8
+"""
+Transports sending the HTTP requests of :py:class:`mailchimp3.MailChimp`
+
+A transport is any object with a `request` method taking the same
+arguments as :py:meth:`requests.Session.request` and returning a
+:py:class:`requests.Response`, a `close` method, and an `EXCEPTIONS` tuple
+of the transient errors it raises, which are retried by the client.
+"""
+from __future__ import unicode_literals
+
+import struct
+import zlib
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Mailchimp allows up to 10 simultaneous connections per API key
+MAX_CONCURRENT_CONNECTIONS = 10
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = MAX_CONCURRENT_CONNECTIONS
+# The encodings of the responses the clients accept
+ACCEPT_ENCODING = 'gzip, deflate'
+# JSON compresses nearly as well at the fastest level as at the default one
+COMPRESS_LEVEL = 1
+
+
+def encode_body(codec, data, compress_threshold=None):
+    """
+    Encode the body of a request with a JSON codec, compressing it with gzip
+    if it reaches a size threshold
+
+    :param codec: The JSON codec
+    :type codec: :py:class:`mailchimp3.codec.StdlibCodec`
+    :param data: The request body parameters
+    :type data: :py:class:`dict`
+    :param compress_threshold: The size in bytes from which the body is
+      compressed, never if None
+    :type compress_threshold: :py:class:`int`
+    :returns: The body and its headers
+    :rtype: :py:class:`tuple`
+    """
+    body = codec.dumps(data)
+    headers = {'Content-Type': 'application/json'}
+    if compress_threshold is not None and len(body) >= compress_threshold:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        body = compressor.compress(body) + compressor.flush()
+        headers['Content-Encoding'] = 'gzip'
+    return body, headers
+
+
+def decode_body(body, headers):
+    """
+    Decompress the body of a request compressed by :py:func:`encode_body`
+
+    :param body: The body
+    :type body: :py:class:`bytes`
+    :param headers: The headers of the request
+    :type headers: :py:class:`dict`
+    :rtype: :py:class:`bytes`
+    """
+    if body and get_header(headers, 'Content-Encoding') == 'gzip':
+        return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+    return body
+
+
+def body_size(body, headers):
+    """
+    Get the uncompressed size of the body of a request, without
+    decompressing it
+
+    :param body: The body
+    :type body: :py:class:`bytes`
+    :param headers: The headers of the request
+    :type headers: :py:class:`dict`
+    :rtype: :py:class:`int`
+    """
+    if not body:
+        return 0
+    if get_header(headers, 'Content-Encoding') == 'gzip':
+        # The gzip trailer ends with the uncompressed size modulo 2 ** 32
+        return struct.unpack(str('<I'), body[-4:])[0]
+    return len(body)
+
+
+def get_header(headers, name):
+    """
+    Get a header from a plain dict of headers, whatever its case
+
+    :param headers: The headers
+    :type headers: :py:class:`dict`
+    :param name: The name of the header
+    :type name: :py:class:`str`
+    :rtype: :py:class:`str`
+    """
+    for key, value in (headers or {}).items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+def build_response(method, url, status_code, headers, content, reason=None):
+    """
+    Build a :py:class:`requests.Response` from the parts of a response
+    received by another transport, so that errors are raised the same way
+    as with requests.
+
+    :param method: The HTTP method of the request
+    :type method: :py:class:`str`
+    :param url: The url of the request
+    :type url: :py:class:`str`
+    :param status_code: The status of the response
+    :type status_code: :py:class:`int`
+    :param headers: The headers of the response
+    :type headers: :py:class:`dict`
+    :param content: The body of the response
+    :type content: :py:class:`bytes`
+    :param reason: The reason phrase of the status
+    :type reason: :py:class:`str`
+    :rtype: :py:class:`requests.Response`
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = content
+    response.url = url
+    response.reason = reason
+    response.request = requests.Request(method, url).prepare()
+    return response
+
+
+class RequestsTransport(object):
+    """
+    Transport sending the requests through a :py:class:`requests.Session`,
+    so that connections to the datacenter are kept alive and reused.
+    """
+    EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                  requests.exceptions.ChunkedEncodingError)
+
+    def __init__(self, session=None, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 keep_alive=True):
+        """
+        Initialize the transport
+
+        :param session: An existing session to send the requests with, the
+          transport will not close a session it did not create
+        :type session: :py:class:`requests.Session`
+        :param pool_connections: The number of host connection pools to cache
+        :type pool_connections: :py:class:`int`
+        :param pool_maxsize: The maximum number of connections to keep in
+          each pool
+        :type pool_maxsize: :py:class:`int`
+        :param keep_alive: Whether connections should be kept open between
+          requests, ignored when a session is given
+        :type keep_alive: :py:class:`bool`
+        """
+        super(RequestsTransport, self).__init__()
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            if not keep_alive:
+                session.headers['Connection'] = 'close'
+        self.session = session
+
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request
+
+        :param method: The HTTP method
+        :type method: :py:class:`str`
+        :param url: The full url of the request
+        :type url: :py:class:`str`
+        :param kwargs: Extra arguments for :py:meth:`requests.Session.request`
+        :rtype: :py:class:`requests.Response`
+        """
+        return self.session.request(method, url, **kwargs)
+
+
+    def close(self):
+        """
+        Close the session if it was created by the transport
+        """
+        if self._owns_session:
+            self.session.close()
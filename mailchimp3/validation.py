@@ -0,0 +1,114 @@
+# coding=utf-8
+"""
+Validation of the values sent to the API
+
+The patterns are compiled once, so checking a value only costs the match
+itself. The URL pattern is large and rarely used, so it is only compiled by
+the first :py:func:`check_url`.
+"""
+import re
+import sys
+
+import six
+
+# Regex for email validation from http://emailregex.com/
+EMAIL_REGEX = re.compile(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)")
+# The same addresses, each followed by a newline, to check many of them with
+# a single match of the joined addresses
+EMAIL_LINES_REGEX = re.compile(r"(?:[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+\n)*\Z")
+SUBSCRIBER_HASH_REGEX = re.compile(r"^[0-9a-f]{32}$")
+# Original regex author Diego Perini (http://www.iport.it)
+# regex ported to Python by adamrofer (https://github.com/adamrofer)
+# Used under MIT license.
+URL_PATTERN = (
+    u"^"
+    u"(?:(?:https?|ftp)://)"
+    u"(?:\\S+(?::\\S*)?@)?"
+    u"(?:"
+    u"(?!(?:10|127)(?:\\.\\d{1,3}){3})"
+    u"(?!(?:169\\.254|192\\.168)(?:\\.\\d{1,3}){2})"
+    u"(?!172\\.(?:1[6-9]|2\\d|3[0-1])(?:\\.\\d{1,3}){2})"
+    u"(?:[1-9]\\d?|1\\d\\d|2[01]\\d|22[0-3])"
+    u"(?:\\.(?:1?\\d{1,2}|2[0-4]\\d|25[0-5])){2}"
+    u"(?:\\.(?:[1-9]\\d?|1\\d\\d|2[0-4]\\d|25[0-4]))"
+    u"|"
+    u"(?:(?:[a-z\u00a1-\uffff0-9]-?)*[a-z\u00a1-\uffff0-9]+)"
+    u"(?:\\.(?:[a-z\u00a1-\uffff0-9]-?)*[a-z\u00a1-\uffff0-9]+)*"
+    u"(?:\\.(?:[a-z\u00a1-\uffff]{2,}))"
+    u")"
+    u"(?::\\d{2,5})?"
+    u"(?:/\\S*)?"
+    u"$"
+)
+_url_regex = None
+MEMBER_STATUSES = frozenset(['subscribed', 'unsubscribed', 'cleaned', 'pending'])
+
+
+def check_email(email):
+    """
+    Function that verifies that the string passed is a valid email address.
+
+    :param email: The potential email address
+    :type email: :py:class:`str`
+    :return: Nothing
+    """
+    if not EMAIL_REGEX.match(email):
+        raise ValueError('String passed is not a valid email address')
+    return
+
+
+def check_url(url):
+    """
+    Function that verifies that the string passed is a valid url.
+
+    :param url: The potential url
+    :type url: :py:class:`str`
+    :return: Nothing
+    """
+    global _url_regex
+    if _url_regex is None:
+        _url_regex = re.compile(URL_PATTERN, re.UNICODE)
+    if not _url_regex.match(url):
+        raise ValueError('String passed is not a valid url')
+    return
+
+
+def validate_member(member):
+    """
+    Check a member of a batch subscribe or unsubscribe, which needs a valid
+    email_address and either a status or a status_if_new.
+
+    :param member: The request body parameters of the member
+    :type member: :py:class:`dict`
+    :return: Nothing
+    """
+    try:
+        test = member['email_address']
+    except KeyError as error:
+        new_msg = 'Each list member must have an email_address, {}'.format(error)
+        six.reraise(KeyError, KeyError(new_msg), sys.exc_info()[2])
+    check_email(member['email_address'])
+    if 'status' not in member and 'status_if_new' not in member:
+        raise KeyError('Each list member must have either a status or a status_if_new')
+    if 'status' in member and member['status'] not in MEMBER_STATUSES:
+        raise ValueError('The list member status must be one of "subscribed", "unsubscribed", "cleaned", or '
+                         '"pending"')
+    if 'status_if_new' in member and member['status_if_new'] not in MEMBER_STATUSES:
+        raise ValueError('The list member status_if_new must be one of "subscribed", "unsubscribed", '
+                         '"cleaned", or "pending"')
+
+
+def validate_members(members):
+    """
+    Check every member of a batch subscribe or unsubscribe, see
+    :py:func:`validate_member`.
+
+    :param members: The request body parameters of the members
+    :type members: :py:class:`collections.Iterable`
+    :returns: The members, as a list
+    :rtype: :py:class:`list`
+    """
+    members = list(members)
+    for member in members:
+        validate_member(member)
+    return members
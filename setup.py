@@ -36,7 +36,8 @@ setup(
         'Programming Language :: Python :: 3.4',
     ],
     keywords='mailchimp api v3 client wrapper',
-    packages=find_packages(),
-    install_requires=['requests', 'six'],
-    # test_suite='tests',
+    packages=find_packages(exclude=['tests']),
+    install_requires=['requests', 'six', 'futures; python_version < "3.2"'],
+    extras_require={'async': ['aiohttp']},
+    test_suite='tests',
 )
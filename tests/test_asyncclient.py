@@ -0,0 +1,125 @@
+# coding=utf-8
+"""
+Tests of the asynchronous client, against the fake API
+"""
+from __future__ import unicode_literals
+
+import sys
+import unittest
+
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'AsyncMailChimp requires Python 3.6+')
+class AsyncMailChimpTest(unittest.TestCase):
+    def setUp(self):
+        from mailchimp3.asyncclient import AsyncMailChimp
+
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.client = AsyncMailChimp('user', 'key-us1', transport=AsyncFakeTransport(self.server))
+
+
+    def run_async(self, awaitable):
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
+
+
+    def test_single_request(self):
+        self.assertEqual(self.run_async(self.client.lists.get(self.list_id))['id'], self.list_id)
+
+
+    def test_get_all(self):
+        self.server.add_members(self.list_id, 350)
+        members = self.client.lists.members
+        for result in (members.all(self.list_id, get_all=True), members.all(self.list_id, True),
+                       members.all(self.list_id, True, max_workers=3)):
+            result = self.run_async(result)
+            self.assertEqual(result['total_items'], 350)
+            self.assertEqual(len(set(member['id'] for member in result['members'])), 350)
+        self.assertEqual(len(self.run_async(self.client.lists.all(True))['lists']), 1)
+
+
+    def test_iter_all(self):
+        self.server.add_members(self.list_id, 250)
+
+        async def collect():
+            return [member['id'] async for member in self.client.lists.members.iter_all(self.list_id)]
+        self.assertEqual(len(set(self.run_async(collect()))), 250)
+
+
+    def test_iter_all_resumes_from_a_checkpoint(self):
+        from mailchimp3 import MailChimp
+        from mailchimp3.checkpoint import MemoryCheckpointStore
+
+        self.server.add_members(self.list_id, 350)
+        store = MemoryCheckpointStore()
+        client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server))
+        records = []
+        for member in client.lists.members.iter_all(self.list_id, checkpoint=store):
+            records.append(member['id'])
+            if len(records) == 150:
+                break
+        # The first page was consumed, the second one was not
+        self.assertEqual(list(store._checkpoints.values())[0]['offset'], 100)
+
+        async def collect():
+            async for member in self.client.lists.members.iter_all(self.list_id, checkpoint=store, max_workers=2):
+                records.append(member['id'])
+        self.run_async(collect())
+        self.assertEqual(len(set(records)), 350)
+        self.assertEqual(len(records), 400)
+        self.assertEqual(store._checkpoints, {})
+
+
+    def test_methods_sending_several_requests_are_refused(self):
+        for endpoint, name in ((self.client.batches, 'wait'), (self.client.batches, 'results'),
+                               (self.client.lists.members, 'bulk_create_or_update'),
+                               (self.client.lists.members, 'iter_bulk_create_or_update'),
+                               (self.client.lists, 'bulk_update_members')):
+            with self.assertRaises(TypeError):
+                getattr(endpoint, name)
+
+
+    def test_requests_from_other_threads_are_refused(self):
+        from mailchimp3.helpers import map_concurrently
+
+        planner = self.client._planner
+        def fetch_in_threads():
+            return list(map_concurrently(lambda offset: planner._get('lists', offset=offset), [0, 100], 2))
+        with self.assertRaises(TypeError):
+            planner.record(fetch_in_threads)
+
+
+class AsyncFakeTransport(object):
+    """
+    An asynchronous view of a fake transport
+    """
+    def __init__(self, server):
+        self._transport = FakeTransport(server)
+        self.EXCEPTIONS = self._transport.EXCEPTIONS
+
+
+    def request(self, method, url, headers=None, data=None, timeout=None):
+        import asyncio
+
+        future = asyncio.Future()
+        future.set_result(self._transport.request(method, url, headers=headers, data=data, timeout=timeout))
+        return future
+
+
+    def close(self):
+        import asyncio
+
+        future = asyncio.Future()
+        future.set_result(None)
+        return future
+
+
+if __name__ == '__main__':
+    unittest.main()
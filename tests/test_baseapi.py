@@ -0,0 +1,56 @@
+# coding=utf-8
+"""
+Tests of the paginated reads of the endpoints, against the fake API
+"""
+from __future__ import unicode_literals
+
+import types
+import unittest
+
+from mailchimp3 import MailChimp
+from mailchimp3.checkpoint import MemoryCheckpointStore
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+
+class GetAllTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.server.add_members(self.list_id, 250)
+        self.transport = FakeTransport(self.server)
+        self.client = MailChimp('user', 'key-us1', transport=self.transport)
+
+
+    def test_concurrent_pages_keep_their_order(self):
+        self.server.add_members(self.list_id, 800)
+        expected = [member['id'] for member in self.client.lists.members.all(self.list_id, get_all=True)['members']]
+        self.assertEqual(len(expected), 1050)
+        # Random latencies make the pages complete out of order
+        self.client.transport = FakeTransport(self.server, latency=0.001, jitter=0.02, seed=1)
+        result = self.client.lists.members.all(self.list_id, get_all=True, max_workers=5)
+        self.assertEqual([member['id'] for member in result['members']], expected)
+        self.assertEqual(result['total_items'], 1050)
+        members = self.client.lists.members.iter_all(self.list_id, max_workers=5)
+        self.assertEqual([member['id'] for member in members], expected)
+
+
+    def test_stream(self):
+        members = self.client.lists.members.all(self.list_id, get_all=True, stream=True)
+        self.assertIsInstance(members, types.GeneratorType)
+        self.assertEqual(self.transport.requests, 0)
+        self.assertEqual(len(set(member['id'] for member in members)), 250)
+        self.assertEqual(self.transport.requests, 3)
+
+
+    def test_get_all_arguments_need_get_all(self):
+        for arguments in ({'stream': True}, {'max_workers': 2}, {'checkpoint': MemoryCheckpointStore()},
+                          {'attributes': ['id']}, {'links': True}):
+            with self.assertRaises(ValueError):
+                self.client.lists.members.all(self.list_id, **arguments)
+            with self.assertRaises(ValueError):
+                self.client.lists.all(get_all=False, **arguments)
+        self.assertEqual(self.transport.requests, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
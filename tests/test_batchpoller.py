@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+Tests of the waiting for batch operations
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+from concurrent.futures import TimeoutError
+
+from mailchimp3 import MailChimp
+from mailchimp3.batchpoller import BatchPoller
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+
+class BatchPollerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeMailChimpServer(batch_duration=0.3)
+        self.list_id = self.server.add_list()
+        self.client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server))
+
+
+    def create_batch(self):
+        return self.client.batches.create(data={'operations': [
+            {'method': 'GET', 'path': 'lists/{}'.format(self.list_id), 'operation_id': 'list'},
+        ]})['id']
+
+
+    def test_result(self):
+        poller = BatchPoller(self.client.batches, min_interval=0.05, max_rate=None)
+        futures = [poller.add(self.create_batch()) for _ in range(2)]
+        self.assertEqual(poller.result(futures[1])['status'], 'finished')
+        self.assertTrue(poller.wait(timeout=5))
+        self.assertEqual(futures[0].result()['status'], 'finished')
+
+
+    def test_result_times_out(self):
+        poller = BatchPoller(self.client.batches, min_interval=0.05, max_rate=None)
+        future = poller.add(self.create_batch())
+        with self.assertRaises(TimeoutError):
+            poller.result(future, timeout=0.1)
+        self.assertEqual(poller.result(future)['status'], 'finished')
+
+
+    def test_wait_times_out(self):
+        batch_id = self.create_batch()
+        with self.assertRaises(TimeoutError):
+            self.client.batches.wait(batch_id, interval=0.05, timeout=0.1)
+        self.assertEqual(self.client.batches.wait(batch_id, interval=0.05)['status'], 'finished')
+
+
+    def test_bulk_create_or_update(self):
+        members = [{'email_address': 'member{}@example.com'.format(i), 'status_if_new': 'subscribed'}
+                   for i in range(5)]
+        batches = list(self.client.lists.members.bulk_create_or_update(self.list_id, members, chunk_size=2,
+                                                                       max_pending=2, poll_interval=0.05))
+        self.assertEqual([batch['total_operations'] for batch in batches], [2, 2, 1])
+        self.assertTrue(all(batch['status'] == 'finished' for batch in batches))
+        with self.assertRaises(TimeoutError):
+            list(self.client.lists.members.bulk_create_or_update(self.list_id, members, poll_interval=0.05,
+                                                                 timeout=0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# coding=utf-8
+"""
+Tests of the reader of batch results archives
+"""
+from __future__ import unicode_literals
+
+import io
+import json
+import tarfile
+import unittest
+
+from mailchimp3.batchresults import iter_batch_results
+from mailchimp3.codec import StdlibCodec
+
+
+def make_archive(files):
+    """
+    Build a gzipped tar archive holding a JSON file of results per list
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        directory = tarfile.TarInfo('results')
+        directory.type = tarfile.DIRTYPE
+        archive.addfile(directory)
+        for i, results in enumerate(files):
+            content = json.dumps(results).encode('utf-8')
+            info = tarfile.TarInfo('results/{}.json'.format(i))
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    buffer.seek(0)
+    return buffer
+
+
+class IterBatchResultsTest(unittest.TestCase):
+    def test_results_of_every_file(self):
+        archive = make_archive([
+            [{'operation_id': 'a', 'status_code': 200, 'response': json.dumps({'id': 'a'})}],
+            [{'operation_id': 'b', 'status_code': 400, 'response': json.dumps({'title': 'Invalid Resource'})},
+             {'operation_id': 'c', 'status_code': 204, 'response': ''}],
+        ])
+        self.assertEqual(list(iter_batch_results(archive)), [
+            ('a', 200, {'id': 'a'}),
+            ('b', 400, {'title': 'Invalid Resource'}),
+            ('c', 204, None),
+        ])
+
+
+    def test_other_files_are_skipped(self):
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+            info = tarfile.TarInfo('README.txt')
+            info.size = 5
+            archive.addfile(info, io.BytesIO(b'hello'))
+        buffer.seek(0)
+        self.assertEqual(list(iter_batch_results(buffer)), [])
+
+
+    def test_codec(self):
+        archive = make_archive([[{'operation_id': 'a', 'status_code': 200, 'response': '{"id": "é"}'}]])
+        self.assertEqual(list(iter_batch_results(archive, StdlibCodec())), [('a', 200, {'id': 'é'})])
+
+
+    def test_archive_of_the_fake_server(self):
+        from mailchimp3 import MailChimp
+        from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+        server = FakeMailChimpServer()
+        list_id = server.add_list()
+        client = MailChimp('user', 'key-us1', transport=FakeTransport(server))
+        members = [{'email_address': 'member{}@example.com'.format(i), 'status_if_new': 'subscribed'}
+                   for i in range(3)]
+        results = list(client.lists.members.bulk_create_or_update(list_id, members, operation_results=True,
+                                                                  poll_interval=0))
+        self.assertEqual([status for _, status, _ in results], [200, 200, 200])
+        self.assertEqual(sorted(response['email_address'] for _, _, response in results),
+                         sorted(member['email_address'] for member in members))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+Tests of the response cache
+"""
+from __future__ import unicode_literals
+
+import time
+import unittest
+
+from mailchimp3 import MailChimp
+from mailchimp3.cache import ResponseCache
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+RENAMED_LIST = {
+    'name': 'Renamed',
+    'contact': {'company': 'Company', 'address1': '1 Street', 'city': 'City', 'state': 'State', 'zip': '00000',
+                'country': 'US'},
+    'permission_reminder': 'You signed up on our website.',
+    'campaign_defaults': {'from_name': 'Company', 'from_email': 'news@example.com', 'subject': 'News',
+                          'language': 'en'},
+    'email_type_option': False,
+}
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.transport = FakeTransport(self.server)
+        self.cache = ResponseCache(ttl=60, ttls={'lists/*/members*': 0})
+        self.client = MailChimp('user', 'key-us1', transport=self.transport, cache=self.cache)
+
+
+    def test_reads_are_cached(self):
+        self.client.lists.get(self.list_id)
+        self.client.lists.get(self.list_id)
+        self.assertEqual(self.transport.requests, 1)
+
+
+    def test_ttl_of_zero_disables_caching(self):
+        self.client.lists.members.all(self.list_id)
+        self.client.lists.members.all(self.list_id)
+        self.assertEqual(self.transport.requests, 2)
+
+
+    def test_write_invalidates_the_path_and_its_parents(self):
+        self.client.lists.all()
+        self.client.lists.get(self.list_id)
+        self.client.lists.update(self.list_id, RENAMED_LIST)
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.client.lists.get(self.list_id)['name'], 'Renamed')
+        self.assertEqual(self.client.lists.all()['lists'][0]['name'], 'Renamed')
+        self.assertEqual(self.transport.requests, 5)
+
+
+    def test_write_keeps_unrelated_paths(self):
+        other = self.server.add_list(name='Other')
+        self.client.lists.get(other)
+        self.client.lists.update(self.list_id, RENAMED_LIST)
+        self.client.lists.get(other)
+        self.assertEqual(self.transport.requests, 2)
+
+
+    def test_stale_responses_are_fetched_again(self):
+        cache = ResponseCache(ttl=0.01)
+        client = MailChimp('user', 'key-us1', transport=self.transport, cache=cache)
+        client.lists.get(self.list_id)
+        time.sleep(0.02)
+        client.lists.get(self.list_id)
+        self.assertEqual(self.transport.requests, 2)
+
+
+    def test_accounts_sharing_a_cache(self):
+        other = MailChimp('other', 'other-key-us1', transport=self.transport, cache=self.cache)
+        self.client.lists.get(self.list_id)
+        other.lists.get(self.list_id)
+        self.assertEqual(self.transport.requests, 2)
+        other.lists.update(self.list_id, RENAMED_LIST)
+        self.client.lists.get(self.list_id)
+        self.assertEqual(self.transport.requests, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# coding=utf-8
+"""
+Tests of the resumption of paginated reads from a checkpoint
+"""
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+
+from mailchimp3 import MailChimp
+from mailchimp3.checkpoint import FileCheckpointStore, MemoryCheckpointStore, checkpoint_key
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.retry import RetryPolicy
+
+
+class FailingTransport(FakeTransport):
+    """
+    A fake transport failing every request past a number of them
+    """
+    def __init__(self, server, fail_after):
+        super(FailingTransport, self).__init__(server)
+        self.fail_after = fail_after
+
+
+    def request(self, method, url, **kwargs):
+        if self.fail_after is not None and self.requests >= self.fail_after:
+            self.requests += 1
+            raise requests.exceptions.ConnectionError('Injected connection error')
+        return super(FailingTransport, self).request(method, url, **kwargs)
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.server.add_members(self.list_id, 350)
+        self.transport = FailingTransport(self.server, fail_after=2)
+        self.client = MailChimp('user', 'key-us1', transport=self.transport, retry=RetryPolicy(max_retries=0))
+
+
+    def consume(self, store, records):
+        try:
+            for member in self.client.lists.members.iter_all(self.list_id, checkpoint=store):
+                records.append(member['id'])
+        except requests.exceptions.ConnectionError:
+            return False
+        return True
+
+
+    def test_resume_after_a_failure(self):
+        store = MemoryCheckpointStore()
+        records = []
+        self.assertFalse(self.consume(store, records))
+        self.assertEqual(len(records), 200)
+        self.transport.fail_after = None
+        self.assertTrue(self.consume(store, records))
+        self.assertEqual(len(records), 350)
+        self.assertEqual(len(set(records)), 350)
+        self.assertEqual(store._checkpoints, {})
+
+
+    def test_resume_from_a_file(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'members.checkpoint')
+        records = []
+        self.assertFalse(self.consume(FileCheckpointStore(path), records))
+        self.transport.fail_after = None
+        self.assertTrue(self.consume(FileCheckpointStore(path), records))
+        self.assertEqual(len(set(records)), 350)
+
+
+    def test_different_queries_have_different_checkpoints(self):
+        url = 'lists/{}/members'.format(self.list_id)
+        self.assertNotEqual(checkpoint_key(url, {'status': 'subscribed'}), checkpoint_key(url, {}))
+        self.assertEqual(checkpoint_key(url, {'a': 1, 'b': 2}), checkpoint_key(url, {'b': 2, 'a': 1}))
+
+
+    def test_merged_reads_refuse_checkpoints(self):
+        with self.assertRaises(ValueError):
+            self.client.lists.members.all(self.list_id, get_all=True, checkpoint=MemoryCheckpointStore())
+        self.assertEqual(self.transport.requests, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+# coding=utf-8
+"""
+Tests of the helper functions
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+from mailchimp3.helpers import LRUCache, get_subscriber_hash, get_subscriber_hashes
+
+
+class SubscriberHashesTest(unittest.TestCase):
+    def test_same_hashes_as_one_at_a_time(self):
+        emails = ['John.Doe+{}@Example.com'.format(i) for i in range(250)]
+        expected = [get_subscriber_hash(email) for email in emails]
+        self.assertEqual(list(get_subscriber_hashes(iter(emails), chunksize=100)), expected)
+        self.assertEqual(list(get_subscriber_hashes(emails, cache=LRUCache(10))), expected)
+        self.assertEqual(list(get_subscriber_hashes([])), [])
+
+
+    def test_invalid_emails(self):
+        for emails in (['john@example.com', 'invalid'], ['john@example.com', 'jane\n@example.com'], ['']):
+            with self.assertRaises(ValueError):
+                list(get_subscriber_hashes(emails))
+        # Accepted by get_subscriber_hash, whose pattern ends with $
+        self.assertEqual(list(get_subscriber_hashes(['john@example.com\n'])),
+                         [get_subscriber_hash('john@example.com\n')])
+
+
+if __name__ == '__main__':
+    unittest.main()
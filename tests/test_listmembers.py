@@ -0,0 +1,43 @@
+# coding=utf-8
+"""
+Tests of the bulk upserts of list members, against the fake API
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+
+class BulkCreateOrUpdateTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server))
+        self.members = [{'email_address': 'member{}@example.com'.format(i), 'status_if_new': 'subscribed'}
+                        for i in range(5)]
+
+
+    def count_members(self):
+        return len(self.server.records('lists/{}/members'.format(self.list_id)))
+
+
+    def test_members_are_written_on_call(self):
+        self.client.lists.members.bulk_create_or_update(self.list_id, iter(self.members), chunk_size=2,
+                                                        poll_interval=0)
+        self.assertEqual(self.count_members(), 5)
+
+
+    def test_iter_sends_nothing_until_consumed(self):
+        batches = self.client.lists.members.iter_bulk_create_or_update(self.list_id, self.members, chunk_size=2,
+                                                                       poll_interval=0)
+        self.assertEqual(self.count_members(), 0)
+        self.assertEqual(next(batches)['total_operations'], 2)
+        self.assertEqual(self.count_members(), 2)
+        self.assertEqual([batch['total_operations'] for batch in batches], [2, 1])
+        self.assertEqual(self.count_members(), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# coding=utf-8
+"""
+Tests of the bulk updates of list members, against the fake API
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+import requests
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+
+
+class FailingTransport(FakeTransport):
+    """
+    A fake transport failing every request past a number of them
+    """
+    def __init__(self, server, fail_after=None):
+        super(FailingTransport, self).__init__(server)
+        self.fail_after = fail_after
+
+
+    def request(self, method, url, **kwargs):
+        if self.fail_after is not None and self.requests >= self.fail_after:
+            self.requests += 1
+            raise requests.exceptions.ConnectionError('Injected connection error')
+        return super(FailingTransport, self).request(method, url, **kwargs)
+
+
+def make_members(count, invalid=None):
+    return [{'email_address': 'invalid' if i == invalid else 'member{}@example.com'.format(i),
+             'status': 'subscribed'} for i in range(count)]
+
+
+class BulkUpdateMembersTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.transport = FailingTransport(self.server)
+        self.client = MailChimp('user', 'key-us1', transport=self.transport)
+
+
+    def test_summary_of_the_chunks(self):
+        summary = self.client.lists.bulk_update_members(self.list_id, iter(make_members(1200)), max_workers=3)
+        self.assertEqual(self.transport.requests, 3)
+        self.assertEqual(summary['total_created'], 1200)
+        self.assertEqual(len(summary['new_members']), 1200)
+        self.assertEqual(summary['error_count'], 0)
+        self.assertEqual(len(self.server.records('lists/{}/members'.format(self.list_id))), 1200)
+        summary = self.client.lists.bulk_update_members(self.list_id, make_members(700), update_existing=True)
+        self.assertEqual((summary['total_created'], summary['total_updated']), (0, 700))
+
+
+    def test_nothing_is_sent_after_an_invalid_member(self):
+        with self.assertRaises(ValueError) as context:
+            self.client.lists.bulk_update_members(self.list_id, make_members(2000, invalid=1100), max_workers=1)
+        self.assertEqual(self.transport.requests, 2)
+        self.assertEqual(context.exception.summary['total_created'], 1000)
+
+
+    def test_summary_of_the_chunks_applied_before_a_failure(self):
+        self.transport.fail_after = 1
+        with self.assertRaises(requests.exceptions.ConnectionError) as context:
+            self.client.lists.bulk_update_members(self.list_id, make_members(2000), max_workers=1)
+        self.assertEqual(self.transport.requests, 2)
+        self.assertEqual(context.exception.summary['total_created'], 500)
+        self.assertEqual(len(self.server.records('lists/{}/members'.format(self.list_id))), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# coding=utf-8
+"""
+Tests of the instrumentation hooks and metrics, against the fake API
+"""
+from __future__ import unicode_literals
+
+import json
+import unittest
+
+import requests
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.metrics import MetricsCollector, format_json, format_prometheus
+from mailchimp3.ratelimit import RateLimiter
+from mailchimp3.retry import RetryPolicy
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.limiter = RateLimiter(max_concurrent=1)
+        self.client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server), limiter=self.limiter,
+                                retry=RetryPolicy(max_retries=0))
+
+
+    def test_events(self):
+        events = []
+        self.client.add_hook('request', events.append)
+        self.client.add_hook('response', events.append)
+        self.client.lists.members.create(self.list_id, {'email_address': 'john@example.com', 'status': 'subscribed'})
+        request, response = events
+        self.assertEqual((request.method, request.path, request.attempt), ('POST', 'lists/{list_id}/members', 1))
+        self.assertEqual((response.path, response.status_code, response.error), (request.path, 200, None))
+        self.assertGreater(response.request_bytes, 0)
+        self.assertGreater(response.response_bytes, 0)
+        self.assertGreaterEqual(response.elapsed, 0)
+
+
+    def test_hooks_are_called_outside_the_limiter(self):
+        active = []
+        self.client.add_hook('response', lambda event: active.append(self.limiter._active))
+        self.client.lists.get(self.list_id)
+        self.assertEqual(active, [0])
+
+
+    def test_errors_are_reported_and_raised(self):
+        events = []
+        self.client.add_hook('response', events.append)
+        self.client.transport = FakeTransport(self.server, error_rate=1.0, error_status=None)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.client.lists.get(self.list_id)
+        self.assertEqual(events[0].status_code, None)
+        self.assertIsInstance(events[0].error, requests.exceptions.ConnectionError)
+
+
+    def test_metrics(self):
+        metrics = MetricsCollector()
+        metrics.attach(self.client)
+        for _ in range(3):
+            self.client.lists.get(self.list_id)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.lists.get('missing')
+        metrics.detach(self.client)
+        self.client.lists.get(self.list_id)
+        endpoint, = metrics.snapshot()['endpoints']
+        self.assertEqual((endpoint['method'], endpoint['path']), ('GET', 'lists/{list_id}'))
+        self.assertEqual((endpoint['attempts'], endpoint['errors']), (4, 1))
+        self.assertEqual(endpoint['statuses'], {'200': 3, '404': 1})
+        self.assertEqual(sum(endpoint['latency_buckets']), 4)
+        self.assertEqual(json.loads(format_json(metrics.snapshot()))['endpoints'][0]['attempts'], 4)
+        self.assertIn('lists/{list_id}', format_prometheus(metrics.snapshot()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# coding=utf-8
+"""
+Tests of the local mirror of list members, against the fake API
+"""
+from __future__ import unicode_literals
+
+import time
+import unittest
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.mirror import SYNC_OVERLAP, ListMemberMirror
+
+LONG_AGO = '2020-01-01T00:00:00+00:00'
+
+
+class ListMemberMirrorTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.hashes = self.server.add_members(self.list_id, 250)
+        for member in self.server.records('lists/{}/members'.format(self.list_id)):
+            member['last_changed'] = LONG_AGO
+        self.client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server))
+        self.mirror = ListMemberMirror(self.client, self.list_id)
+        self.addCleanup(self.mirror.close)
+
+
+    def test_first_sync_loads_every_member(self):
+        self.assertIsNone(self.mirror.checkpoint)
+        self.assertEqual(self.mirror.sync(max_workers=2), 250)
+        self.assertEqual(len(self.mirror), 250)
+        self.assertEqual(self.mirror.get(self.hashes[0])['id'], self.hashes[0])
+        self.assertEqual(self.mirror.count('subscribed'), 250)
+        # The checkpoint is moved back to cover the clock skew
+        latest = time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(time.time() - SYNC_OVERLAP + 60))
+        self.assertLess(self.mirror.checkpoint, latest)
+
+
+    def test_incremental_and_full_sync(self):
+        self.mirror.sync()
+        members = self.client.lists.members
+        members.update(self.list_id, self.hashes[0], {'status': 'unsubscribed'})
+        members.create(self.list_id, {'email_address': 'new@example.com', 'status': 'pending'})
+        members.delete(self.list_id, self.hashes[1])
+        # Only the changed members are fetched, and deleted ones are kept
+        self.assertEqual(self.mirror.sync(), 2)
+        self.assertEqual(len(self.mirror), 251)
+        self.assertEqual(self.mirror.get(self.hashes[0])['status'], 'unsubscribed')
+        self.assertEqual(self.mirror.get('new@example.com')['status'], 'pending')
+        self.assertIsNotNone(self.mirror.get(self.hashes[1]))
+        # A full sync reloads every member and removes the deleted ones
+        self.assertEqual(self.mirror.sync(full=True), 250)
+        self.assertEqual(len(self.mirror), 250)
+        self.assertIsNone(self.mirror.get(self.hashes[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
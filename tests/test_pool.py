@@ -0,0 +1,60 @@
+# coding=utf-8
+"""
+Tests of the pool of clients of several accounts, against the fake API
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.pool import ClientPool
+
+
+class ClientPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.pool = ClientPool(maxsize=2, max_concurrent=3, transport=FakeTransport(self.server))
+        self.addCleanup(self.pool.close)
+
+
+    def test_one_client_and_limiter_per_account(self):
+        alice = self.pool.client('alice', 'key-us1')
+        bob = self.pool.client('bob', 'key-us2')
+        self.assertIs(self.pool.client('alice', 'key-us1'), alice)
+        self.assertIsNot(alice.limiter, bob.limiter)
+        self.assertEqual(alice.limiter.max_concurrent, 3)
+        self.assertEqual(alice.lists.get(self.list_id)['id'], self.list_id)
+
+
+    def test_least_recently_used_clients_are_evicted(self):
+        alice = self.pool.client('alice', 'key-us1')
+        self.pool.client('bob', 'key-us1')
+        self.pool.client('alice', 'key-us1')
+        carol = self.pool.client('carol', 'key-us1')
+        # bob was the least recently used
+        self.assertEqual(len(self.pool), 2)
+        self.assertIs(self.pool.client('alice', 'key-us1'), alice)
+        self.assertIs(self.pool.client('carol', 'key-us1'), carol)
+        bob = self.pool.client('bob', 'key-us1')
+        self.assertIsNot(self.pool.client('alice', 'key-us1'), alice)
+        # A client still in use after its eviction shares its limiter with
+        # the new client of the account
+        self.assertIs(self.pool.client('alice', 'key-us1').limiter, alice.limiter)
+        self.assertIsNot(bob.limiter, alice.limiter)
+
+
+    def test_map(self):
+        accounts = [('user{}'.format(i), 'key-us1') for i in range(5)]
+        results = list(self.pool.map(lambda client: client.auth.username, accounts, max_workers=3))
+        self.assertEqual(results, [mc_user for mc_user, _ in accounts])
+
+
+    def test_arguments_that_cannot_be_shared(self):
+        for name in ('cache', 'limiter', 'session'):
+            with self.assertRaises(TypeError):
+                ClientPool(**{name: None})
+
+
+if __name__ == '__main__':
+    unittest.main()
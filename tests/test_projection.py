@@ -0,0 +1,60 @@
+# coding=utf-8
+"""
+Tests of the field projection of the get_all reads
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.projection import merge_projection, projection
+
+
+class ProjectionTest(unittest.TestCase):
+    def test_projection(self):
+        self.assertEqual(projection('lists/123456/members', ['email_address', 'merge_fields.FNAME']),
+                         {'fields': 'members.email_address,members.merge_fields.FNAME'})
+        self.assertEqual(projection('lists/123456/members', ['email_address'], links=True),
+                         {'fields': 'members.email_address,_links,members._links'})
+        self.assertEqual(projection('campaign-folders'), {'exclude_fields': '_links,folders._links'})
+        self.assertEqual(projection('lists', exclude=['stats']), {'exclude_fields': 'lists.stats,_links,lists._links'})
+        self.assertEqual(projection('lists', links=True), {})
+
+
+    def test_merge_projection(self):
+        self.assertEqual(merge_projection({'fields': 'members.id', 'status': 'subscribed'},
+                                          {'fields': 'members.id,members.status'}),
+                         {'fields': 'members.id,members.status', 'status': 'subscribed'})
+
+
+class GetAllProjectionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.server.add_members(self.list_id, 150)
+        self.client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server))
+
+
+    def test_links_are_excluded_by_default(self):
+        result = self.client.lists.members.all(self.list_id, get_all=True)
+        self.assertNotIn('_links', result)
+        self.assertTrue(all('_links' not in member for member in result['members']))
+        self.assertIn('email_address', result['members'][0])
+        result = self.client.lists.members.all(self.list_id, get_all=True, links=True)
+        self.assertTrue(all('_links' in member for member in result['members']))
+        # A single page read is left as it is
+        self.assertIn('_links', self.client.lists.members.all(self.list_id)['members'][0])
+
+
+    def test_attributes(self):
+        result = self.client.lists.members.all(self.list_id, get_all=True, attributes=['email_address', 'status'])
+        self.assertEqual(result['total_items'], 150)
+        self.assertEqual(len(result['members']), 150)
+        self.assertEqual(set(result['members'][0]), set(['email_address', 'status']))
+        members = list(self.client.lists.members.iter_all(self.list_id, attributes=['id'], links=True))
+        self.assertEqual(set(members[0]), set(['id', '_links']))
+
+
+if __name__ == '__main__':
+    unittest.main()
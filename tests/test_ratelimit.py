@@ -0,0 +1,47 @@
+# coding=utf-8
+"""
+Tests of the throttling of requests answered with a 429, against the fake API
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+import requests
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.ratelimit import RateLimiter
+from mailchimp3.retry import RetryPolicy
+
+
+def make_client(transport, **kwargs):
+    return MailChimp('user', 'key-us1', transport=transport,
+                     retry=RetryPolicy(max_retries=3, backoff_factor=0.001, jitter=False), **kwargs)
+
+
+class RateLimitTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+
+
+    def test_throttled_requests_are_sent_again(self):
+        transport = FakeTransport(self.server, rate=20, retry_after=0.2)
+        client = make_client(transport, limiter=RateLimiter(max_retries=10))
+        for _ in range(30):
+            self.assertEqual(client.lists.get(self.list_id)['id'], self.list_id)
+        self.assertGreater(transport.throttled, 0)
+        self.assertEqual(transport.requests, 30 + transport.throttled)
+
+
+    def test_throttled_response_once_retries_are_exhausted(self):
+        transport = FakeTransport(self.server, max_concurrent=0, retry_after=0.01)
+        client = make_client(transport, limiter=RateLimiter(max_retries=2))
+        with self.assertRaises(requests.exceptions.HTTPError) as context:
+            client.lists.get(self.list_id)
+        self.assertEqual(context.exception.response.status_code, 429)
+        self.assertEqual(transport.throttled, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
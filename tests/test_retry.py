@@ -0,0 +1,62 @@
+# coding=utf-8
+"""
+Tests of the retries of failed requests, against the fake API
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+import requests
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.retry import RetryPolicy
+
+
+def make_client(transport, **kwargs):
+    kwargs.setdefault('retry', RetryPolicy(max_retries=3, backoff_factor=0.001, jitter=False))
+    return MailChimp('user', 'key-us1', transport=transport, **kwargs)
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+
+
+    def test_server_errors_are_retried(self):
+        transport = FakeTransport(self.server, error_rate=1.0, error_status=503)
+        client = make_client(transport)
+        with self.assertRaises(requests.exceptions.HTTPError) as context:
+            client.lists.get(self.list_id)
+        self.assertEqual(context.exception.response.status_code, 503)
+        self.assertEqual(transport.requests, 4)
+
+
+    def test_connection_errors_are_retried(self):
+        transport = FakeTransport(self.server, error_rate=1.0, error_status=None)
+        client = make_client(transport)
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            client.lists.get(self.list_id)
+        self.assertEqual(transport.requests, 4)
+
+
+    def test_recovers_from_transient_errors(self):
+        transport = FakeTransport(self.server, error_rate=0.3, error_status=503, seed=1)
+        client = make_client(transport, retry=RetryPolicy(max_retries=10, backoff_factor=0.001, jitter=False))
+        for _ in range(20):
+            self.assertEqual(client.lists.get(self.list_id)['id'], self.list_id)
+        self.assertGreater(transport.errors, 0)
+        self.assertEqual(transport.requests, 20 + transport.errors)
+
+
+    def test_post_is_not_retried_by_default(self):
+        transport = FakeTransport(self.server, error_rate=1.0, error_status=503)
+        client = make_client(transport)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            client.lists.update_members(self.list_id, {'members': []})
+        self.assertEqual(transport.requests, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# coding=utf-8
+"""
+Tests of one client shared by several threads, against the fake API
+"""
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.helpers import get_subscriber_hash
+
+THREADS = 8
+
+
+class ThreadLocalIdsTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_ids = [self.server.add_list('List {}'.format(i)) for i in range(THREADS)]
+        self.client = MailChimp('user', 'key-us1', transport=FakeTransport(self.server))
+
+
+    def test_ids_are_kept_per_thread(self):
+        condition = threading.Condition()
+        ready = []
+
+        def create(list_id):
+            members = self.client.lists.members
+            members.create(list_id, {'email_address': '{}@example.com'.format(list_id), 'status': 'subscribed'})
+            # Wait until every thread has set its ids before reading them
+            with condition:
+                ready.append(list_id)
+                condition.notify_all()
+                while len(ready) < THREADS:
+                    condition.wait()
+            return members.list_id, members.subscriber_hash
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(create, self.list_ids))
+        self.assertEqual(results, [(list_id, get_subscriber_hash('{}@example.com'.format(list_id)))
+                                   for list_id in self.list_ids])
+        # The ids set in the worker threads are not seen by this one
+        self.assertIsNone(self.client.lists.members.list_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
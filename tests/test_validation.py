@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+Tests of the validation of the values sent to the API
+"""
+from __future__ import unicode_literals
+
+import unittest
+
+from mailchimp3 import MailChimp
+from mailchimp3.fakeserver import FakeMailChimpServer, FakeTransport
+from mailchimp3.validation import check_email, check_url, validate_members
+
+
+class ValidationTest(unittest.TestCase):
+    def test_check_email(self):
+        check_email('john.doe+test@example.com')
+        for email in ('john.doe', 'john@example', '@example.com'):
+            with self.assertRaises(ValueError):
+                check_email(email)
+
+
+    def test_check_url(self):
+        check_url('https://example.com/path?query=1')
+        for url in ('example.com', 'http://localhost', 'http://10.0.0.1'):
+            with self.assertRaises(ValueError):
+                check_url(url)
+
+
+    def test_validate_members(self):
+        members = validate_members(iter([{'email_address': 'john@example.com', 'status_if_new': 'subscribed'}]))
+        self.assertEqual(len(members), 1)
+        for member in ({'status': 'subscribed'}, {'email_address': 'john@example.com'}):
+            with self.assertRaises(KeyError):
+                validate_members([member])
+        for member in ({'email_address': 'john', 'status': 'subscribed'},
+                       {'email_address': 'john@example.com', 'status': 'active'}):
+            with self.assertRaises(ValueError):
+                validate_members([member])
+
+
+class SkipValidationTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeMailChimpServer()
+        self.list_id = self.server.add_list()
+        self.transport = FakeTransport(self.server)
+        self.client = MailChimp('user', 'key-us1', transport=self.transport)
+        # Invalid on the client side, left to the API to reject
+        self.members = [{'email_address': 'john@example.com', 'status': 'active'}]
+
+
+    def test_validate(self):
+        with self.assertRaises(ValueError):
+            self.client.lists.update_members(self.list_id, {'members': self.members})
+        with self.assertRaises(ValueError):
+            self.client.lists.bulk_update_members(self.list_id, self.members)
+        self.assertEqual(self.transport.requests, 0)
+
+
+    def test_validate_false(self):
+        self.client.lists.update_members(self.list_id, {'members': self.members}, validate=False)
+        self.client.lists.bulk_update_members(self.list_id, self.members, validate=False)
+        self.assertEqual(self.transport.requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()